@@ -1,52 +1,193 @@
-from fastapi import APIRouter
+from typing import Annotated
 
+from fastapi import APIRouter, Body, Header, Query, Response
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
 from app.core.dependency import CompanyServiceDep, Language, TagServiceDep
-from app.schemas.company import CompanyResponse, CreateCompanyRequest, CreateTagRequest
-from app.schemas.tag import TagResponse
+from app.core.http_cache import cache_headers, etag_matches, not_modified
+from app.core.idempotency import idempotency_store, request_fingerprint
+from app.schemas.company import (
+    BatchCreateCompaniesRequest,
+    BatchCreateCompaniesResponse,
+    BatchGetCompaniesRequest,
+    BatchGetCompaniesResponse,
+    CompanyResponse,
+    CreateCompanyRequest,
+    CreateTagRequest,
+)
+from app.schemas.tag import TagResponse, TagWriteAckResponse
+from app.services.tag_write_queue import tag_write_queue
 
 router = APIRouter()
 
+# 태그 연결/해제의 비동기 쓰기 모드 응답 (Prefer: respond-async)
+_ACCEPTED_RESPONSES: dict[int | str, dict[str, object]] = {
+    202: {"model": TagWriteAckResponse, "description": "접수됨 (비동기 쓰기 모드)"}
+}
+
+
+def _respond_async(prefer: str | None) -> bool:
+    """비동기 태그 쓰기가 켜져 있고 요청이 Prefer: respond-async 인지 확인합니다."""
+    return (
+        settings.TAG_WRITE_QUEUE_ENABLED
+        and prefer is not None
+        and "respond-async" in prefer.lower()
+    )
+
+
+def _accepted(ack_id: str) -> Response:
+    """접수한 요청의 ack_id와 상태 조회 경로(Location)로 202 응답을 만듭니다."""
+    return JSONResponse(
+        status_code=202,
+        content=TagWriteAckResponse(ack_id=ack_id, status="pending").model_dump(),
+        headers={
+            "Location": f"/tag-writes/{ack_id}",
+            "Preference-Applied": "respond-async",
+        },
+    )
+
 
-@router.get("/{company_name}")
+@router.get("/{company_name}", response_model=CompanyResponse)
 async def get_company(
     company_name: str,
     language: Language,
     company_service: CompanyServiceDep,
-) -> CompanyResponse:
-    return await company_service.get_company(company_name, language)
+    response: Response,
+    fuzzy: bool = Query(
+        default=False, description="일치하는 회사가 없으면 가장 가까운 회사명으로 조회"
+    ),
+    if_none_match: str | None = Header(default=None, alias="if-none-match"),
+) -> CompanyResponse | Response:
+    if if_none_match:
+        # 304면 프로필을 만들지 않도록 revision만으로 먼저 비교합니다.
+        current_etag = await company_service.get_company_etag(company_name, language)
+        if current_etag and etag_matches(if_none_match, current_etag):
+            return not_modified(current_etag)
 
+    company, etag = await company_service.get_company(company_name, language, fuzzy)
+    response.headers.update(cache_headers(etag))
+    return company
 
-@router.post("")
+
+@router.post(":batchGet")
+async def batch_get_companies(
+    request_body: BatchGetCompaniesRequest,
+    language: Language,
+    company_service: CompanyServiceDep,
+) -> BatchGetCompaniesResponse:
+    """여러 회사명을 한 번에 조회합니다. 결과는 요청 순서를 따릅니다."""
+    return await company_service.batch_get_companies(
+        request_body.names, request_body.language or language
+    )
+
+
+@router.post(":batchCreate")
+async def batch_create_companies(
+    request_body: BatchCreateCompaniesRequest,
+    language: Language,
+    company_service: CompanyServiceDep,
+) -> BatchCreateCompaniesResponse:
+    """
+    여러 회사를 한 번에 생성합니다. 결과는 요청 순서를 따르며, 이미 등록되었거나
+    앞선 항목과 회사명이 겹치는 항목은 생성하지 않고 상태로 알려줍니다.
+    """
+    return await company_service.batch_create_companies(
+        request_body.companies, language
+    )
+
+
+@router.post("", response_model=CompanyResponse)
 async def create_company(
     request_body: CreateCompanyRequest,
     language: Language,
     company_service: CompanyServiceDep,
-) -> CompanyResponse:
-    return await company_service.create_company(request_body, language)
+    idempotency_key: str | None = Header(
+        default=None,
+        alias="idempotency-key",
+        max_length=255,
+        description="같은 키의 재시도는 처음 응답을 그대로 재생 (Idempotent-Replayed 헤더)",
+    ),
+) -> CompanyResponse | Response:
+    if idempotency_key is None:
+        return await company_service.create_company(request_body, language)
 
+    return await idempotency_store.run(
+        idempotency_key,
+        request_fingerprint(request_body.model_dump(mode="json"), language),
+        lambda: company_service.create_company(request_body, language),
+    )
 
-@router.put("/{company_name}/tags")
+
+@router.put(
+    "/{company_name}/tags", response_model=TagResponse, responses=_ACCEPTED_RESPONSES
+)
 async def add_tag(
     company_name: str,
     request_body: list[CreateTagRequest],
     language: Language,
     tag_service: TagServiceDep,
-    company_service: CompanyServiceDep,
-) -> TagResponse:
-    """기존 회사에 새 태그를 추가합니다."""
-    # 태그 추가
-    await tag_service.add_tags_to_existing_company(company_name, request_body)
+    prefer: str | None = Header(default=None),
+) -> TagResponse | Response:
+    """
+    기존 회사에 새 태그를 추가하고 추가 후의 태그 목록을 반환합니다.
+    Prefer: respond-async 요청은 (TAG_WRITE_QUEUE_ENABLED일 때) 접수만 하고
+    202와 ack_id를 반환하며, 같은 회사의 요청과 묶여 곧 적용됩니다.
+    """
+    if _respond_async(prefer):
+        return _accepted(
+            tag_write_queue.submit(
+                company_name,
+                link=[tag_request.tag_name.root for tag_request in request_body],
+            )
+        )
 
-    company_data = await company_service.get_company(company_name, language)
+    return await tag_service.add_tags_to_existing_company(
+        company_name, request_body, language
+    )
 
-    return TagResponse(company_name=company_data.company_name, tags=company_data.tags)
 
+@router.delete(
+    "/{company_name}/tags", response_model=TagResponse, responses=_ACCEPTED_RESPONSES
+)
+async def delete_tags(
+    company_name: str,
+    language: Language,
+    tag_service: TagServiceDep,
+    tag_names: Annotated[
+        list[str],
+        Body(
+            min_length=1,
+            max_length=settings.TAG_QUERY_MAX_TERMS,
+            description="해제할 태그명 목록 (모든 언어)",
+        ),
+    ],
+    prefer: str | None = Header(default=None),
+) -> TagResponse | Response:
+    """여러 태그를 한 번에 해제합니다. 회사에 연결되지 않은 태그명은 무시합니다."""
+    if _respond_async(prefer):
+        return _accepted(tag_write_queue.submit(company_name, unlink=tag_names))
+
+    return await tag_service.delete_tags(company_name, tag_names, language)
 
-@router.delete("/{company_name}/tags/{tag_name}")
+
+@router.delete(
+    "/{company_name}/tags/{tag_name}",
+    response_model=TagResponse,
+    responses=_ACCEPTED_RESPONSES,
+)
 async def delete_tag(
     company_name: str,
     tag_name: str,
     language: Language,
     tag_service: TagServiceDep,
-) -> TagResponse:
+    prefer: str | None = Header(default=None),
+) -> TagResponse | Response:
+    """
+    태그 하나를 해제합니다. 비동기 쓰기 모드에서는 일괄 해제와 같이
+    회사에 연결되지 않은 태그명을 무시합니다.
+    """
+    if _respond_async(prefer):
+        return _accepted(tag_write_queue.submit(company_name, unlink=[tag_name]))
+
     return await tag_service.delete_tag(company_name, tag_name, language)
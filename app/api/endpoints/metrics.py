@@ -0,0 +1,54 @@
+from fastapi import APIRouter
+
+from app.core.cache import registered_caches
+from app.core.config import settings
+from app.schemas.metrics import (
+    CacheStatsResponse,
+    EndpointCacheStatsResponse,
+    TagWriteQueueStatsResponse,
+)
+from app.services.tag_write_queue import tag_write_queue
+
+router = APIRouter()
+
+
+@router.get("/caches")
+async def get_cache_metrics() -> dict[str, CacheStatsResponse]:
+    """프로세스 내 캐시별 적중/미스/축출 통계를 반환합니다."""
+    return {
+        name: CacheStatsResponse(
+            size=len(cache),
+            maxsize=cache.maxsize,
+            hits=cache.stats.hits,
+            misses=cache.stats.misses,
+            evictions=cache.stats.evictions,
+            expirations=cache.stats.expirations,
+            invalidations=cache.stats.invalidations,
+            hit_ratio=cache.stats.hit_ratio,
+            endpoints={
+                endpoint: EndpointCacheStatsResponse(
+                    hits=stats.hits, misses=stats.misses, hit_ratio=stats.hit_ratio
+                )
+                for endpoint, stats in cache.endpoint_stats.items()
+            },
+        )
+        for name, cache in registered_caches().items()
+    }
+
+
+@router.get("/tag-writes")
+async def get_tag_write_metrics() -> TagWriteQueueStatsResponse:
+    """비동기 태그 쓰기 큐의 처리량과 회사별 트랜잭션 크기(병합된 요청 수) 통계를 반환합니다."""
+    stats = tag_write_queue.stats
+    return TagWriteQueueStatsResponse(
+        enabled=settings.TAG_WRITE_QUEUE_ENABLED,
+        pending=tag_write_queue.pending,
+        submitted=stats.submitted,
+        applied=stats.applied,
+        failed=stats.failed,
+        flushes=stats.flushes,
+        batches=stats.batches,
+        last_batch_size=stats.last_batch_size,
+        max_batch_size=stats.max_batch_size,
+        mean_batch_size=stats.mean_batch_size,
+    )
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Query
 
+from app.core.config import settings
 from app.core.dependency import CompanyServiceDep, Language
 from app.schemas.search import SearchResponse
 
@@ -11,5 +12,13 @@ async def search(
     language: Language,
     company_service: CompanyServiceDep,
     query: str = Query(..., description="검색 쿼리"),
+    limit: int = Query(
+        default=settings.SEARCH_DEFAULT_LIMIT,
+        ge=1,
+        description=f"최대 결과 수 (최대 {settings.SEARCH_MAX_LIMIT})",
+    ),
+    fuzzy: bool = Query(
+        default=False, description="결과가 없으면 오타를 허용한 근접 회사명 반환"
+    ),
 ) -> list[SearchResponse]:
-    return await company_service.search(query, language)
+    return await company_service.search(query, language, limit, fuzzy)
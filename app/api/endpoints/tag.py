@@ -1,15 +1,90 @@
-from fastapi import APIRouter, Query
+from typing import Annotated
 
+from fastapi import APIRouter, Header, Query, Response
+
+from app.core.config import settings
 from app.core.dependency import Language, TagServiceDep
-from app.schemas.tag import TagResponse
+from app.core.http_cache import cache_headers, etag_matches, not_modified
+from app.schemas.tag import TagFacetResponse, TagResponse
 
 router = APIRouter()
 
 
-@router.get("")
+@router.get("", response_model=list[TagResponse])
 async def get_tags(
     language: Language,
     tag_service: TagServiceDep,
+    response: Response,
     query: str = Query(..., description="태그명"),
+    limit: int = Query(
+        default=settings.TAG_COMPANIES_DEFAULT_LIMIT,
+        ge=1,
+        description=f"페이지당 회사 수 (최대 {settings.TAG_COMPANIES_MAX_LIMIT})",
+    ),
+    cursor: str | None = Query(
+        default=None, description="이전 응답의 X-Next-Cursor 헤더 값"
+    ),
+    if_none_match: str | None = Header(default=None, alias="if-none-match"),
+) -> list[TagResponse] | Response:
+    page = await tag_service.get_tag_page(query, limit, cursor)
+    if if_none_match:
+        # 304면 회사 프로필을 읽지 않도록 페이지의 revision만으로 먼저 비교합니다.
+        current_etag = await tag_service.get_tag_page_etag(page, language)
+        if etag_matches(if_none_match, current_etag):
+            return not_modified(current_etag)
+
+    tags, etag = await tag_service.localize_tag_page(page, language)
+    response.headers.update(cache_headers(etag))
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return tags
+
+
+@router.get("/search")
+async def search_companies_by_tags(
+    language: Language,
+    tag_service: TagServiceDep,
+    response: Response,
+    all_names: Annotated[
+        list[str] | None, Query(alias="all", description="모두 포함해야 하는 태그명")
+    ] = None,
+    any_names: Annotated[
+        list[str] | None,
+        Query(alias="any", description="하나 이상 포함해야 하는 태그명"),
+    ] = None,
+    none_names: Annotated[
+        list[str] | None, Query(alias="none", description="포함하지 않아야 하는 태그명")
+    ] = None,
+    limit: int = Query(
+        default=settings.TAG_COMPANIES_DEFAULT_LIMIT,
+        ge=1,
+        description=f"페이지당 회사 수 (최대 {settings.TAG_COMPANIES_MAX_LIMIT})",
+    ),
+    cursor: str | None = Query(
+        default=None, description="이전 응답의 X-Next-Cursor 헤더 값"
+    ),
 ) -> list[TagResponse]:
-    return await tag_service.get_tag(query, language)
+    """
+    여러 태그명(모든 언어)의 AND(all) / OR(any) / NOT(none) 조건으로 회사를 조회합니다.
+    예: /tags/search?all=태그_4&all=tag_16&none=タグ_20
+    """
+    tags, next_cursor = await tag_service.search_companies_by_tags(
+        all_names or [], any_names or [], none_names or [], language, limit, cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return tags
+
+
+@router.get("/facets")
+async def get_tag_facets(
+    language: Language,
+    tag_service: TagServiceDep,
+    limit: int = Query(
+        default=settings.TAG_FACETS_DEFAULT_LIMIT,
+        ge=1,
+        description=f"최대 태그 수 (최대 {settings.TAG_FACETS_MAX_LIMIT})",
+    ),
+) -> list[TagFacetResponse]:
+    """회사 수(tag.usage_count) 상위 태그를 요청 언어의 태그명으로 반환합니다."""
+    return await tag_service.get_facets(language, limit)
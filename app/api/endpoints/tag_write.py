@@ -0,0 +1,17 @@
+from fastapi import APIRouter, HTTPException
+
+from app.schemas.tag import TagWriteAckResponse
+from app.services.tag_write_queue import tag_write_queue
+
+router = APIRouter()
+
+
+@router.get("/{ack_id}")
+async def get_tag_write(ack_id: str) -> TagWriteAckResponse:
+    """비동기 쓰기 모드(Prefer: respond-async)로 접수한 태그 연결/해제의 처리 상태를 반환합니다."""
+    status = tag_write_queue.status(ack_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Ack not found")
+
+    state, detail = status
+    return TagWriteAckResponse(ack_id=ack_id, status=state, detail=detail)
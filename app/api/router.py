@@ -1,10 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.api.endpoints import company, search, tag
+from app.api.endpoints import company, metrics, search, tag, tag_write
+from app.core.dependency import track_endpoint
 
 # 메인 API 라우터
-api_router = APIRouter(prefix="")
+api_router = APIRouter(prefix="", dependencies=[Depends(track_endpoint)])
 
 api_router.include_router(search.router, prefix="/search", tags=["search"])
 api_router.include_router(company.router, prefix="/companies", tags=["companies"])
 api_router.include_router(tag.router, prefix="/tags", tags=["tags"])
+api_router.include_router(tag_write.router, prefix="/tag-writes", tags=["tag-writes"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
@@ -0,0 +1,173 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+from app.schemas.company import CompanyResponse
+from app.schemas.search import SearchResponse
+
+__all__ = [
+    "CacheStats",
+    "LRUCache",
+    "clear_caches",
+    "company_id_cache",
+    "company_profile_cache",
+    "current_endpoint",
+    "invalidate_company_profiles",
+    "registered_caches",
+    "search_cache",
+]
+
+# 요청을 처리 중인 엔드포인트 ("GET /companies/{company_name}" 형식)
+current_endpoint: ContextVar[str | None] = ContextVar("current_endpoint", default=None)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_registry: dict[str, "LRUCache[Any, Any]"] = {}
+
+
+class LRUCache[K: Hashable, V]:
+    """
+    크기 제한(LRU)과 TTL을 갖는 프로세스 내 캐시입니다.
+    생성 시 name으로 등록되어 /metrics/caches 에서 통계를 확인할 수 있습니다.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float | None = None) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self.endpoint_stats: dict[str, CacheStats] = {}
+        # 무효화될 때마다 증가. 조회 시작 후 무효화된 결과의 저장을 막는 데 사용합니다.
+        self.generation = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        _registry[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._record(hit=False)
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self._record(hit=False)
+            return None
+
+        self._entries.move_to_end(key)
+        self._record(hit=True)
+        return value
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """
+        값을 저장합니다. generation을 넘기면 그 사이 무효화가 있었던 경우
+        (조회 도중 쓰기가 커밋된 경우) 오래된 값을 저장하지 않습니다.
+        """
+        if generation is not None and generation != self.generation:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        self.generation += 1
+        if self._entries.pop(key, None) is not None:
+            self.stats.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[K, V], bool]) -> None:
+        self.generation += 1
+        for key in [
+            key for key, (_, value) in self._entries.items() if predicate(key, value)
+        ]:
+            del self._entries[key]
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def _record(self, hit: bool) -> None:
+        endpoint = current_endpoint.get()
+        targets = [self.stats]
+        if endpoint is not None:
+            targets.append(self.endpoint_stats.setdefault(endpoint, CacheStats()))
+
+        for stats in targets:
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+
+def registered_caches() -> dict[str, "LRUCache[Any, Any]"]:
+    return dict(_registry)
+
+
+def clear_caches() -> None:
+    for cache in _registry.values():
+        cache.clear()
+
+
+def invalidate_company_profiles(
+    company_ids: Iterable[int] = (), tag_ids: Iterable[int] = ()
+) -> None:
+    """
+    회사 프로필 캐시를 무효화합니다.
+    company_ids의 모든 언어 프로필과, tag_ids 태그를 가진 회사의 프로필이 대상입니다.
+    """
+    company_id_set = set(company_ids)
+    tag_id_set = set(tag_ids)
+    if not company_id_set and not tag_id_set:
+        return
+
+    company_profile_cache.invalidate_where(
+        lambda key, value: (
+            key[0] in company_id_set or not tag_id_set.isdisjoint(value[1])
+        )
+    )
+
+
+# (정규화된 검색어, 정규화된 언어 코드, limit) -> 검색 결과
+search_cache: LRUCache[tuple[str, str, int], list[SearchResponse]] = LRUCache(
+    "search", maxsize=settings.SEARCH_CACHE_SIZE, ttl=settings.SEARCH_CACHE_TTL
+)
+
+# 회사명 -> company_id
+company_id_cache: LRUCache[str, int] = LRUCache(
+    "company_id", maxsize=settings.COMPANY_CACHE_SIZE, ttl=settings.COMPANY_CACHE_TTL
+)
+
+# (company_id, 정규화된 언어 코드) -> (회사 프로필, 프로필에 포함된 tag_id 집합, revision)
+company_profile_cache: LRUCache[
+    tuple[int, str], tuple[CompanyResponse, frozenset[int], int]
+] = LRUCache(
+    "company_profile",
+    maxsize=settings.COMPANY_CACHE_SIZE,
+    ttl=settings.COMPANY_CACHE_TTL,
+)
@@ -22,6 +22,89 @@ class Settings(BaseSettings):
     DEBUG: bool = Field(default=False, description="디버그 모드")
     DEFAULT_LANGUAGE: str = Field(default="ko", description="기본 언어")
 
+    SEARCH_INDEX_ENABLED: bool = Field(
+        default=True,
+        description="인메모리 회사명 검색 인덱스 사용 여부 (False면 FULLTEXT 검색)",
+    )
+    SEARCH_NGRAM_TOKEN_SIZE: int = Field(
+        default=2,
+        description="MySQL ngram_token_size (이보다 짧은 질의는 prefix 검색)",
+    )
+    SEARCH_DEFAULT_LIMIT: int = Field(default=10, description="자동완성 기본 결과 수")
+    SEARCH_MAX_LIMIT: int = Field(default=50, description="자동완성 최대 결과 수")
+    FUZZY_INDEX_ENABLED: bool = Field(
+        default=True, description="오타 허용 검색용 인메모리 BK-tree 사용 여부"
+    )
+    FUZZY_MAX_DISTANCE: int = Field(default=2, description="오타 허용 최대 편집 거리")
+    SEARCH_CACHE_SIZE: int = Field(
+        default=2048, description="검색 결과 캐시 최대 항목 수"
+    )
+    SEARCH_CACHE_TTL: float = Field(default=60.0, description="검색 결과 캐시 TTL(초)")
+    COMPANY_CACHE_SIZE: int = Field(
+        default=4096, description="회사 프로필/회사명 캐시 최대 항목 수"
+    )
+    COMPANY_CACHE_TTL: float = Field(
+        default=300.0, description="회사 프로필/회사명 캐시 TTL(초)"
+    )
+    COMPANY_BATCH_MAX_SIZE: int = Field(
+        default=200, description="POST /companies:batchGet 최대 회사명 수"
+    )
+    COMPANY_BATCH_CREATE_MAX_SIZE: int = Field(
+        default=1000, description="POST /companies:batchCreate 최대 회사 수"
+    )
+    IDEMPOTENCY_CACHE_SIZE: int = Field(
+        default=10000, description="POST /companies Idempotency-Key 응답 저장 최대 수"
+    )
+    IDEMPOTENCY_KEY_TTL: float = Field(
+        default=86400.0, description="Idempotency-Key 응답 보관 시간(초)"
+    )
+    BULK_INSERT_CHUNK_SIZE: int = Field(
+        default=1000, description="multi-row INSERT 한 문장의 최대 행 수"
+    )
+    TAG_INDEX_ENABLED: bool = Field(
+        default=True, description="인메모리 태그 -> 회사 역색인 사용 여부"
+    )
+    TAG_DICTIONARY_ENABLED: bool = Field(
+        default=True,
+        description="인메모리 태그 사전(tag_id -> 언어별 태그명) 사용 여부",
+    )
+    TAG_DICTIONARY_TTL: float = Field(
+        default=300.0,
+        description="태그 사전 항목을 DB에서 다시 읽기까지의 시간(초), 0이면 만료 없음",
+    )
+    TAG_COMPANIES_DEFAULT_LIMIT: int = Field(
+        default=20, description="GET /tags 페이지당 기본 회사 수"
+    )
+    TAG_COMPANIES_MAX_LIMIT: int = Field(
+        default=100, description="GET /tags 페이지당 최대 회사 수"
+    )
+    TAG_FACETS_DEFAULT_LIMIT: int = Field(
+        default=20, description="GET /tags/facets 기본 태그 수"
+    )
+    TAG_FACETS_MAX_LIMIT: int = Field(
+        default=100, description="GET /tags/facets 최대 태그 수"
+    )
+    TAG_QUERY_MAX_TERMS: int = Field(
+        default=20, description="GET /tags/search 최대 태그명 수 (all+any+none)"
+    )
+    TAG_WRITE_QUEUE_ENABLED: bool = Field(
+        default=False,
+        description="Prefer: respond-async 태그 연결/해제 요청의 비동기 병합 쓰기 사용 여부",
+    )
+    TAG_WRITE_QUEUE_WINDOW: float = Field(
+        default=0.05, description="비동기 태그 쓰기를 모아 적용하기까지의 대기 시간(초)"
+    )
+    TAG_WRITE_QUEUE_MAX_PENDING: int = Field(
+        default=1000, description="대기 시간 전이라도 즉시 적용하는 대기 요청 수"
+    )
+    TAG_WRITE_QUEUE_ACK_HISTORY: int = Field(
+        default=10000, description="상태를 조회할 수 있는 최근 비동기 태그 쓰기 수"
+    )
+    HTTP_CACHE_MAX_AGE: int = Field(
+        default=0,
+        description="조회 응답 Cache-Control max-age(초), 0이면 매번 ETag로 재검증",
+    )
+
     @property
     def base_database_url(self) -> str:
         return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/"
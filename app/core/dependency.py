@@ -1,13 +1,15 @@
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
-from fastapi import Depends, Header, HTTPException
+from fastapi import Depends, Header, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import current_endpoint
 from app.core.config import settings
 from app.core.language import validate_language_code
 from app.db.session import get_async_session
 from app.repositories.company import CompanyRepository
+from app.repositories.company_profile import CompanyProfileRepository
 from app.repositories.company_tag import CompanyTagRepository
 from app.repositories.tag import TagRepository
 from app.services.company import CompanyService
@@ -29,6 +31,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
 
 
+async def track_endpoint(request: Request) -> None:
+    """
+    캐시 통계를 엔드포인트별로 집계할 수 있도록 현재 라우트를 기록합니다.
+    예: "GET /companies/{company_name}"
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    current_endpoint.set(f"{request.method} {path}")
+
+
 async def get_language(
     x_wanted_language: str | None = Header(default="ko", alias="x-wanted-language"),
 ) -> str:
@@ -70,6 +82,11 @@ def get_company_tag_repository(db: DatabaseSession) -> CompanyTagRepository:
     return CompanyTagRepository(db)
 
 
+def get_company_profile_repository(db: DatabaseSession) -> CompanyProfileRepository:
+    """CompanyProfileRepository 의존성 팩토리"""
+    return CompanyProfileRepository(db)
+
+
 # Service 의존성들
 def get_company_service(
     db: DatabaseSession,
@@ -78,9 +95,14 @@ def get_company_service(
     company_tag_repo: Annotated[
         CompanyTagRepository, Depends(get_company_tag_repository)
     ],
+    company_profile_repo: Annotated[
+        CompanyProfileRepository, Depends(get_company_profile_repository)
+    ],
 ) -> CompanyService:
     """CompanyService 의존성 팩토리"""
-    return CompanyService(db, company_repo, tag_repo, company_tag_repo)
+    return CompanyService(
+        db, company_repo, tag_repo, company_tag_repo, company_profile_repo
+    )
 
 
 def get_tag_service(
@@ -90,9 +112,14 @@ def get_tag_service(
     company_tag_repo: Annotated[
         CompanyTagRepository, Depends(get_company_tag_repository)
     ],
+    company_profile_repo: Annotated[
+        CompanyProfileRepository, Depends(get_company_profile_repository)
+    ],
 ) -> TagService:
     """TagService 의존성 팩토리"""
-    return TagService(db, company_repo, tag_repo, company_tag_repo)
+    return TagService(
+        db, company_repo, tag_repo, company_tag_repo, company_profile_repo
+    )
 
 
 # 타입 힌트 별칭들
@@ -101,5 +128,8 @@ TagRepositoryDep = Annotated[TagRepository, Depends(get_tag_repository)]
 CompanyTagRepositoryDep = Annotated[
     CompanyTagRepository, Depends(get_company_tag_repository)
 ]
+CompanyProfileRepositoryDep = Annotated[
+    CompanyProfileRepository, Depends(get_company_profile_repository)
+]
 CompanyServiceDep = Annotated[CompanyService, Depends(get_company_service)]
 TagServiceDep = Annotated[TagService, Depends(get_tag_service)]
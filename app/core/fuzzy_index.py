@@ -0,0 +1,149 @@
+from collections.abc import Iterable
+
+from app.core.config import settings
+from app.core.language import normalize_language_code
+
+__all__ = [
+    "BKTree",
+    "FuzzyNameIndex",
+    "fuzzy_name_index",
+    "levenshtein",
+    "max_distance_for",
+]
+
+
+def levenshtein(a: str, b: str) -> int:
+    """두 문자열의 편집 거리(삽입/삭제/치환)를 계산합니다."""
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def max_distance_for(query: str) -> int:
+    """짧은 질의일수록 허용 편집 거리를 줄여 무관한 이름이 섞이지 않게 합니다."""
+    return min(settings.FUZZY_MAX_DISTANCE, len(query) // 3)
+
+
+class _BKNode:
+    __slots__ = ("children", "ids", "word")
+
+    def __init__(self, word: str, name_id: int) -> None:
+        self.word = word
+        self.ids = [name_id]
+        self.children: dict[int, _BKNode] = {}
+
+
+class BKTree:
+    """편집 거리 기반 BK-tree. 삼각 부등식으로 탐색 범위를 줄입니다."""
+
+    def __init__(self) -> None:
+        self._root: _BKNode | None = None
+
+    def add(self, word: str, name_id: int) -> None:
+        if self._root is None:
+            self._root = _BKNode(word, name_id)
+            return
+
+        node = self._root
+        while True:
+            distance = levenshtein(word, node.word)
+            if distance == 0:
+                node.ids.append(name_id)
+                return
+
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _BKNode(word, name_id)
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, int]]:
+        """word와 편집 거리 max_distance 이내인 (거리, id) 목록을 반환합니다."""
+        if self._root is None:
+            return []
+
+        matches: list[tuple[int, int]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = levenshtein(word, node.word)
+            if distance <= max_distance:
+                matches.extend((distance, name_id) for name_id in node.ids)
+
+            for child_distance, child in node.children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return matches
+
+
+class FuzzyNameIndex:
+    """lang_code별 회사명 BK-tree로 오타가 있는 질의의 근접 회사명을 찾습니다."""
+
+    def __init__(self) -> None:
+        self._trees: dict[str, BKTree] = {}
+        self._names: dict[int, str] = {}
+        self.is_loaded = False
+
+    def load(self, entries: Iterable[tuple[int, str, str]]) -> None:
+        """(company_name.id, name, lang_code) 목록으로 인덱스를 새로 구성합니다."""
+        self._trees = {}
+        self._names = {}
+        for name_id, name, lang_code in entries:
+            self.add(name_id, name, lang_code)
+        self.is_loaded = True
+
+    def add(self, name_id: int, name: str, lang_code: str) -> None:
+        if name_id in self._names:
+            return
+
+        self._names[name_id] = name
+        language_key = normalize_language_code(lang_code) or lang_code
+        self._trees.setdefault(language_key, BKTree()).add(name.casefold(), name_id)
+
+    def search(self, query: str, lang_code: str | None, limit: int) -> list[str]:
+        """
+        편집 거리가 가까운 회사명을 최대 limit개 반환합니다.
+        lang_code가 None이면 모든 언어의 회사명을 대상으로 합니다.
+        """
+        needle = query.casefold()
+        if lang_code is None:
+            trees = list(self._trees.values())
+        else:
+            tree = self._trees.get(normalize_language_code(lang_code) or lang_code)
+            trees = [tree] if tree else []
+
+        max_distance = max_distance_for(needle)
+        matches = [
+            match for tree in trees for match in tree.search(needle, max_distance)
+        ]
+        matches.sort(key=lambda match: (match[0], len(self._names[match[1]]), match[1]))
+
+        names: list[str] = []
+        for _, name_id in matches:
+            name = self._names[name_id]
+            if name not in names:
+                names.append(name)
+            if len(names) == limit:
+                break
+        return names
+
+    def clear(self) -> None:
+        self._trees = {}
+        self._names = {}
+        self.is_loaded = False
+
+
+fuzzy_name_index = FuzzyNameIndex()
@@ -0,0 +1,38 @@
+__all__ = [
+    "CHOSUNG",
+    "extract_chosung",
+    "is_chosung_query",
+]
+
+# 한글 음절의 초성 19자 (유니코드 순서)
+CHOSUNG: tuple[str, ...] = (
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)  # fmt: skip
+
+_CHOSUNG_SET = frozenset(CHOSUNG)
+_SYLLABLE_FIRST = ord("가")
+_SYLLABLE_LAST = ord("힣")
+_SYLLABLES_PER_CHOSUNG = 21 * 28  # 중성 21개 x 종성 28개
+
+
+def extract_chosung(text: str) -> str:
+    """
+    한글 음절을 초성으로 분해한 검색용 문자열을 반환합니다.
+    한글이 아닌 문자는 소문자로 유지하고 공백은 제거합니다.
+    예: "원티드랩" -> "ㅇㅌㄷㄹ"
+    """
+    chars = []
+    for char in text:
+        code = ord(char)
+        if _SYLLABLE_FIRST <= code <= _SYLLABLE_LAST:
+            chars.append(CHOSUNG[(code - _SYLLABLE_FIRST) // _SYLLABLES_PER_CHOSUNG])
+        elif not char.isspace():
+            chars.append(char.casefold())
+    return "".join(chars)
+
+
+def is_chosung_query(query: str) -> bool:
+    """공백을 제외한 모든 문자가 초성인 질의인지 확인합니다."""
+    chars = [char for char in query if not char.isspace()]
+    return bool(chars) and all(char in _CHOSUNG_SET for char in chars)
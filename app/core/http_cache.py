@@ -0,0 +1,50 @@
+import hashlib
+
+from fastapi import Response
+
+from app.core.config import settings
+
+__all__ = [
+    "cache_headers",
+    "etag_matches",
+    "make_etag",
+    "not_modified",
+    "page_digest",
+]
+
+
+def make_etag(*parts: object) -> str:
+    """버전 토큰 조각들로 약한(weak) ETag를 만듭니다. 예: W/"c12.3.ko" """
+    return 'W/"' + ".".join(str(part) for part in parts) + '"'
+
+
+def page_digest(*parts: object) -> str:
+    """페이지를 이루는 값들(id:revision, 커서 등)을 ETag에 넣을 짧은 해시로 줄입니다."""
+    payload = "\x1f".join("" if part is None else str(part) for part in parts)
+    return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 약한 비교(RFC 9110)로 확인합니다."""
+    if not if_none_match:
+        return False
+
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    """언어별로 캐시할 수 있도록 ETag, Cache-Control, Vary 헤더를 반환합니다."""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE}",
+        "Vary": "x-wanted-language",
+    }
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
@@ -0,0 +1,109 @@
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, NamedTuple
+
+from fastapi import HTTPException, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+__all__ = [
+    "IdempotencyStore",
+    "StoredResponse",
+    "idempotency_store",
+    "request_fingerprint",
+]
+
+
+class StoredResponse(NamedTuple):
+    # 같은 키로 다른 요청을 보냈는지 확인하기 위한 요청 지문
+    fingerprint: str
+    status_code: int
+    content: Any
+
+
+def request_fingerprint(*parts: object) -> str:
+    """요청 본문, 언어 등 응답을 결정하는 값들의 SHA-256 지문을 만듭니다."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key -> 처음 처리한 응답을 보관하는 프로세스 내 저장소입니다.
+
+    같은 키의 재시도는 저장된 응답을 그대로 돌려주어 DB에 접근하지 않습니다.
+    응답은 크기 제한(LRU)과 TTL을 갖는 LRUCache("idempotency")에 두므로
+    /metrics/caches 에서 재사용(hit) 통계를 확인할 수 있습니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._responses: LRUCache[str, StoredResponse] = LRUCache(
+            "idempotency", maxsize=maxsize, ttl=ttl
+        )
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._waiters: dict[str, int] = {}
+
+    async def run[T: BaseModel](
+        self, key: str, fingerprint: str, operation: Callable[[], Awaitable[T]]
+    ) -> T | Response:
+        """
+        key로 처리한 응답이 있으면 재생하고, 없으면 operation을 실행해 결과를 저장합니다.
+        4xx 오류도 저장해 재시도에 같은 오류를 돌려주며, 5xx 등 예상하지 못한 오류는
+        저장하지 않아 재시도할 수 있게 합니다. 같은 키의 동시 요청은 먼저 온 요청이
+        끝날 때까지 기다렸다가 그 응답을 재생합니다.
+        """
+        async with self._lock(key):
+            stored = self._responses.get(key)
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    raise HTTPException(
+                        status_code=422,
+                        detail="Idempotency-Key was used for a different request",
+                    )
+                return JSONResponse(
+                    status_code=stored.status_code,
+                    content=stored.content,
+                    headers={"Idempotent-Replayed": "true"},
+                )
+
+            try:
+                result = await operation()
+            except HTTPException as exc:
+                if exc.status_code < 500:
+                    self._responses.set(
+                        key,
+                        StoredResponse(
+                            fingerprint, exc.status_code, {"detail": exc.detail}
+                        ),
+                    )
+                raise
+
+            self._responses.set(
+                key, StoredResponse(fingerprint, 200, result.model_dump(mode="json"))
+            )
+            return result
+
+    @asynccontextmanager
+    async def _lock(self, key: str) -> AsyncIterator[None]:
+        """키별 Lock입니다. 기다리는 요청이 없어지면 Lock을 지워 키 수만큼 쌓이지 않게 합니다."""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                del self._locks[key]
+
+
+idempotency_store = IdempotencyStore(
+    maxsize=settings.IDEMPOTENCY_CACHE_SIZE, ttl=settings.IDEMPOTENCY_KEY_TTL
+)
@@ -8,6 +8,7 @@ from app.core.config import settings
 __all__ = [
     "LANGUAGE_ALIAS_MAP",
     "choose_language",
+    "language_aliases",
     "normalize_language_code",
     "validate_language_code",
 ]
@@ -39,6 +40,18 @@ def normalize_language_code(code: str | None) -> str | None:
     return getattr(language, "alpha_2", None) or canonical
 
 
+def language_aliases(code: str) -> list[str]:
+    """
+    정규화된 언어 코드와 같은 언어를 가리키는 저장 코드 목록을 반환합니다.
+    예: "jp" -> ["ja", "jp"]
+    """
+    canonical = normalize_language_code(code) or code
+    return [
+        canonical,
+        *(alias for alias, target in LANGUAGE_ALIAS_MAP.items() if target == canonical),
+    ]
+
+
 def validate_language_code(code: str | None) -> bool:
     return normalize_language_code(code) is not None
 
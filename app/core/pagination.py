@@ -0,0 +1,30 @@
+import base64
+import binascii
+
+from fastapi import HTTPException
+
+__all__ = ["decode_cursor", "encode_cursor"]
+
+_CURSOR_PREFIX = "id:"
+
+
+def encode_cursor(last_id: int) -> str:
+    """마지막으로 반환한 id를 불투명한(opaque) 페이지 커서로 인코딩합니다."""
+    raw = f"{_CURSOR_PREFIX}{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> int:
+    """페이지 커서를 마지막 id로 디코딩합니다. 커서가 없으면 0을 반환합니다."""
+    if not cursor:
+        return 0
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+    last_id = raw.removeprefix(_CURSOR_PREFIX)
+    if last_id == raw or not last_id.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return int(last_id)
@@ -0,0 +1,196 @@
+import heapq
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.fuzzy_index import fuzzy_name_index
+from app.core.hangul import extract_chosung
+from app.core.language import normalize_language_code
+from app.repositories.company import CompanyRepository
+
+__all__ = [
+    "CompanyNameIndex",
+    "company_name_index",
+    "load_company_name_indexes",
+    "match_rank",
+]
+
+
+def match_rank(name: str, needle: str) -> int:
+    """
+    자동완성 일치 등급을 반환합니다. 값이 작을수록 우선합니다.
+    0: 완전 일치, 1: 이름 prefix 일치, 2: 단어 prefix 일치, 3: 부분 일치
+    """
+    folded = name.casefold()
+    if folded == needle:
+        return 0
+    if folded.startswith(needle):
+        return 1
+    if f" {needle}" in folded:
+        return 2
+    return 3
+
+
+class CompanyNameIndex:
+    """
+    lang_code별 회사명 suffix 정렬 배열 기반의 인메모리 자동완성 인덱스입니다.
+
+    회사명의 모든 suffix를 정렬해 두고 이진 탐색으로 prefix 범위를 찾으므로
+    FULLTEXT(ngram) 검색과 같은 부분 일치 결과를 DB 왕복 없이 반환합니다.
+    짧은 질의용 회사명 prefix 배열과 초성 prefix 배열도 함께 유지합니다.
+    """
+
+    def __init__(self) -> None:
+        self._suffixes: dict[str, list[tuple[str, int]]] = {}
+        self._prefixes: dict[str, list[tuple[str, int]]] = {}
+        self._chosung: dict[str, list[tuple[str, int]]] = {}
+        self._names: dict[int, str] = {}
+        self.is_loaded = False
+
+    def load(self, entries: Iterable[tuple[int, str, str]]) -> None:
+        """(company_name.id, name, lang_code) 목록으로 인덱스를 새로 구성합니다."""
+        suffixes: dict[str, list[tuple[str, int]]] = {}
+        prefixes: dict[str, list[tuple[str, int]]] = {}
+        chosung: dict[str, list[tuple[str, int]]] = {}
+        names: dict[int, str] = {}
+
+        for name_id, name, lang_code in entries:
+            names[name_id] = name
+            language_key = self._language_key(lang_code)
+            suffixes.setdefault(language_key, []).extend(
+                self._suffixes_of(name, name_id)
+            )
+            prefixes.setdefault(language_key, []).append((name.casefold(), name_id))
+            chosung.setdefault(language_key, []).append(
+                (extract_chosung(name), name_id)
+            )
+
+        for bucket in (*suffixes.values(), *prefixes.values(), *chosung.values()):
+            bucket.sort()
+
+        self._suffixes = suffixes
+        self._prefixes = prefixes
+        self._chosung = chosung
+        self._names = names
+        self.is_loaded = True
+
+    def add_all(self, entries: Iterable[tuple[int, str, str]]) -> None:
+        """
+        커밋된 (company_name.id, name, lang_code) 목록을 인덱스에 반영합니다.
+        새 항목을 언어별로 모아 정렬한 뒤 기존 배열과 한 번에 병합하므로 항목마다
+        배열 중간에 삽입하지 않으며, 배열은 병합이 끝난 뒤 한 번에 교체합니다.
+        """
+        suffixes: dict[str, list[tuple[str, int]]] = {}
+        prefixes: dict[str, list[tuple[str, int]]] = {}
+        chosung: dict[str, list[tuple[str, int]]] = {}
+        for name_id, name, lang_code in entries:
+            if name_id in self._names:
+                continue
+
+            self._names[name_id] = name
+            language_key = self._language_key(lang_code)
+            suffixes.setdefault(language_key, []).extend(
+                self._suffixes_of(name, name_id)
+            )
+            prefixes.setdefault(language_key, []).append((name.casefold(), name_id))
+            chosung.setdefault(language_key, []).append(
+                (extract_chosung(name), name_id)
+            )
+
+        for buckets, added in (
+            (self._suffixes, suffixes),
+            (self._prefixes, prefixes),
+            (self._chosung, chosung),
+        ):
+            for language_key, new_entries in added.items():
+                new_entries.sort()
+                buckets[language_key] = list(
+                    heapq.merge(buckets.get(language_key, []), new_entries)
+                )
+
+    def search(self, query: str, lang_code: str, limit: int) -> list[str]:
+        """
+        query를 부분 문자열로 포함하는 회사명 중 상위 limit개를 반환합니다.
+        정렬 기준은 CompanyRepository.search_by_name_pattern과 동일합니다.
+        """
+        needle = query.casefold()
+        matched_ids = self._range(self._suffixes, needle, lang_code)
+
+        def rank(name_id: int) -> tuple[int, int, int]:
+            name = self._names[name_id]
+            return (match_rank(name, needle), len(name), name_id)
+
+        top_ids = heapq.nsmallest(limit, matched_ids, key=rank)
+        return [self._names[name_id] for name_id in top_ids]
+
+    def search_prefix(self, query: str, lang_code: str, limit: int) -> list[str]:
+        """
+        query로 시작하는 회사명 중 짧은 순으로 상위 limit개를 반환합니다.
+        ngram 토큰보다 짧은 질의에 사용합니다.
+        """
+        matched_ids = self._range(self._prefixes, query.casefold(), lang_code)
+        return self._shortest(matched_ids, limit)
+
+    def search_chosung(self, query: str, lang_code: str, limit: int) -> list[str]:
+        """초성 질의(예: "ㅇㅌㄷ")로 시작하는 회사명을 짧은 순으로 반환합니다."""
+        matched_ids = self._range(self._chosung, extract_chosung(query), lang_code)
+        return self._shortest(matched_ids, limit)
+
+    def _shortest(self, name_ids: set[int], limit: int) -> list[str]:
+        top_ids = heapq.nsmallest(
+            limit, name_ids, key=lambda name_id: (len(self._names[name_id]), name_id)
+        )
+        return [self._names[name_id] for name_id in top_ids]
+
+    def _range(
+        self,
+        buckets: dict[str, list[tuple[str, int]]],
+        needle: str,
+        lang_code: str,
+    ) -> set[int]:
+        """정렬된 (문자열, id) 배열에서 needle로 시작하는 항목의 id를 모읍니다."""
+        bucket = buckets.get(self._language_key(lang_code))
+        if not needle or not bucket:
+            return set()
+
+        matched_ids: set[int] = set()
+        position = bisect_left(bucket, (needle,))
+        while position < len(bucket) and bucket[position][0].startswith(needle):
+            matched_ids.add(bucket[position][1])
+            position += 1
+        return matched_ids
+
+    def clear(self) -> None:
+        self._suffixes = {}
+        self._prefixes = {}
+        self._chosung = {}
+        self._names = {}
+        self.is_loaded = False
+
+    @staticmethod
+    def _language_key(lang_code: str) -> str:
+        return normalize_language_code(lang_code) or lang_code
+
+    @staticmethod
+    def _suffixes_of(name: str, name_id: int) -> list[tuple[str, int]]:
+        folded = name.casefold()
+        return [(folded[i:], name_id) for i in range(len(folded))]
+
+
+company_name_index = CompanyNameIndex()
+
+
+async def load_company_name_indexes(db: AsyncSession) -> None:
+    """DB의 전체 회사명으로 자동완성 인덱스와 오타 허용 인덱스를 적재합니다."""
+    company_name_index.clear()
+    fuzzy_name_index.clear()
+    if not (settings.SEARCH_INDEX_ENABLED or settings.FUZZY_INDEX_ENABLED):
+        return
+
+    entries = await CompanyRepository(db).get_all_names()
+    if settings.SEARCH_INDEX_ENABLED:
+        company_name_index.load(entries)
+    if settings.FUZZY_INDEX_ENABLED:
+        fuzzy_name_index.load(entries)
@@ -0,0 +1,138 @@
+import time
+from collections.abc import Iterable, Mapping
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.language import choose_language, normalize_language_code
+from app.models.tag import TagName
+
+__all__ = [
+    "TagDictionary",
+    "load_tag_dictionary",
+    "tag_dictionary",
+]
+
+
+class TagDictionary:
+    """
+    tag_id -> {정규화된 언어 코드: 태그명} 인메모리 사전입니다.
+
+    태그명은 추가만 되고 수정/삭제되지 않으므로 시작 시 전체를 적재하고
+    이 프로세스의 태그명 쓰기가 커밋될 때마다 반영합니다. 사전에 없는 태그는 조회한
+    쪽에서 DB 값을 store()로 채웁니다(read-through).
+    다른 워커나 CSV 적재기가 쓴 태그명은 알 수 없으므로 항목은 채운 뒤
+    TAG_DICTIONARY_TTL초가 지나면 없는 것으로 보고 DB에서 다시 읽습니다.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[int, dict[str, str]] = {}
+        self._loaded_at: dict[int, float] = {}
+        # 내용이 바뀔 때마다 증가. 조회 시작 후 바뀐 사전에 오래된 값을 채우지 않도록 합니다.
+        self.version = 0
+        self.is_loaded = False
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, tag_id: int) -> bool:
+        return tag_id in self._names and self._is_fresh(tag_id, time.monotonic())
+
+    def load(self, entries: Iterable[tuple[int, str, str]]) -> None:
+        """(tag_id, lang_code, 태그명) 목록으로 사전을 새로 구성합니다."""
+        self._names = self._group(entries)
+        now = time.monotonic()
+        self._loaded_at = dict.fromkeys(self._names, now)
+        self.version += 1
+        self.is_loaded = True
+
+    def store(
+        self, entries: Iterable[tuple[int, str, str]], version: int | None = None
+    ) -> None:
+        """
+        DB에서 읽은 태그의 전체 태그명을 채웁니다. 없거나 만료된 항목만 바꾸며,
+        version을 넘기면 그 사이 사전이 바뀐 경우(재적재, 태그명 추가) 저장하지 않습니다.
+        """
+        if not self.is_loaded or (version is not None and version != self.version):
+            return
+
+        now = time.monotonic()
+        for tag_id, names in self._group(entries).items():
+            if tag_id not in self._names or not self._is_fresh(tag_id, now):
+                self._names[tag_id] = names
+                self._loaded_at[tag_id] = now
+
+    def add_names(self, tag_id: int, tag_names: Mapping[str, str]) -> None:
+        """
+        커밋된 태그명을 반영합니다. 사전에 없는 기존 태그라면 일부 언어만 담긴
+        항목이 생기지 않도록 다음 조회에서 DB 값으로 채워지게 둡니다.
+        """
+        names = self._names.get(tag_id)
+        if names is None:
+            return
+
+        for lang_code, name in sorted(tag_names.items()):
+            names.setdefault(self._language_key(lang_code), name)
+        self.version += 1
+
+    def add_tag(self, tag_id: int, tag_names: Mapping[str, str]) -> None:
+        """커밋된 새 태그와 그 태그명 전체를 반영합니다."""
+        if not self.is_loaded:
+            return
+
+        self._names[tag_id] = self._group(
+            (tag_id, lang_code, name) for lang_code, name in tag_names.items()
+        )[tag_id]
+        self._loaded_at[tag_id] = time.monotonic()
+        self.version += 1
+
+    def localize(self, tag_ids: Iterable[int], language: str) -> dict[int, str]:
+        """
+        tag_ids의 태그명을 choose_language fallback으로 골라 반환합니다.
+        사전에 없거나 만료된 태그는 빠집니다.
+        """
+        now = time.monotonic()
+        localized = {}
+        for tag_id in tag_ids:
+            names = self._names.get(tag_id)
+            if names and self._is_fresh(tag_id, now):
+                localized[tag_id] = names[choose_language(names, language)]
+        return localized
+
+    def clear(self) -> None:
+        self._names = {}
+        self._loaded_at = {}
+        self.version += 1
+        self.is_loaded = False
+
+    def _is_fresh(self, tag_id: int, now: float) -> bool:
+        ttl = settings.TAG_DICTIONARY_TTL
+        return not ttl or now - self._loaded_at[tag_id] < ttl
+
+    @classmethod
+    def _group(
+        cls, entries: Iterable[tuple[int, str, str]]
+    ) -> dict[int, dict[str, str]]:
+        """같은 언어의 별칭 코드(ja/jp)가 함께 있으면 lang_code 알파벳 순으로 앞선 이름을 씁니다."""
+        names: dict[int, dict[str, str]] = {}
+        for tag_id, lang_code, name in sorted(entries):
+            names.setdefault(tag_id, {}).setdefault(cls._language_key(lang_code), name)
+        return names
+
+    @staticmethod
+    def _language_key(lang_code: str) -> str:
+        return normalize_language_code(lang_code) or lang_code
+
+
+tag_dictionary = TagDictionary()
+
+
+async def load_tag_dictionary(db: AsyncSession) -> None:
+    """DB의 전체 태그명으로 태그 사전을 적재합니다."""
+    tag_dictionary.clear()
+    if not settings.TAG_DICTIONARY_ENABLED:
+        return
+
+    result = await db.execute(select(TagName.tag_id, TagName.lang_code, TagName.name))
+    tag_dictionary.load((tag_id, lang_code, name) for tag_id, lang_code, name in result)
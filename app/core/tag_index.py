@@ -0,0 +1,215 @@
+import heapq
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.company import CompanyTag
+from app.models.tag import TagName
+
+__all__ = [
+    "TagCompanyIndex",
+    "load_tag_company_index",
+    "tag_company_index",
+]
+
+# company.id 는 INTEGER UNSIGNED 이므로 4바이트 unsigned 배열에 저장합니다.
+_COMPANY_ID_TYPECODE = "I"
+
+
+class TagCompanyIndex:
+    """
+    tag_id -> 정렬된 company_id 배열(array('I'))의 인메모리 역색인입니다.
+
+    company_id를 파이썬 int 객체 대신 4바이트 배열로 저장해 링크 100만 개도
+    수 MB로 유지하며, 모든 언어의 태그명 -> tag_id 사전을 함께 둡니다.
+    태그명 사전은 DB 조회(utf8mb4_general_ci)와 같이 대소문자를 구분하지 않도록
+    casefold한 태그명을 키로 씁니다.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[int, array[int]] = {}
+        self._tag_ids_by_name: dict[str, set[int]] = {}
+        self.is_loaded = False
+
+    def load(
+        self,
+        links: Iterable[tuple[int, int]],
+        tag_names: Iterable[tuple[int, str]],
+    ) -> None:
+        """(company_id, tag_id) 링크와 (tag_id, 태그명) 목록으로 인덱스를 새로 구성합니다."""
+        company_ids_by_tag: dict[int, list[int]] = {}
+        for company_id, tag_id in links:
+            company_ids_by_tag.setdefault(tag_id, []).append(company_id)
+
+        postings: dict[int, array[int]] = {}
+        for tag_id, company_ids in company_ids_by_tag.items():
+            company_ids.sort()
+            postings[tag_id] = array(_COMPANY_ID_TYPECODE, company_ids)
+
+        tag_ids_by_name: dict[str, set[int]] = {}
+        for tag_id, name in tag_names:
+            tag_ids_by_name.setdefault(_name_key(name), set()).add(tag_id)
+
+        self._postings = postings
+        self._tag_ids_by_name = tag_ids_by_name
+        self.is_loaded = True
+
+    def add_link(self, company_id: int, tag_id: int) -> None:
+        posting = self._postings.setdefault(tag_id, array(_COMPANY_ID_TYPECODE))
+        position = bisect_left(posting, company_id)
+        if position == len(posting) or posting[position] != company_id:
+            posting.insert(position, company_id)
+
+    def remove_link(self, company_id: int, tag_id: int) -> None:
+        posting = self._postings.get(tag_id)
+        if posting is None:
+            return
+
+        position = bisect_left(posting, company_id)
+        if position < len(posting) and posting[position] == company_id:
+            del posting[position]
+
+    def add_tag_name(self, tag_id: int, name: str) -> None:
+        self._tag_ids_by_name.setdefault(_name_key(name), set()).add(tag_id)
+
+    def tag_ids(self, name: str) -> set[int]:
+        """태그명(모든 언어, 대소문자 무시)에 해당하는 tag_id 집합을 반환합니다."""
+        return self._tag_ids_by_name.get(_name_key(name), set())
+
+    def company_ids(self, tag_id: int) -> array[int]:
+        """tag_id 태그를 가진 company_id 정렬 배열을 반환합니다. (수정하지 마세요)"""
+        return self._postings.get(tag_id, array(_COMPANY_ID_TYPECODE))
+
+    def page_by_tag_name(
+        self, name: str, after_company_id: int, limit: int
+    ) -> list[int] | None:
+        """
+        태그명(모든 언어) 태그를 가진 company_id를 after_company_id 다음부터
+        오름차순으로 최대 limit개 반환합니다. 태그명이 없으면 None을 반환합니다.
+        TagRepository.get_company_page_by_tag_name과 같은 결과입니다.
+        """
+        tag_ids = self.tag_ids(name)
+        if not tag_ids:
+            return None
+
+        slices = []
+        for tag_id in tag_ids:
+            posting = self.company_ids(tag_id)
+            start = bisect_right(posting, after_company_id)
+            slices.append(posting[start : start + limit])
+
+        page: list[int] = []
+        for company_id in heapq.merge(*slices):
+            if page and page[-1] == company_id:
+                continue
+            page.append(company_id)
+            if len(page) == limit:
+                break
+        return page
+
+    def page_by_tag_query(
+        self,
+        all_names: list[str],
+        any_names: list[str],
+        none_names: list[str],
+        after_company_id: int,
+        limit: int,
+    ) -> list[int]:
+        """
+        all_names 태그를 모두 가지고, any_names 중 하나 이상을 가지며,
+        none_names 태그는 하나도 없는 company_id를 after_company_id 다음부터
+        오름차순으로 최대 limit개 반환합니다.
+        태그명마다 정렬된 company_id 목록을 만들어 가장 짧은 목록을 기준으로 병합합니다.
+        """
+        required = [
+            self._merged_company_ids(name) for name in _distinct_names(all_names)
+        ]
+        optional = (
+            self._merged_company_ids(*_distinct_names(any_names)) if any_names else None
+        )
+        excluded = self._merged_company_ids(*_distinct_names(none_names))
+
+        candidates = [*required, *([optional] if optional is not None else [])]
+        if not candidates:
+            return []
+        candidates.sort(key=len)
+        driver, others = candidates[0], candidates[1:]
+
+        page: list[int] = []
+        for position in range(bisect_right(driver, after_company_id), len(driver)):
+            company_id = driver[position]
+            if _contains(excluded, company_id):
+                continue
+            if all(_contains(other, company_id) for other in others):
+                page.append(company_id)
+                if len(page) == limit:
+                    break
+        return page
+
+    def _merged_company_ids(self, *names: str) -> Sequence[int]:
+        """태그명(모든 언어)들에 해당하는 company_id의 정렬된 합집합을 반환합니다."""
+        postings = [
+            self.company_ids(tag_id) for name in names for tag_id in self.tag_ids(name)
+        ]
+        if len(postings) == 1:
+            return postings[0]
+
+        merged: list[int] = []
+        for company_id in heapq.merge(*postings):
+            if not merged or merged[-1] != company_id:
+                merged.append(company_id)
+        return merged
+
+    def link_count(self) -> int:
+        return sum(len(posting) for posting in self._postings.values())
+
+    def memory_usage(self) -> int:
+        """배열과 사전이 차지하는 대략적인 메모리(bytes)를 반환합니다."""
+        size = sys.getsizeof(self._postings) + sys.getsizeof(self._tag_ids_by_name)
+        size += sum(sys.getsizeof(posting) for posting in self._postings.values())
+        size += sum(
+            sys.getsizeof(name) + sys.getsizeof(tag_ids)
+            for name, tag_ids in self._tag_ids_by_name.items()
+        )
+        return size
+
+    def clear(self) -> None:
+        self._postings = {}
+        self._tag_ids_by_name = {}
+        self.is_loaded = False
+
+
+def _name_key(name: str) -> str:
+    return name.casefold()
+
+
+def _distinct_names(names: Iterable[str]) -> set[str]:
+    """대소문자만 다른 태그명은 같은 태그명이므로 하나로 합칩니다."""
+    return {_name_key(name) for name in names}
+
+
+def _contains(sorted_ids: Sequence[int], company_id: int) -> bool:
+    position = bisect_left(sorted_ids, company_id)
+    return position < len(sorted_ids) and sorted_ids[position] == company_id
+
+
+tag_company_index = TagCompanyIndex()
+
+
+async def load_tag_company_index(db: AsyncSession) -> None:
+    """company_tag 전체 링크와 전체 태그명으로 태그 역색인을 적재합니다."""
+    tag_company_index.clear()
+    if not settings.TAG_INDEX_ENABLED:
+        return
+
+    links = await db.execute(select(CompanyTag.company_id, CompanyTag.tag_id))
+    tag_names = await db.execute(select(TagName.tag_id, TagName.name))
+    tag_company_index.load(
+        ((company_id, tag_id) for company_id, tag_id in links),
+        ((tag_id, name) for tag_id, name in tag_names),
+    )
@@ -7,3 +7,12 @@ def sort_tags_numerically(tag_names: list[str]) -> list[str]:
         return tuple(int(part) if part.isdigit() else part for part in parts)
 
     return sorted(tag_names, key=sort_key)
+
+
+def escape_like(value: str, escape_char: str = "\\") -> str:
+    """LIKE 패턴에서 특수 문자(%, _)를 리터럴로 취급하도록 이스케이프합니다."""
+    return (
+        value.replace(escape_char, escape_char * 2)
+        .replace("%", f"{escape_char}%")
+        .replace("_", f"{escape_char}_")
+    )
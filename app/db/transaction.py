@@ -4,6 +4,16 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    현재 트랜잭션이 커밋된 뒤 실행할 콜백을 등록합니다.
+    롤백되면 등록된 콜백은 실행되지 않고 버려집니다.
+    """
+    db.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
 
 def transactional[T](func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
     @wraps(func)
@@ -16,7 +26,16 @@ def transactional[T](func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitab
                 f"got {type(db)}"
             )
 
-        async with db.begin():
-            return await func(self, *args, **kwargs)
+        try:
+            async with db.begin():
+                result = await func(self, *args, **kwargs)
+        except Exception:
+            db.info.pop(_AFTER_COMMIT_KEY, None)
+            raise
+
+        for callback in db.info.pop(_AFTER_COMMIT_KEY, []):
+            callback()
+
+        return result
 
     return wrapper
@@ -4,18 +4,32 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.api.router import api_router
-from app.db.session import close_db, init_db
+from app.core.cache import clear_caches
+from app.core.search_index import load_company_name_indexes
+from app.core.tag_dictionary import load_tag_dictionary
+from app.core.tag_index import load_tag_company_index
+from app.db.session import close_db, get_async_session, init_db
+from app.services.tag_write_queue import tag_write_queue
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     애플리케이션 라이프사이클 관리
-    시작 시 데이터베이스 초기화, 종료 시 연결 정리
+    시작 시 데이터베이스 초기화 및 인메모리 인덱스 적재,
+    종료 시 대기 중인 비동기 태그 쓰기 적용 후 연결 정리
     """
 
     await init_db()
+
+    clear_caches()
+    async for session in get_async_session():
+        await load_company_name_indexes(session)
+        await load_tag_company_index(session)
+        await load_tag_dictionary(session)
+
     yield
+    await tag_write_queue.close()
     await close_db()
 
 
@@ -1,4 +1,11 @@
-from .company import Company, CompanyName, CompanyTag
+from .company import Company, CompanyName, CompanyProfile, CompanyTag
 from .tag import Tag, TagName
 
-__all__ = ["Company", "CompanyName", "CompanyTag", "Tag", "TagName"]
+__all__ = [
+    "Company",
+    "CompanyName",
+    "CompanyProfile",
+    "CompanyTag",
+    "Tag",
+    "TagName",
+]
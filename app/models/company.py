@@ -2,7 +2,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Index, PrimaryKeyConstraint, String, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.mysql import INTEGER
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, BasicDateTimeMixin, PrimaryKeyMixin
@@ -14,6 +22,14 @@ if TYPE_CHECKING:
 class Company(Base, PrimaryKeyMixin, BasicDateTimeMixin):
     __tablename__ = "company"
 
+    # 회사명/태그 변경 시 증가하는 버전 (조회 응답 ETag에 사용)
+    revision: Mapped[int] = mapped_column(
+        INTEGER(unsigned=True),  # type: ignore[no-untyped-call]
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     names: Mapped[list[CompanyName]] = relationship(
         back_populates="company", passive_deletes=True, cascade="all, delete-orphan"
     )
@@ -33,6 +49,8 @@ class CompanyName(Base, PrimaryKeyMixin, BasicDateTimeMixin):
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     lang_code: Mapped[str] = mapped_column(String(2), nullable=False)
+    # 초성 검색용 분해 문자열 (app.core.hangul.extract_chosung)
+    name_chosung: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     company: Mapped[Company] = relationship(
         back_populates="names", passive_deletes=True
@@ -43,6 +61,7 @@ class CompanyName(Base, PrimaryKeyMixin, BasicDateTimeMixin):
         UniqueConstraint("name", "lang_code", name="uq_companyname_name_lang"),
         Index("ix_companyname_name", "name"),
         Index("ix_companyname_lang_code", "lang_code"),
+        Index("ix_companyname_name_chosung", "name_chosung"),
         Index(
             "ix_companyname_name_fulltext",
             "name",
@@ -70,3 +89,32 @@ class CompanyTag(Base):
         Index("ix_companytag_company_id", "company_id"),
         Index("ix_companytag_tag_id", "tag_id"),
     )
+
+
+class CompanyProfile(Base):
+    """
+    언어별로 렌더링한 회사 프로필(회사명 + tag_id 순 태그명)입니다.
+    company_name/company_tag/tag_name에서 파생되며 서비스 쓰기 트랜잭션 안에서 갱신됩니다.
+    회사의 회사명/태그명에 등장하는 언어와 기본 언어(DEFAULT_LANGUAGE)마다 한 행을 둡니다.
+    """
+
+    __tablename__ = "company_profile"
+
+    company_id: Mapped[int] = mapped_column(
+        ForeignKey("company.id", ondelete="CASCADE"), nullable=False
+    )
+    lang_code: Mapped[str] = mapped_column(String(2), nullable=False)
+    company_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    tag_ids: Mapped[list[int]] = mapped_column(JSON, nullable=False)
+    tags: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    # 렌더링 시점의 company.revision (조회 응답 ETag에 사용)
+    revision: Mapped[int] = mapped_column(
+        INTEGER(unsigned=True),  # type: ignore[no-untyped-call]
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("company_id", "lang_code", name="pk_company_profile"),
+    )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.dialects.mysql import INTEGER
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, BasicDateTimeMixin, PrimaryKeyMixin
@@ -14,6 +15,14 @@ if TYPE_CHECKING:
 class Tag(Base, PrimaryKeyMixin, BasicDateTimeMixin):
     __tablename__ = "tag"
 
+    # 이 태그를 가진 회사 수 (company_tag 연결/해제 시 함께 증감)
+    usage_count: Mapped[int] = mapped_column(
+        INTEGER(unsigned=True),  # type: ignore[no-untyped-call]
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     names: Mapped[list[TagName]] = relationship(
         back_populates="tag", passive_deletes=True, cascade="all, delete-orphan"
     )
@@ -21,6 +30,8 @@ class Tag(Base, PrimaryKeyMixin, BasicDateTimeMixin):
         back_populates="tag", passive_deletes=True, cascade="all, delete-orphan"
     )
 
+    __table_args__ = (Index("ix_tag_usage_count", "usage_count"),)
+
 
 class TagName(Base, PrimaryKeyMixin, BasicDateTimeMixin):
     __tablename__ = "tag_name"
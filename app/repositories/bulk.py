@@ -0,0 +1,110 @@
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import insert, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import Base
+
+# 한 문장의 auto-increment id가 연속이려면 증가폭이 1이고 InnoDB가 simple insert의
+# id를 문장 단위로 한 번에 할당하는 lock mode(0: traditional, 1: consecutive)여야 합니다.
+# 2(interleaved, MySQL 8 기본값)에서는 동시에 실행되는 INSERT끼리 id가 섞일 수 있습니다.
+_CONSECUTIVE_AUTOINC_LOCK_MODES = (0, 1)
+
+# 서버 설정은 실행 중에 바뀌지 않으므로 처음 확인한 결과를 재사용합니다.
+_consecutive_auto_increment: bool | None = None
+
+
+async def _has_consecutive_auto_increment(db: AsyncSession) -> bool:
+    """multi-row INSERT 한 문장의 auto-increment id가 연속으로 할당되는지 확인합니다."""
+    global _consecutive_auto_increment
+
+    if _consecutive_auto_increment is None:
+        result = await db.execute(
+            text("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode")
+        )
+        increment, lock_mode = result.one()
+        _consecutive_auto_increment = (
+            increment == 1 and lock_mode in _CONSECUTIVE_AUTOINC_LOCK_MODES
+        )
+    return _consecutive_auto_increment
+
+
+def _chunks(rows: Sequence[dict[str, Any]]) -> Iterator[Sequence[dict[str, Any]]]:
+    for start in range(0, len(rows), settings.BULK_INSERT_CHUNK_SIZE):
+        yield rows[start : start + settings.BULK_INSERT_CHUNK_SIZE]
+
+
+async def insert_rows(
+    db: AsyncSession,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+    ignore: bool = False,
+) -> int:
+    """
+    rows를 BULK_INSERT_CHUNK_SIZE 행 단위의 multi-row INSERT로 적재하고
+    실제로 추가된 행 수를 반환합니다.
+    ignore=True면 INSERT IGNORE로 이미 있는 키(중복 연결 등)의 행은 건너뜁니다.
+    """
+    inserted = 0
+    for chunk in _chunks(rows):
+        stmt = insert(model).values(list(chunk))
+        if ignore:
+            stmt = stmt.prefix_with("IGNORE", dialect="mysql")
+        result = await db.execute(stmt)
+        inserted += result.rowcount
+    return inserted
+
+
+async def insert_rows_returning_ids(
+    db: AsyncSession, model: type[Base], rows: Sequence[dict[str, Any]]
+) -> list[int]:
+    """
+    고유 키가 없는 테이블(company, tag)의 행을 적재하고 생성된 auto-increment id를
+    rows 순서대로 반환합니다. 고유 키가 있으면 insert_rows_returning_ids_by_key를 쓰세요.
+
+    행 수가 정해진 INSERT ... VALUES(simple insert)는 auto_increment_increment=1,
+    innodb_autoinc_lock_mode가 0 또는 1이면 문장 단위로 id를 연속 할당하므로
+    multi-row INSERT 후 LAST_INSERT_ID()부터 행 수만큼을 id로 씁니다.
+    그 밖의 설정에서는 행마다 INSERT 해 각 행의 LAST_INSERT_ID()를 받습니다.
+    """
+    if len(rows) > 1 and not await _has_consecutive_auto_increment(db):
+        ids: list[int] = []
+        for row in rows:
+            result = await db.execute(insert(model).values(row))
+            ids.append(result.lastrowid)
+        return ids
+
+    ids = []
+    for chunk in _chunks(rows):
+        result = await db.execute(insert(model).values(list(chunk)))
+        first_id = result.lastrowid
+        ids.extend(range(first_id, first_id + len(chunk)))
+    return ids
+
+
+async def insert_rows_returning_ids_by_key(
+    db: AsyncSession,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+    key: Sequence[str],
+) -> list[int]:
+    """
+    insert_rows로 적재한 뒤 고유 키 컬럼(key)으로 id를 다시 읽어 rows 순서대로 반환합니다.
+    auto-increment 할당 방식(lock mode)과 관계없이 정확합니다.
+    """
+    await insert_rows(db, model, rows)
+
+    columns = model.__table__.c
+    key_columns = [columns[name] for name in key]
+    ids: dict[tuple[Any, ...], int] = {}
+    for chunk in _chunks(rows):
+        stmt = select(columns["id"], *key_columns).where(
+            tuple_(*key_columns).in_(
+                [tuple(row[name] for name in key) for row in chunk]
+            )
+        )
+        for id_, *values in await db.execute(stmt):
+            ids[tuple(values)] = id_
+    return [ids[tuple(row[name] for name in key)] for row in rows]
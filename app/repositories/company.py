@@ -1,102 +1,349 @@
-from sqlalchemy import select, text
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from sqlalchemy import case, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, with_loader_criteria
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
-from app.core.language import choose_language
+from app.core.hangul import extract_chosung
+from app.core.language import language_aliases
+from app.core.utils import escape_like
 from app.models.company import Company, CompanyName, CompanyTag
-from app.models.tag import Tag, TagName
+from app.models.tag import TagName
+from app.repositories.bulk import (
+    insert_rows_returning_ids,
+    insert_rows_returning_ids_by_key,
+)
+from app.repositories.language import language_priority
+
+
+class LocalizedCompanyProfile(NamedTuple):
+    company_id: int
+    company_name: str
+    tag_ids: list[int]
+    tags: list[str]
+    # 프로필을 만든 시점의 company.revision
+    revision: int
+
+
+def company_profile_load_options() -> tuple[ORMOption, ...]:
+    """
+    회사명과 태그 연결(company_tag)을 selectin 방식으로 함께 적재하는 로딩 옵션입니다.
+    태그명은 TagRepository.localize_tag_names(태그 사전)로 채웁니다.
+    """
+    return (selectinload(Company.names), selectinload(Company.tags))
 
 
 class CompanyRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def find_by_name(self, company_name: str, language: str) -> Company | None:
+    async def find_all_by_names(self, company_names: list[str]) -> dict[str, Company]:
+        """
+        회사명(모든 언어) 목록에 해당하는 회사를 회사명/태그와 함께 한 번에 조회합니다.
+        조회 쿼리 수는 회사명 개수와 관계없이 일정합니다.
+        같은 이름을 가진 회사가 여럿이면 company_id가 작은 회사를 사용합니다.
+        """
+        if not company_names:
+            return {}
+
         stmt = (
-            select(Company)
-            .distinct()
+            select(CompanyName.name, Company)
             .join(Company.names)
+            .where(CompanyName.name.in_(set(company_names)))
+            .order_by(Company.id)
+            .options(*company_profile_load_options())
+        )
+        result = await self.db.execute(stmt)
+
+        companies: dict[str, Company] = {}
+        for company_name, company in result.all():
+            companies.setdefault(company_name, company)
+        return companies
+
+    async def find_all_by_ids(self, company_ids: list[int]) -> list[Company]:
+        """company_ids 회사를 회사명/태그와 함께 company_id 순으로 조회합니다."""
+        if not company_ids:
+            return []
+
+        stmt = (
+            select(Company)
+            .where(Company.id.in_(company_ids))
+            .order_by(Company.id)
+            .options(*company_profile_load_options())
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_revisions(self, company_ids: list[int]) -> dict[int, int]:
+        """company_ids 회사의 company_id -> revision을 기본 키로만 조회합니다. (ETag용)"""
+        if not company_ids:
+            return {}
+
+        stmt = select(Company.id, Company.revision).where(Company.id.in_(company_ids))
+        return {
+            company_id: revision for company_id, revision in await self.db.execute(stmt)
+        }
+
+    async def get_revision_by_name(self, company_name: str) -> tuple[int, int] | None:
+        """회사명(모든 언어)으로 (company_id, revision)만 조회합니다. (ETag용)"""
+        stmt = (
+            select(CompanyName.company_id, Company.revision)
+            .join(Company, Company.id == CompanyName.company_id)
             .where(CompanyName.name == company_name)
-            .options(
-                selectinload(Company.names),
-                selectinload(Company.tags)
-                .selectinload(CompanyTag.tag)
-                .selectinload(Tag.names),
-                with_loader_criteria(
-                    TagName, TagName.lang_code == language, include_aliases=True
-                ),
+            .limit(1)
+        )
+        row = (await self.db.execute(stmt)).first()
+        return (row.company_id, row.revision) if row else None
+
+    async def get_localized_profile(
+        self, company_name: str, language: str
+    ) -> LocalizedCompanyProfile | None:
+        """
+        회사명과 태그 목록을 language 기준 fallback을 적용해 한 번의 쿼리로 조회합니다.
+        태그는 tag_id 순이며, 회사가 없으면 None을 반환합니다.
+        """
+        target = (
+            select(CompanyName.company_id, Company.revision)
+            .join(Company, Company.id == CompanyName.company_id)
+            .where(CompanyName.name == company_name)
+            .order_by(CompanyName.company_id)
+            .limit(1)
+            .cte("target")
+        )
+
+        localized_company_name = (
+            select(CompanyName.name)
+            .where(CompanyName.company_id == target.c.company_id)
+            .order_by(
+                language_priority(CompanyName.lang_code, language),
+                CompanyName.lang_code,
             )
+            .limit(1)
+            .scalar_subquery()
         )
 
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        ranked_tag_names = (
+            select(
+                CompanyTag.tag_id,
+                TagName.name.label("tag_name"),
+                func.row_number()
+                .over(
+                    partition_by=CompanyTag.tag_id,
+                    order_by=(
+                        language_priority(TagName.lang_code, language),
+                        TagName.lang_code,
+                    ),
+                )
+                .label("name_rank"),
+            )
+            .select_from(target)
+            .join(CompanyTag, CompanyTag.company_id == target.c.company_id)
+            .join(TagName, TagName.tag_id == CompanyTag.tag_id)
+            .subquery("ranked_tag_names")
+        )
+
+        stmt = (
+            select(
+                target.c.company_id,
+                target.c.revision,
+                localized_company_name.label("company_name"),
+                ranked_tag_names.c.tag_id,
+                ranked_tag_names.c.tag_name,
+            )
+            .select_from(
+                target.outerjoin(ranked_tag_names, ranked_tag_names.c.name_rank == 1)
+            )
+            .order_by(ranked_tag_names.c.tag_id)
+        )
+
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return None
+
+        tag_rows = [row for row in rows if row.tag_id is not None]
+        return LocalizedCompanyProfile(
+            company_id=rows[0].company_id,
+            company_name=rows[0].company_name,
+            tag_ids=[row.tag_id for row in tag_rows],
+            tags=[row.tag_name for row in tag_rows],
+            revision=rows[0].revision,
+        )
 
     async def search_by_name_pattern(
-        self, query: str, language: str
+        self, query: str, language: str, limit: int
     ) -> list[CompanyName]:
+        """
+        FULLTEXT(ngram)로 부분 일치하는 회사명을 상위 limit개만 조회합니다.
+        완전 일치 > 이름 prefix > 단어 prefix > 부분 일치 순으로 정렬한 뒤
+        FULLTEXT 관련도, 이름 길이, 등록 순서로 정렬합니다.
+        """
+        pattern = escape_like(query)
+        match_rank = case(
+            (CompanyName.name == query, 0),
+            (CompanyName.name.like(f"{pattern}%"), 1),
+            (CompanyName.name.like(f"% {pattern}%"), 2),
+            else_=3,
+        )
+
         stmt = (
             select(CompanyName)
             .where(
-                CompanyName.lang_code == language,
+                CompanyName.lang_code.in_(language_aliases(language)),
                 text("MATCH(name) AGAINST(:query IN BOOLEAN MODE)"),
             )
+            .order_by(
+                match_rank,
+                text("MATCH(name) AGAINST(:query IN BOOLEAN MODE) DESC"),
+                func.char_length(CompanyName.name),
+                CompanyName.id,
+            )
+            .limit(limit)
             .params(query=f"+{query}")
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_all_names(self) -> list[tuple[int, str, str]]:
+        stmt = select(CompanyName.id, CompanyName.name, CompanyName.lang_code)
+        result = await self.db.execute(stmt)
+        return [(name_id, name, lang_code) for name_id, name, lang_code in result]
+
+    async def get_ids_after(self, last_id: int, limit: int) -> list[int]:
+        """last_id보다 큰 company.id를 오름차순으로 최대 limit개 조회합니다."""
+        stmt = (
+            select(Company.id)
+            .where(Company.id > last_id)
+            .order_by(Company.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def search_by_name_prefix(
+        self, query: str, language: str, limit: int
+    ) -> list[CompanyName]:
+        """
+        ngram 토큰보다 짧은 질의용 prefix 검색입니다.
+        ix_companyname_name 인덱스 범위 스캔으로 query로 시작하는 회사명을 찾아
+        짧은 순으로 상위 limit개만 조회합니다.
+        """
+        stmt = (
+            select(CompanyName)
+            .where(
+                CompanyName.lang_code.in_(language_aliases(language)),
+                CompanyName.name.like(f"{escape_like(query)}%"),
+            )
+            .order_by(func.char_length(CompanyName.name), CompanyName.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def search_by_chosung_prefix(
+        self, query: str, language: str, limit: int
+    ) -> list[CompanyName]:
+        """
+        초성 질의(예: "ㅇㅌㄷ")로 시작하는 회사명을 짧은 순으로 조회합니다.
+        ix_companyname_name_chosung 인덱스 범위 스캔을 사용합니다.
+        """
+        stmt = (
+            select(CompanyName)
+            .where(
+                CompanyName.lang_code.in_(language_aliases(language)),
+                CompanyName.name_chosung.like(
+                    f"{escape_like(extract_chosung(query))}%"
+                ),
+            )
+            .order_by(func.char_length(CompanyName.name), CompanyName.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def create(self, company: Company) -> Company:
         self.db.add(company)
         await self.db.flush()
         return company
 
+    async def bulk_create(self, count: int) -> list[int]:
+        """회사 count개를 multi-row INSERT로 생성하고 company_id 목록을 반환합니다."""
+        return await insert_rows_returning_ids(
+            self.db, Company, [{"revision": 0}] * count
+        )
+
+    async def bulk_add_company_names(self, company_names: list[CompanyName]) -> None:
+        """
+        세션에 추가하지 않은 CompanyName 목록을 multi-row INSERT로 저장하고
+        (name, lang_code) 고유 키로 다시 읽은 id를 각 객체에 채웁니다.
+        """
+        name_ids = await insert_rows_returning_ids_by_key(
+            self.db,
+            CompanyName,
+            [
+                {
+                    "company_id": company_name.company_id,
+                    "name": company_name.name,
+                    "lang_code": company_name.lang_code,
+                    "name_chosung": company_name.name_chosung,
+                }
+                for company_name in company_names
+            ],
+            key=("name", "lang_code"),
+        )
+        for company_name, name_id in zip(company_names, name_ids, strict=True):
+            company_name.id = name_id
+
+    async def find_existing_names(self, company_names: Iterable[str]) -> set[str]:
+        """company_names 중 이미 등록된 회사명(모든 언어)을 한 번에 조회합니다."""
+        name_set = set(company_names)
+        if not name_set:
+            return set()
+
+        stmt = select(CompanyName.name).where(CompanyName.name.in_(name_set))
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
     async def exists_by_names(self, company_names: list[str]) -> bool:
         stmt = select(CompanyName).where(CompanyName.name.in_(company_names))
         result = await self.db.execute(stmt)
         return len(result.scalars().all()) > 0
 
-    async def get_company_id_by_name(self, company_name: str) -> int | None:
-        stmt = (
-            select(Company.id)
-            .join(CompanyName, Company.id == CompanyName.company_id)
+    async def find_names_by_company_name(
+        self, company_name: str
+    ) -> tuple[int, list[tuple[str, str]]] | None:
+        """
+        회사명(모든 언어)으로 (company_id, [(lang_code, 회사명), ...])을 한 번에 조회합니다.
+        회사가 없으면 None을 반환합니다.
+        """
+        target_company_id = (
+            select(CompanyName.company_id)
             .where(CompanyName.name == company_name)
+            .order_by(CompanyName.company_id)
+            .limit(1)
+            .scalar_subquery()
         )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        stmt = (
+            select(CompanyName.company_id, CompanyName.lang_code, CompanyName.name)
+            .where(CompanyName.company_id == target_company_id)
+            .order_by(CompanyName.lang_code)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return None
+        return rows[0].company_id, [(row.lang_code, row.name) for row in rows]
 
     async def add_company_name(
         self, company_id: int, name: str, lang_code: str
     ) -> CompanyName:
         company_name = CompanyName(
-            company_id=company_id, name=name, lang_code=lang_code
+            company_id=company_id,
+            name=name,
+            lang_code=lang_code,
+            name_chosung=extract_chosung(name),
         )
 
         self.db.add(company_name)
         await self.db.flush()
         return company_name
-
-    async def get_company_names_by_language(
-        self, company_id: int, lang_code: str
-    ) -> str | None:
-        stmt = select(CompanyName.name).where(
-            CompanyName.company_id == company_id,
-            CompanyName.lang_code == lang_code,
-        )
-        result = await self.db.execute(stmt)
-        direct_result = result.scalar_one_or_none()
-
-        if direct_result:
-            return direct_result
-
-        all_names_stmt = select(CompanyName).where(CompanyName.company_id == company_id)
-        all_names_result = await self.db.execute(all_names_stmt)
-        all_names = all_names_result.scalars().all()
-
-        if all_names:
-            available_langs = [name.lang_code for name in all_names]
-            chosen_lang = choose_language(available_langs, lang_code)
-            return next(
-                name.name for name in all_names if name.lang_code == chosen_lang
-            )
-
-        return None
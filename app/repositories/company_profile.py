@@ -0,0 +1,240 @@
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import ColumnElement, case, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.language import choose_language, normalize_language_code
+from app.models.company import Company, CompanyName, CompanyProfile, CompanyTag
+from app.models.tag import TagName
+from app.repositories.company import LocalizedCompanyProfile
+
+
+def _language_key(lang_code: str) -> str:
+    return normalize_language_code(lang_code) or lang_code
+
+
+class CompanyProfileRepository:
+    """
+    company_profile(언어별로 렌더링된 회사 프로필) 테이블을 다룹니다.
+    프로필 행이 없는 회사(backfill 전 데이터 등)는 None을 반환하므로
+    호출하는 쪽에서 원본 테이블 조회로 fallback 해야 합니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_by_company_name(
+        self, company_name: str, language: str
+    ) -> LocalizedCompanyProfile | None:
+        """회사명(모든 언어)으로 language 기준 프로필 한 행을 조회합니다."""
+        target_company_id = (
+            select(CompanyName.company_id)
+            .where(CompanyName.name == company_name)
+            .order_by(CompanyName.company_id)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        stmt = (
+            select(CompanyProfile)
+            .where(
+                CompanyProfile.company_id == target_company_id,
+                CompanyProfile.lang_code.in_(self._candidate_languages(language)),
+            )
+            .order_by(self._profile_priority(language))
+            .limit(1)
+        )
+        profile = (await self.db.execute(stmt)).scalar_one_or_none()
+        return self._to_localized(profile) if profile else None
+
+    async def find_by_company_ids(
+        self, company_ids: list[int], language: str
+    ) -> dict[int, LocalizedCompanyProfile]:
+        """company_ids 회사의 language 기준 프로필을 조회합니다. 없는 회사는 빠집니다."""
+        if not company_ids:
+            return {}
+
+        ranked_profiles = (
+            select(
+                CompanyProfile,
+                func.row_number()
+                .over(
+                    partition_by=CompanyProfile.company_id,
+                    order_by=self._profile_priority(language),
+                )
+                .label("profile_rank"),
+            )
+            .where(
+                CompanyProfile.company_id.in_(company_ids),
+                CompanyProfile.lang_code.in_(self._candidate_languages(language)),
+            )
+            .subquery("ranked_profiles")
+        )
+
+        stmt = select(
+            ranked_profiles.c.company_id,
+            ranked_profiles.c.company_name,
+            ranked_profiles.c.tag_ids,
+            ranked_profiles.c.tags,
+            ranked_profiles.c.revision,
+        ).where(ranked_profiles.c.profile_rank == 1)
+
+        result = await self.db.execute(stmt)
+        return {
+            row.company_id: LocalizedCompanyProfile(
+                company_id=row.company_id,
+                company_name=row.company_name,
+                tag_ids=row.tag_ids,
+                tags=row.tags,
+                revision=row.revision,
+            )
+            for row in result
+        }
+
+    async def refresh(
+        self, company_ids: Iterable[int], tag_ids: Iterable[int] = ()
+    ) -> set[int]:
+        """
+        company_ids 회사와 tag_ids 태그를 가진 회사의 revision을 올리고 프로필을
+        다시 렌더링한 뒤 갱신한 company_id 집합을 반환합니다.
+        쓰기 트랜잭션 안에서 호출해 원본 테이블 변경과 함께 커밋되도록 합니다.
+        """
+        await self.db.flush()
+
+        target_ids = set(company_ids)
+        tag_id_list = list(tag_ids)
+        if tag_id_list:
+            stmt = select(CompanyTag.company_id).where(
+                CompanyTag.tag_id.in_(tag_id_list)
+            )
+            target_ids.update((await self.db.execute(stmt)).scalars().all())
+
+        if target_ids:
+            # 프로필에 새 revision이 담기도록 렌더링 전에 올립니다.
+            await self.db.execute(
+                update(Company)
+                .where(Company.id.in_(target_ids))
+                .values(revision=Company.revision + 1)
+            )
+            await self.replace(target_ids, await self.render(target_ids))
+        return target_ids
+
+    async def render(self, company_ids: Iterable[int]) -> list[dict[str, Any]]:
+        """원본 테이블에서 company_ids 회사의 언어별 프로필 행을 렌더링합니다."""
+        id_list = list(company_ids)
+
+        company_names: dict[int, dict[str, str]] = {}
+        revisions: dict[int, int] = {}
+        names_stmt = (
+            select(
+                CompanyName.company_id,
+                Company.revision,
+                CompanyName.lang_code,
+                CompanyName.name,
+            )
+            .join(Company, Company.id == CompanyName.company_id)
+            .where(CompanyName.company_id.in_(id_list))
+            .order_by(CompanyName.company_id, CompanyName.lang_code)
+        )
+        for company_id, revision, lang_code, name in await self.db.execute(names_stmt):
+            revisions[company_id] = revision
+            company_names.setdefault(company_id, {}).setdefault(
+                _language_key(lang_code), name
+            )
+
+        company_tag_ids: dict[int, list[int]] = {}
+        tag_names: dict[int, dict[str, str]] = {}
+        tags_stmt = (
+            select(
+                CompanyTag.company_id,
+                CompanyTag.tag_id,
+                TagName.lang_code,
+                TagName.name,
+            )
+            .join(TagName, TagName.tag_id == CompanyTag.tag_id)
+            .where(CompanyTag.company_id.in_(id_list))
+            .order_by(CompanyTag.company_id, CompanyTag.tag_id, TagName.lang_code)
+        )
+        for company_id, tag_id, lang_code, name in await self.db.execute(tags_stmt):
+            tag_ids = company_tag_ids.setdefault(company_id, [])
+            if not tag_ids or tag_ids[-1] != tag_id:
+                tag_ids.append(tag_id)
+            tag_names.setdefault(tag_id, {}).setdefault(_language_key(lang_code), name)
+
+        rows = []
+        for company_id, names in company_names.items():
+            tag_ids = company_tag_ids.get(company_id, [])
+            languages = {
+                _language_key(settings.DEFAULT_LANGUAGE),
+                *names,
+                *(lang for tag_id in tag_ids for lang in tag_names[tag_id]),
+            }
+            for language in sorted(languages):
+                rows.append(
+                    {
+                        "company_id": company_id,
+                        "lang_code": language,
+                        "company_name": names[choose_language(names, language)],
+                        "tag_ids": tag_ids,
+                        "tags": [
+                            tag_names[tag_id][
+                                choose_language(tag_names[tag_id], language)
+                            ]
+                            for tag_id in tag_ids
+                        ],
+                        "revision": revisions[company_id],
+                    }
+                )
+        return rows
+
+    async def replace(
+        self, company_ids: Iterable[int], rows: list[dict[str, Any]]
+    ) -> None:
+        """company_ids 회사의 기존 프로필 행을 rows로 교체합니다."""
+        await self.db.execute(
+            delete(CompanyProfile).where(
+                CompanyProfile.company_id.in_(list(company_ids))
+            )
+        )
+        if rows:
+            await self.db.execute(insert(CompanyProfile), rows)
+
+    async def get_rows(self, company_ids: Iterable[int]) -> list[dict[str, Any]]:
+        """저장된 프로필 행을 render()와 같은 형식으로 조회합니다."""
+        stmt = (
+            select(CompanyProfile)
+            .where(CompanyProfile.company_id.in_(list(company_ids)))
+            .order_by(CompanyProfile.company_id, CompanyProfile.lang_code)
+        )
+        return [
+            {
+                "company_id": profile.company_id,
+                "lang_code": profile.lang_code,
+                "company_name": profile.company_name,
+                "tag_ids": profile.tag_ids,
+                "tags": profile.tags,
+                "revision": profile.revision,
+            }
+            for profile in (await self.db.execute(stmt)).scalars()
+        ]
+
+    @staticmethod
+    def _candidate_languages(language: str) -> list[str]:
+        return [_language_key(language), _language_key(settings.DEFAULT_LANGUAGE)]
+
+    @staticmethod
+    def _profile_priority(language: str) -> ColumnElement[int]:
+        """요청 언어 행이 있으면 그 행을, 없으면 기본 언어 행을 우선합니다."""
+        return case((CompanyProfile.lang_code == _language_key(language), 0), else_=1)
+
+    @staticmethod
+    def _to_localized(profile: CompanyProfile) -> LocalizedCompanyProfile:
+        return LocalizedCompanyProfile(
+            company_id=profile.company_id,
+            company_name=profile.company_name,
+            tag_ids=profile.tag_ids,
+            tags=profile.tags,
+            revision=profile.revision,
+        )
@@ -1,18 +1,65 @@
-from sqlalchemy import delete, select
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+from sqlalchemy import and_, case, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.company import CompanyTag
+from app.core.tag_index import tag_company_index
+from app.db.transaction import after_commit
+from app.models.company import CompanyName, CompanyTag
+from app.models.tag import Tag, TagName
+from app.repositories.bulk import insert_rows
 
 
 class CompanyTagRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def create_relation(self, company_id: int, tag_id: int) -> CompanyTag:
-        company_tag = CompanyTag(company_id=company_id, tag_id=tag_id)
-        self.db.add(company_tag)
-        await self.db.flush()
-        return company_tag
+    async def bulk_create_relations(self, links: list[tuple[int, int]]) -> None:
+        """
+        (company_id, tag_id) 링크를 multi-row INSERT IGNORE로 생성하고
+        태그별 usage_count를 한 번의 UPDATE로 증가시킵니다.
+        이미 있는 링크(동시 요청 등)는 건너뛰며, 그런 링크가 있었다면
+        해당 태그들의 usage_count는 company_tag에서 다시 집계합니다.
+        """
+        if not links:
+            return
+
+        inserted = await insert_rows(
+            self.db,
+            CompanyTag,
+            [
+                {"company_id": company_id, "tag_id": tag_id}
+                for company_id, tag_id in links
+            ],
+            ignore=True,
+        )
+
+        added_counts = Counter(tag_id for _, tag_id in links)
+        if inserted == len(links):
+            await self.increment_usage(added_counts)
+        else:
+            await self._recount_usage(added_counts)
+
+        def index() -> None:
+            for company_id, tag_id in links:
+                tag_company_index.add_link(company_id, tag_id)
+
+        after_commit(self.db, index)
+
+    async def increment_usage(self, tag_counts: Mapping[int, int]) -> None:
+        """태그별 usage_count를 tag_counts만큼 한 번의 UPDATE로 증가시킵니다."""
+        if not tag_counts:
+            return
+
+        await self.db.execute(
+            update(Tag)
+            .where(Tag.id.in_(list(tag_counts)))
+            .values(
+                usage_count=Tag.usage_count
+                + case(dict(tag_counts), value=Tag.id, else_=0)
+            )
+        )
 
     async def exists_relation(self, company_id: int, tag_id: int) -> bool:
         stmt = select(CompanyTag).where(
@@ -21,11 +68,84 @@ class CompanyTagRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
 
-    async def delete_relation(self, company_id: int, tag_id: int) -> None:
-        stmt = delete(CompanyTag).where(
-            CompanyTag.company_id == company_id, CompanyTag.tag_id == tag_id
+    async def delete_relations(self, company_id: int, tag_ids: list[int]) -> None:
+        """
+        company_id 회사의 tag_ids 연결을 한 문장으로 삭제하고 usage_count를 감소시킵니다.
+        이미 없던 연결(동시 요청 등)이 있었다면 해당 태그들의 usage_count는 다시 집계합니다.
+        """
+        if not tag_ids:
+            return
+
+        result = await self.db.execute(
+            delete(CompanyTag).where(
+                CompanyTag.company_id == company_id, CompanyTag.tag_id.in_(tag_ids)
+            )
+        )
+        if result.rowcount == len(tag_ids):
+            await self.db.execute(
+                update(Tag)
+                .where(Tag.id.in_(tag_ids), Tag.usage_count > 0)
+                .values(usage_count=Tag.usage_count - 1)
+            )
+        else:
+            await self._recount_usage(tag_ids)
+
+        def unindex() -> None:
+            for tag_id in tag_ids:
+                tag_company_index.remove_link(company_id, tag_id)
+
+        after_commit(self.db, unindex)
+
+    async def find_linked_tag_ids(
+        self, company_name: str, tag_names: Iterable[str]
+    ) -> tuple[int, list[int]] | None:
+        """
+        회사명(모든 언어)의 company_id와, tag_names(모든 언어) 중 그 회사에 연결된
+        tag_id 목록을 한 번의 쿼리로 조회합니다. 회사가 없으면 None을 반환합니다.
+        """
+        target = (
+            select(CompanyName.company_id)
+            .where(CompanyName.name == company_name)
+            .order_by(CompanyName.company_id)
+            .limit(1)
+            .subquery("target")
+        )
+        linked_tags = CompanyTag.__table__.join(
+            TagName.__table__,
+            and_(
+                TagName.tag_id == CompanyTag.tag_id,
+                TagName.name.in_(set(tag_names)),
+            ),
+        )
+
+        stmt = (
+            select(target.c.company_id, CompanyTag.tag_id)
+            .distinct()
+            .select_from(
+                target.outerjoin(
+                    linked_tags, CompanyTag.company_id == target.c.company_id
+                )
+            )
+            .order_by(CompanyTag.tag_id)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return None
+        return rows[0].company_id, [row.tag_id for row in rows if row.tag_id]
+
+    async def _recount_usage(self, tag_ids: Iterable[int]) -> None:
+        """tag_ids 태그의 usage_count를 company_tag에서 다시 집계합니다."""
+        linked_count = (
+            select(func.count())
+            .where(CompanyTag.tag_id == Tag.id)
+            .correlate(Tag)
+            .scalar_subquery()
+        )
+        await self.db.execute(
+            update(Tag)
+            .where(Tag.id.in_(list(tag_ids)))
+            .values(usage_count=linked_count)
         )
-        await self.db.execute(stmt)
 
     async def get_tag_ids_by_company_id(self, company_id: int) -> list[int]:
         stmt = select(CompanyTag.tag_id).where(CompanyTag.company_id == company_id)
@@ -0,0 +1,19 @@
+from sqlalchemy import ColumnElement, case
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.config import settings
+from app.core.language import language_aliases
+
+
+def language_priority(
+    lang_code: InstrumentedAttribute[str], language: str
+) -> ColumnElement[int]:
+    """
+    choose_language와 같은 fallback 순서(요청 언어 > 기본 언어 > 그 외)의 SQL 정렬 키입니다.
+    동순위는 lang_code 알파벳 순으로 정렬해 사용합니다.
+    """
+    return case(
+        (lang_code.in_(language_aliases(language)), 0),
+        (lang_code.in_(language_aliases(settings.DEFAULT_LANGUAGE)), 1),
+        else_=2,
+    )
@@ -1,15 +1,125 @@
-from sqlalchemy import and_, or_, select
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from sqlalchemy import and_, case, func, literal, select, true, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.language import choose_language
-from app.models.company import Company, CompanyTag
+from app.core.tag_dictionary import TagDictionary, tag_dictionary
+from app.core.tag_index import tag_company_index
+from app.db.transaction import after_commit
+from app.models.company import CompanyTag
 from app.models.tag import Tag, TagName
+from app.repositories.bulk import insert_rows, insert_rows_returning_ids
+from app.repositories.language import language_priority
+
+
+class ResolvedTags(NamedTuple):
+    # 요청 순서의 tag_id
+    tag_ids: list[int]
+    # 새로 생성한 tag_id
+    created_tag_ids: set[int]
+    # 새 언어 태그명이 추가된 기존 tag_id
+    renamed_tag_ids: set[int]
+
+
+class TagNameLookup:
+    """
+    (lang_code, 태그명) -> tag_id, tag_id -> {lang_code: 태그명} 사전입니다.
+    resolve_tag_names가 기존 태그를 찾고 새로 만든 태그/태그명을 반영합니다.
+    """
+
+    def __init__(self) -> None:
+        self.tag_id_by_pair: dict[tuple[str, str], int] = {}
+        self.names_by_tag_id: dict[int, dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names_by_tag_id)
+
+    def add(self, tag_id: int, lang_code: str, name: str) -> None:
+        """태그명을 추가합니다. 같은 쌍이 여러 태그에 있으면 먼저 추가한 태그를 씁니다."""
+        self.tag_id_by_pair.setdefault((lang_code, name), tag_id)
+        self.names_by_tag_id.setdefault(tag_id, {}).setdefault(lang_code, name)
+
+    def match(self, names: dict[str, str]) -> int | None:
+        """names의 쌍 중 처음으로 일치하는 태그의 id를 반환합니다."""
+        return next(
+            (
+                self.tag_id_by_pair[pair]
+                for pair in names.items()
+                if pair in self.tag_id_by_pair
+            ),
+            None,
+        )
+
+    def replace_tag_id(self, temp_id: int, tag_id: int) -> None:
+        """임시 id로 추가한 태그명을 생성된 tag_id로 옮깁니다."""
+        names = self.names_by_tag_id.pop(temp_id, {})
+        self.names_by_tag_id[tag_id] = names
+        for pair in names.items():
+            if self.tag_id_by_pair[pair] == temp_id:
+                self.tag_id_by_pair[pair] = tag_id
+
+
+async def resolve_tag_names(
+    db: AsyncSession, lookup: TagNameLookup, tag_names_list: list[dict[str, str]]
+) -> tuple[ResolvedTags, dict[int, dict[str, str]]]:
+    """
+    태그 요청을 lookup으로 기존 태그에 대응시키고, 없는 태그와 기존 태그에 없는 언어의
+    태그명은 multi-row INSERT로 생성해 lookup에도 반영합니다.
+    (lang_code, 태그명) 쌍이 하나라도 같으면 같은 태그로 보며 요청끼리도 마찬가지입니다.
+    (결과, 추가한 tag_id -> {lang_code: 태그명})을 반환합니다.
+    """
+    # 새 태그는 id를 받기 전까지 음수 임시 id로 구분합니다.
+    new_tag_ids: list[int] = []
+    added_names: dict[int, dict[str, str]] = {}
+    resolved: list[int] = []
+    for names in tag_names_list:
+        tag_id = lookup.match(names)
+        if tag_id is None:
+            tag_id = -(len(new_tag_ids) + 1)
+            new_tag_ids.append(tag_id)
+
+        for lang_code, name in names.items():
+            if lang_code not in lookup.names_by_tag_id.get(tag_id, {}):
+                added_names.setdefault(tag_id, {})[lang_code] = name
+                lookup.add(tag_id, lang_code, name)
+        resolved.append(tag_id)
+
+    created_ids = await insert_rows_returning_ids(
+        db, Tag, [{"usage_count": 0}] * len(new_tag_ids)
+    )
+    real_ids = dict(zip(new_tag_ids, created_ids, strict=True))
+    for temp_id, tag_id in real_ids.items():
+        lookup.replace_tag_id(temp_id, tag_id)
+    added_names = {
+        real_ids.get(tag_id, tag_id): names for tag_id, names in added_names.items()
+    }
+
+    await insert_rows(
+        db,
+        TagName,
+        [
+            {"tag_id": tag_id, "lang_code": lang_code, "name": name}
+            for tag_id, names in added_names.items()
+            for lang_code, name in names.items()
+        ],
+    )
+    return (
+        ResolvedTags(
+            tag_ids=[real_ids.get(tag_id, tag_id) for tag_id in resolved],
+            created_tag_ids=set(created_ids),
+            renamed_tag_ids=set(added_names) - set(created_ids),
+        ),
+        added_names,
+    )
 
 
 class TagRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        # 현재 트랜잭션에서 태그명을 쓴 tag_id. 커밋 전이므로 태그 사전 대신 DB에서 읽습니다.
+        self._written_tag_ids: set[int] = set()
 
     async def find_by_name(self, tag_name: str) -> Tag | None:
         stmt = (
@@ -21,137 +131,277 @@ class TagRepository:
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
-    async def find_by_names(
-        self, tag_names: dict[str, str]
-    ) -> tuple[int, set[str]] | None:
-        if not tag_names:
-            return None
-
-        tag_conditions = []
-        for lang_code, tag_name in tag_names.items():
-            tag_conditions.append(
-                and_(TagName.name == tag_name, TagName.lang_code == lang_code)
-            )
+    async def find_all_by_name_pairs(
+        self, name_pairs: Iterable[tuple[str, str]]
+    ) -> dict[int, dict[str, str]]:
+        """
+        (lang_code, 태그명) 쌍 중 하나라도 가진 태그의 전체 태그명을
+        tag_id -> {lang_code: 태그명} 형태로 한 번에 조회합니다.
+        """
+        pair_list = list(set(name_pairs))
+        if not pair_list:
+            return {}
 
+        matched_tag_ids = select(TagName.tag_id).where(
+            TagName.name.in_({name for _, name in pair_list}),
+            tuple_(TagName.lang_code, TagName.name).in_(pair_list),
+        )
         stmt = (
-            select(Tag)
-            .join(TagName)
-            .where(or_(*tag_conditions))
-            .options(selectinload(Tag.names))
+            select(TagName.tag_id, TagName.lang_code, TagName.name)
+            .where(TagName.tag_id.in_(matched_tag_ids))
+            .order_by(TagName.tag_id, TagName.lang_code)
         )
-        result = await self.db.execute(stmt)
-        existing_tags = result.scalars().all()
 
-        for tag in existing_tags:
-            tag_lang_names = {(tn.lang_code, tn.name) for tn in tag.names}
-            requested_lang_names = {
-                (lang_code, tag_name) for lang_code, tag_name in tag_names.items()
-            }
+        tag_names: dict[int, dict[str, str]] = {}
+        for tag_id, lang_code, name in await self.db.execute(stmt):
+            tag_names.setdefault(tag_id, {})[lang_code] = name
+        return tag_names
 
-            if requested_lang_names.intersection(tag_lang_names):
-                existing_lang_codes = {tn.lang_code for tn in tag.names}
-                return (tag.id, existing_lang_codes)
+    async def resolve_all(self, tag_names_list: list[dict[str, str]]) -> ResolvedTags:
+        """
+        여러 태그 요청을 한 번의 조회로 기존 태그에 대응시키고, 없는 태그와 기존 태그에
+        없는 언어의 태그명은 multi-row INSERT로 생성합니다.
+        (lang_code, 태그명) 쌍이 하나라도 같으면 같은 태그로 보며 요청끼리도 마찬가지입니다.
+        """
+        tag_names = await self.find_all_by_name_pairs(
+            pair for names in tag_names_list for pair in names.items()
+        )
+        lookup = TagNameLookup()
+        for tag_id, names in tag_names.items():
+            for lang_code, name in names.items():
+                lookup.add(tag_id, lang_code, name)
 
-        return None
+        resolved, added_names = await resolve_tag_names(self.db, lookup, tag_names_list)
+        for tag_id, names in added_names.items():
+            self._publish_tag_names(
+                tag_id, names, is_new_tag=tag_id in resolved.created_tag_ids
+            )
+        return resolved
 
-    async def create_with_names(self, tag_names: dict[str, str]) -> Tag:
-        new_tag = Tag()
-        self.db.add(new_tag)
-        await self.db.flush()
+    def _publish_tag_names(
+        self, tag_id: int, tag_names: dict[str, str], is_new_tag: bool
+    ) -> None:
+        """커밋 후 태그 역색인과 태그 사전에 새 태그명을 반영합니다."""
+        if not tag_names:
+            return
 
-        for lang_code, tag_name in tag_names.items():
-            tag_name_obj = TagName(
-                tag_id=new_tag.id, name=tag_name, lang_code=lang_code
-            )
-            self.db.add(tag_name_obj)
+        self._written_tag_ids.add(tag_id)
+
+        def publish() -> None:
+            for name in tag_names.values():
+                tag_company_index.add_tag_name(tag_id, name)
+            if is_new_tag:
+                tag_dictionary.add_tag(tag_id, tag_names)
+            else:
+                tag_dictionary.add_names(tag_id, tag_names)
 
-        return new_tag
+        after_commit(self.db, publish)
 
-    async def add_missing_tag_names(
+    async def get_company_page_by_tag_name(
+        self, tag_name: str, after_company_id: int, limit: int
+    ) -> list[int] | None:
+        """
+        tag_name(모든 언어) 태그를 가진 company_id를 after_company_id 다음부터
+        오름차순으로 최대 limit개 조회합니다. 태그 존재 확인과 같은 쿼리로 처리하며,
+        태그가 없으면 None을 반환합니다.
+        """
+        tag_found = (
+            select(literal(1).label("found"))
+            .where(TagName.name == tag_name)
+            .limit(1)
+            .subquery("tag_found")
+        )
+        page = (
+            select(CompanyTag.company_id)
+            .distinct()
+            .join(TagName, TagName.tag_id == CompanyTag.tag_id)
+            .where(TagName.name == tag_name, CompanyTag.company_id > after_company_id)
+            .order_by(CompanyTag.company_id)
+            .limit(limit)
+            .subquery("page")
+        )
+
+        stmt = (
+            select(tag_found.c.found, page.c.company_id)
+            .select_from(tag_found.outerjoin(page, true()))
+            .order_by(page.c.company_id)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return None
+        return [row.company_id for row in rows if row.company_id is not None]
+
+    async def get_company_page_by_tag_query(
         self,
-        tag_id: int,
-        existing_lang_codes: set[str],
-        tag_names: dict[str, str],
-    ) -> None:
-        for lang_code, tag_name in tag_names.items():
-            if lang_code not in existing_lang_codes:
-                new_tag_name = TagName(
-                    tag_id=tag_id, name=tag_name, lang_code=lang_code
-                )
-                self.db.add(new_tag_name)
+        all_names: list[str],
+        any_names: list[str],
+        none_names: list[str],
+        after_company_id: int,
+        limit: int,
+    ) -> list[int]:
+        """
+        all_names 태그를 모두 가지고, any_names 중 하나 이상을 가지며,
+        none_names 태그는 하나도 없는 company_id를 after_company_id 다음부터
+        오름차순으로 최대 limit개 조회합니다.
+        company_tag를 회사별로 묶어 HAVING COUNT 조건으로 한 번에 처리합니다.
+        """
+        # 태그명 비교는 대소문자를 구분하지 않으므로(utf8mb4_general_ci) 대소문자만
+        # 다른 태그명은 하나로 합쳐 all 조건의 태그명 수를 셉니다.
+        all_set, any_set, none_set = (
+            set({name.casefold(): name for name in names}.values())
+            for names in (all_names, any_names, none_names)
+        )
+
+        conditions = [
+            func.count(func.distinct(case((TagName.name.in_(all_set), TagName.name))))
+            == len(all_set)
+        ]
+        if any_set:
+            conditions.append(func.count(case((TagName.name.in_(any_set), 1))) > 0)
+        if none_set:
+            conditions.append(func.count(case((TagName.name.in_(none_set), 1))) == 0)
 
-    async def get_companies_by_tag_name(self, tag_name: str) -> list[Company]:
         stmt = (
-            select(Company)
-            .join(Company.tags)
-            .join(CompanyTag.tag)
-            .join(Tag.names)
-            .where(TagName.name == tag_name)
-            .options(
-                selectinload(Company.names),
-                selectinload(Company.tags)
-                .selectinload(CompanyTag.tag)
-                .selectinload(Tag.names),
+            select(CompanyTag.company_id)
+            .join(TagName, TagName.tag_id == CompanyTag.tag_id)
+            .where(
+                TagName.name.in_(all_set | any_set | none_set),
+                CompanyTag.company_id > after_company_id,
             )
+            .group_by(CompanyTag.company_id)
+            .having(and_(*conditions))
+            .order_by(CompanyTag.company_id)
+            .limit(limit)
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_top_tags(self, language: str, limit: int) -> list[tuple[str, int]]:
+        """
+        usage_count 상위 limit개 태그의 (language 기준 태그명, usage_count)를 조회합니다.
+        태그명은 요청 언어 > 기본 언어 > lang_code 알파벳 순으로 fallback 합니다.
+        """
+        top_tags = (
+            select(Tag.id, Tag.usage_count)
+            .where(Tag.usage_count > 0)
+            .order_by(Tag.usage_count.desc(), Tag.id)
+            .limit(limit)
+            .subquery("top_tags")
+        )
+        ranked_tag_names = (
+            select(
+                TagName.tag_id,
+                TagName.name,
+                func.row_number()
+                .over(
+                    partition_by=TagName.tag_id,
+                    order_by=(
+                        language_priority(TagName.lang_code, language),
+                        TagName.lang_code,
+                    ),
+                )
+                .label("name_rank"),
+            )
+            .where(TagName.tag_id.in_(select(top_tags.c.id)))
+            .subquery("ranked_tag_names")
+        )
+
+        stmt = (
+            select(ranked_tag_names.c.name, top_tags.c.usage_count)
+            .select_from(top_tags)
+            .join(
+                ranked_tag_names,
+                (ranked_tag_names.c.tag_id == top_tags.c.id)
+                & (ranked_tag_names.c.name_rank == 1),
+            )
+            .order_by(top_tags.c.usage_count.desc(), top_tags.c.id)
+        )
+        result = await self.db.execute(stmt)
+        return [(name, usage_count) for name, usage_count in result.all()]
+
+    async def recount_usage(self) -> None:
+        """company_tag를 집계해 모든 태그의 usage_count를 다시 계산합니다. (일괄 적재용)"""
+        linked_count = (
+            select(func.count())
+            .where(CompanyTag.tag_id == Tag.id)
+            .correlate(Tag)
+            .scalar_subquery()
+        )
+        await self.db.execute(update(Tag).values(usage_count=linked_count))
+
     async def get_tag_names_by_ids(
         self, tag_ids: list[int], language: str
     ) -> dict[int, str]:
+        """
+        태그명을 요청 언어 > 기본 언어 > lang_code 알파벳 순 fallback으로 조회합니다.
+        fallback이 필요한 태그 수와 관계없이 한 번의 쿼리로 처리합니다.
+        """
         if not tag_ids:
             return {}
 
-        stmt = select(TagName.tag_id, TagName.name).where(
-            TagName.tag_id.in_(tag_ids), TagName.lang_code == language
-        )
-        result = await self.db.execute(stmt)
-        direct_results = {tag_id: name for tag_id, name in result.all()}
-
-        missing_tag_ids = set(tag_ids) - set(direct_results.keys())
-        if missing_tag_ids:
-            fallback_stmt = (
-                select(Tag)
-                .where(Tag.id.in_(missing_tag_ids))
-                .options(selectinload(Tag.names))
+        ranked_tag_names = (
+            select(
+                TagName.tag_id,
+                TagName.name,
+                func.row_number()
+                .over(
+                    partition_by=TagName.tag_id,
+                    order_by=(
+                        language_priority(TagName.lang_code, language),
+                        TagName.lang_code,
+                    ),
+                )
+                .label("name_rank"),
             )
-            fallback_result = await self.db.execute(fallback_stmt)
-            tags = fallback_result.scalars().all()
-
-            for tag in tags:
-                if tag.names:
-                    available_langs = [name.lang_code for name in tag.names]
-                    chosen_lang = choose_language(available_langs, language)
-                    chosen_name = next(
-                        name.name for name in tag.names if name.lang_code == chosen_lang
-                    )
-                    direct_results[tag.id] = chosen_name
-
-        return direct_results
-
-    async def get_tag_names_by_company_id(
-        self, company_id: int, language: str
-    ) -> list[str]:
-        stmt = (
-            select(TagName.name)
-            .join(Tag)
-            .join(CompanyTag)
-            .where(CompanyTag.company_id == company_id, TagName.lang_code == language)
-            .order_by(CompanyTag.tag_id)
+            .where(TagName.tag_id.in_(tag_ids))
+            .subquery("ranked_tag_names")
         )
-        result = await self.db.execute(stmt)
-        return [name for name in result.scalars().all()]
 
-    async def find_tag_by_company_and_name(
-        self, company_id: int, tag_name: str
-    ) -> Tag | None:
-        stmt = (
-            select(Tag)
-            .join(CompanyTag)
-            .join(TagName)
-            .where(CompanyTag.company_id == company_id, TagName.name == tag_name)
-            .options(selectinload(Tag.names))
+        stmt = select(ranked_tag_names.c.tag_id, ranked_tag_names.c.name).where(
+            ranked_tag_names.c.name_rank == 1
         )
         result = await self.db.execute(stmt)
-        return result.scalars().first()
+        return {tag_id: name for tag_id, name in result.all()}
+
+    async def localize_tag_names(
+        self, tag_ids: Iterable[int], language: str
+    ) -> dict[int, str]:
+        """
+        get_tag_names_by_ids와 같은 결과를 태그 사전에서 반환합니다.
+        사전에 없는 태그는 전체 태그명을 한 번에 읽어 사전에 채우고,
+        현재 트랜잭션에서 태그명을 쓴 태그는 DB에서 읽습니다.
+        """
+        id_list = list(dict.fromkeys(tag_ids))
+        if not tag_dictionary.is_loaded:
+            return await self.get_tag_names_by_ids(id_list, language)
+
+        localized = tag_dictionary.localize(
+            (tag_id for tag_id in id_list if tag_id not in self._written_tag_ids),
+            language,
+        )
+        missing_ids = [tag_id for tag_id in id_list if tag_id not in localized]
+        unknown_ids = [
+            tag_id for tag_id in missing_ids if tag_id not in self._written_tag_ids
+        ]
+        written_ids = [
+            tag_id for tag_id in missing_ids if tag_id in self._written_tag_ids
+        ]
+
+        if unknown_ids:
+            version = tag_dictionary.version
+            stmt = select(TagName.tag_id, TagName.lang_code, TagName.name).where(
+                TagName.tag_id.in_(unknown_ids)
+            )
+            entries = [
+                (tag_id, lang_code, name)
+                for tag_id, lang_code, name in await self.db.execute(stmt)
+            ]
+            tag_dictionary.store(entries, version=version)
+
+            fetched = TagDictionary()
+            fetched.load(entries)
+            localized.update(fetched.localize(unknown_ids, language))
+
+        if written_ids:
+            localized.update(await self.get_tag_names_by_ids(written_ids, language))
+        return localized
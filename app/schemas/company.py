@@ -1,5 +1,15 @@
-from pydantic import BaseModel, ConfigDict, RootModel, model_validator
+from typing import Literal
 
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    field_validator,
+    model_validator,
+)
+
+from app.core.config import settings
 from app.core.language import validate_language_code
 from app.schemas.base import ResponseModel
 
@@ -36,3 +46,49 @@ class CreateTagRequest(BaseModel):
 class CreateCompanyRequest(BaseModel):
     company_name: DynamicLanguageModel
     tags: list[CreateTagRequest]
+
+
+class BatchGetCompaniesRequest(BaseModel):
+    names: list[str] = Field(
+        min_length=1,
+        max_length=settings.COMPANY_BATCH_MAX_SIZE,
+        description="조회할 회사명 목록 (모든 언어)",
+    )
+    language: str | None = Field(
+        default=None, description="응답 언어 (없으면 x-wanted-language 헤더)"
+    )
+
+    @field_validator("language")
+    @classmethod
+    def _validate_language(cls, language: str | None) -> str | None:
+        if language is not None and not validate_language_code(language):
+            raise ValueError("Invalid language code")
+        return language
+
+
+class BatchCompanyResult(ResponseModel):
+    name: str
+    found: bool
+    company: CompanyResponse | None = None
+
+
+class BatchGetCompaniesResponse(ResponseModel):
+    results: list[BatchCompanyResult]
+
+
+class BatchCreateCompaniesRequest(BaseModel):
+    companies: list[CreateCompanyRequest] = Field(
+        min_length=1,
+        max_length=settings.COMPANY_BATCH_CREATE_MAX_SIZE,
+        description="생성할 회사 목록",
+    )
+
+
+class BatchCreateCompanyResult(ResponseModel):
+    # created: 생성, exists: 이미 등록된 회사명, duplicate: 앞선 항목과 회사명 중복
+    status: Literal["created", "exists", "duplicate"]
+    company: CompanyResponse | None = None
+
+
+class BatchCreateCompaniesResponse(ResponseModel):
+    results: list[BatchCreateCompanyResult]
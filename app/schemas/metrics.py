@@ -0,0 +1,32 @@
+from app.schemas.base import ResponseModel
+
+
+class EndpointCacheStatsResponse(ResponseModel):
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class CacheStatsResponse(ResponseModel):
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+    endpoints: dict[str, EndpointCacheStatsResponse]
+
+
+class TagWriteQueueStatsResponse(ResponseModel):
+    enabled: bool
+    pending: int
+    submitted: int
+    applied: int
+    failed: int
+    flushes: int
+    batches: int
+    last_batch_size: int
+    max_batch_size: int
+    mean_batch_size: float
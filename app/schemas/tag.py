@@ -1,6 +1,21 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
 class TagResponse(BaseModel):
     company_name: str
     tags: list[str]
+
+
+class TagFacetResponse(BaseModel):
+    tag_name: str
+    count: int
+
+
+class TagWriteAckResponse(BaseModel):
+    """비동기 쓰기 모드로 접수된 태그 연결/해제 요청의 상태입니다."""
+
+    ack_id: str
+    status: Literal["pending", "applied", "failed"]
+    detail: str | None = None
@@ -1,16 +1,80 @@
+from collections.abc import Iterable, Mapping
+from typing import Literal
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.language import choose_language
-from app.db.transaction import transactional
-from app.models.company import Company
+from app.core.cache import (
+    company_id_cache,
+    company_profile_cache,
+    invalidate_company_profiles,
+    search_cache,
+)
+from app.core.config import settings
+from app.core.fuzzy_index import fuzzy_name_index
+from app.core.hangul import extract_chosung, is_chosung_query
+from app.core.http_cache import make_etag
+from app.core.language import choose_language, normalize_language_code
+from app.core.search_index import company_name_index
+from app.db.transaction import after_commit, transactional
+from app.models.company import Company, CompanyName
 from app.repositories.company import CompanyRepository
+from app.repositories.company_profile import CompanyProfileRepository
 from app.repositories.company_tag import CompanyTagRepository
 from app.repositories.tag import TagRepository
-from app.schemas.company import CompanyResponse, CreateCompanyRequest, CreateTagRequest
+from app.schemas.company import (
+    BatchCompanyResult,
+    BatchCreateCompaniesResponse,
+    BatchCreateCompanyResult,
+    BatchGetCompaniesResponse,
+    CompanyResponse,
+    CreateCompanyRequest,
+    CreateTagRequest,
+)
 from app.schemas.search import SearchResponse
 
 
+def localize_name(names: Iterable[tuple[str, str]], language: str) -> str:
+    """
+    (lang_code, 이름) 목록에서 choose_language fallback으로 이름 하나를 고릅니다.
+    같은 언어의 별칭 코드(ja/jp)가 함께 있으면 lang_code 알파벳 순으로 앞선 이름을 씁니다.
+    """
+    by_language = {
+        normalize_language_code(lang_code) or lang_code: name
+        for lang_code, name in sorted(names, reverse=True)
+    }
+    return by_language[choose_language(by_language, language)]
+
+
+def localize_company(
+    company: Company, language: str, tag_names: Mapping[int, str]
+) -> CompanyResponse:
+    """
+    회사명과 태그 연결이 적재된 Company에 choose_language fallback을 적용해 응답을 만듭니다.
+    태그명은 tag_id -> 태그명(TagRepository.localize_tag_names 결과)에서 찾으며,
+    태그는 Company.tags 순서(tag_id 순)를 따릅니다.
+    """
+    return CompanyResponse(
+        company_name=localize_name(
+            ((name.lang_code, name.name) for name in company.names), language
+        ),
+        tags=[
+            tag_names[company_tag.tag_id]
+            for company_tag in company.tags
+            if company_tag.tag_id in tag_names
+        ],
+    )
+
+
+def company_tag_ids(companies: Iterable[Company]) -> list[int]:
+    """적재된 회사들의 tag_id를 중복 없이 반환합니다."""
+    return list(
+        dict.fromkeys(
+            company_tag.tag_id for company in companies for company_tag in company.tags
+        )
+    )
+
+
 class CompanyService:
     def __init__(
         self,
@@ -18,42 +82,119 @@ class CompanyService:
         company_repo: CompanyRepository,
         tag_repo: TagRepository,
         company_tag_repo: CompanyTagRepository,
+        company_profile_repo: CompanyProfileRepository,
     ):
         self.db = db
         self.company_repo = company_repo
         self.tag_repo = tag_repo
         self.company_tag_repo = company_tag_repo
+        self.company_profile_repo = company_profile_repo
+
+    async def get_company(
+        self, company_name: str, language: str, fuzzy: bool = False
+    ) -> tuple[CompanyResponse, str]:
+        """
+        회사 프로필과 그 프로필의 revision 기반 ETag를 반환합니다.
+        ETag도 같은 프로필(캐시 또는 프로필 조회 한 번)에서 만들므로 추가 쿼리가 없습니다.
+        조건부 요청은 먼저 get_company_etag로 304 여부를 확인합니다.
+        """
+        cached = await self._get_company_cached(company_name, language)
 
-    async def get_company(self, company_name: str, language: str) -> CompanyResponse:
-        data = await self.company_repo.find_by_name(company_name, language)
+        if cached is None and fuzzy:
+            closest_names = self._fuzzy_search(company_name, None, limit=1)
+            if closest_names:
+                cached = await self._get_company_cached(closest_names[0], language)
 
-        if not data:
+        if cached is None:
             raise HTTPException(status_code=404, detail="Company not found")
 
-        available_langs = [name.lang_code for name in data.names]
-        chosen_lang = choose_language(available_langs, language)
-        company_name_in_lang = next(
-            name for name in data.names if name.lang_code == chosen_lang
-        )
+        response, company_id, revision = cached
+        return response, self._company_etag(company_id, revision, language)
 
-        tag_names = []
+    async def get_company_etag(self, company_name: str, language: str) -> str | None:
+        """
+        조건부 요청(If-None-Match)용으로 프로필을 만들지 않고 회사의 ETag만 구합니다.
+        프로필 캐시에 있으면 쿼리 없이, 없으면 (company_id, revision) 조회 한 번으로
+        만듭니다. 회사명으로 찾지 못하면 None을 반환합니다.
+        """
+        language_key = normalize_language_code(language) or language
+        company_id = company_id_cache.get(company_name)
+        if company_id is not None:
+            cached = company_profile_cache.get((company_id, language_key))
+            if cached is not None:
+                return self._company_etag(company_id, cached[2], language)
 
-        for company_tag in data.tags:
-            tag_available_langs = [
-                tag_name.lang_code for tag_name in company_tag.tag.names
-            ]
-            tag_chosen_lang = choose_language(tag_available_langs, language)
-            tag_name = next(
-                tag_name
-                for tag_name in company_tag.tag.names
-                if tag_name.lang_code == tag_chosen_lang
+        version = await self.company_repo.get_revision_by_name(company_name)
+        if version is None:
+            return None
+
+        company_id, revision = version
+        company_id_cache.set(company_name, company_id)
+        return self._company_etag(company_id, revision, language)
+
+    @staticmethod
+    def _company_etag(company_id: int, revision: int, language: str) -> str:
+        return make_etag("c", company_id, revision, normalize_language_code(language))
+
+    async def batch_get_companies(
+        self, company_names: list[str], language: str
+    ) -> BatchGetCompaniesResponse:
+        """
+        여러 회사를 일정한 수의 쿼리로 조회해 요청 순서대로 반환합니다.
+        찾지 못한 회사명은 found=False로 표시합니다.
+        """
+        companies = await self.company_repo.find_all_by_names(company_names)
+        tag_names = await self.tag_repo.localize_tag_names(
+            company_tag_ids(companies.values()), language
+        )
+
+        results = []
+        for company_name in company_names:
+            company = companies.get(company_name)
+            results.append(
+                BatchCompanyResult(
+                    name=company_name,
+                    found=company is not None,
+                    company=(
+                        localize_company(company, language, tag_names)
+                        if company
+                        else None
+                    ),
+                )
             )
-            tag_names.append(tag_name.name)
+        return BatchGetCompaniesResponse(results=results)
 
-        return CompanyResponse(
-            company_name=company_name_in_lang.name,
-            tags=tag_names,
+    async def _get_company_cached(
+        self, company_name: str, language: str
+    ) -> tuple[CompanyResponse, int, int] | None:
+        """
+        회사명 -> company_id, (company_id, 언어) -> 프로필 캐시를 거쳐
+        (프로필, company_id, revision)을 조회합니다.
+        """
+        language_key = normalize_language_code(language) or language
+
+        company_id = company_id_cache.get(company_name)
+        if company_id is not None:
+            cached = company_profile_cache.get((company_id, language_key))
+            if cached is not None:
+                response, _, revision = cached
+                return response, company_id, revision
+
+        generation = company_profile_cache.generation
+        profile = await self.company_profile_repo.find_by_company_name(
+            company_name, language
+        ) or await self.company_repo.get_localized_profile(company_name, language)
+        if profile is None:
+            return None
+
+        response = CompanyResponse(company_name=profile.company_name, tags=profile.tags)
+        company_id_cache.set(company_name, profile.company_id)
+        company_profile_cache.set(
+            (profile.company_id, language_key),
+            (response, frozenset(profile.tag_ids), profile.revision),
+            generation=generation,
         )
+        return response, profile.company_id, profile.revision
 
     @transactional
     async def create_company(
@@ -66,17 +207,34 @@ class CompanyService:
         company = Company()
         created_company = await self.company_repo.create(company)
 
+        created_names = []
         for lang_code, name in request.company_name.root.items():
-            await self.company_repo.add_company_name(
-                created_company.id, name, lang_code
+            created_names.append(
+                await self.company_repo.add_company_name(
+                    created_company.id, name, lang_code
+                )
             )
+        after_commit(self.db, lambda: self._index_company_names(created_names))
+        after_commit(self.db, lambda: self._invalidate_search_cache(created_names))
 
-        created_tag_ids = []
+        created_tag_ids: list[int] = []
+        renamed_tag_ids: set[int] = set()
         if request.tags:
-            created_tag_ids = await self._process_company_tags(
+            created_tag_ids, renamed_tag_ids = await self._process_company_tags(
                 created_company.id, request.tags
             )
 
+        # 기존 태그에 새 언어 이름이 추가되면 그 태그를 가진 회사의 프로필도 바뀝니다.
+        await self.company_profile_repo.refresh(
+            [created_company.id], tag_ids=renamed_tag_ids
+        )
+        after_commit(
+            self.db,
+            lambda: invalidate_company_profiles(
+                company_ids=[created_company.id], tag_ids=renamed_tag_ids
+            ),
+        )
+
         available_company_langs = list(request.company_name.root.keys())
         chosen_company_lang = choose_language(available_company_langs, language)
         company_name_in_language = request.company_name.root[chosen_company_lang]
@@ -89,52 +247,232 @@ class CompanyService:
             company_name=company_name_in_language, tags=tags_in_language
         )
 
-    async def _process_company_tags(
-        self, company_id: int, tag_requests: list[CreateTagRequest]
-    ) -> list[int]:
-        processed_tag_names = set()
-        created_tag_ids: list[int] = []
+    @transactional
+    async def batch_create_companies(
+        self, requests: list[CreateCompanyRequest], language: str
+    ) -> BatchCreateCompaniesResponse:
+        """
+        여러 회사를 한 트랜잭션에서 생성하고 항목별 결과를 요청 순서대로 반환합니다.
+        이미 등록된 회사명이나 앞선 항목과 겹치는 회사명을 가진 항목은 건너뜁니다.
+        태그는 배치 전체에서 한 번에 찾고, 회사/회사명/태그/연결은 multi-row INSERT로
+        생성하므로 쿼리 수가 회사 수와 관계없이 일정합니다.
+        """
+        existing_names = await self.company_repo.find_existing_names(
+            name for request in requests for name in request.company_name.root.values()
+        )
 
-        for tag_request in tag_requests:
-            requested_tag_names = list(tag_request.tag_name.root.values())
-            first_tag_name = requested_tag_names[0] if requested_tag_names else ""
-            if first_tag_name in processed_tag_names:
-                continue
-            processed_tag_names.add(first_tag_name)
+        statuses: list[Literal["created", "exists", "duplicate"]] = []
+        accepted: list[CreateCompanyRequest] = []
+        accepted_names: set[str] = set()
+        for request in requests:
+            names = set(request.company_name.root.values())
+            if not names.isdisjoint(existing_names):
+                statuses.append("exists")
+            elif not names.isdisjoint(accepted_names):
+                statuses.append("duplicate")
+            else:
+                statuses.append("created")
+                accepted.append(request)
+                accepted_names.update(names)
 
-            existing_tag_result = await self.tag_repo.find_by_names(
-                tag_request.tag_name.root
+        company_ids = await self.company_repo.bulk_create(len(accepted))
+        created_names = [
+            CompanyName(
+                company_id=company_id,
+                name=name,
+                lang_code=lang_code,
+                name_chosung=extract_chosung(name),
             )
+            for company_id, request in zip(company_ids, accepted, strict=True)
+            for lang_code, name in request.company_name.root.items()
+        ]
+        await self.company_repo.bulk_add_company_names(created_names)
+        after_commit(self.db, lambda: self._index_company_names(created_names))
+        after_commit(self.db, lambda: self._invalidate_search_cache(created_names))
 
-            if existing_tag_result:
-                tag_id, existing_lang_codes = existing_tag_result
+        resolved_tag_ids, _, renamed_tag_ids = await self.tag_repo.resolve_all(
+            [tag.tag_name.root for request in accepted for tag in request.tags]
+        )
+        company_tag_ids: list[list[int]] = []
+        position = 0
+        for request in accepted:
+            tag_ids = resolved_tag_ids[position : position + len(request.tags)]
+            company_tag_ids.append(list(dict.fromkeys(tag_ids)))
+            position += len(request.tags)
 
-                await self.tag_repo.add_missing_tag_names(
-                    tag_id, existing_lang_codes, tag_request.tag_name.root
+        await self.company_tag_repo.bulk_create_relations(
+            [
+                (company_id, tag_id)
+                for company_id, tag_ids in zip(
+                    company_ids, company_tag_ids, strict=True
                 )
+                for tag_id in tag_ids
+            ]
+        )
 
-                await self.company_tag_repo.create_relation(company_id, tag_id)
-                created_tag_ids.append(tag_id)
-            else:
-                new_tag = await self.tag_repo.create_with_names(
-                    tag_request.tag_name.root
+        await self.company_profile_repo.refresh(company_ids, tag_ids=renamed_tag_ids)
+        after_commit(
+            self.db,
+            lambda: invalidate_company_profiles(
+                company_ids=company_ids, tag_ids=renamed_tag_ids
+            ),
+        )
+
+        tag_names = await self.tag_repo.localize_tag_names(resolved_tag_ids, language)
+        created = iter(zip(accepted, company_tag_ids, strict=True))
+        results = []
+        for status in statuses:
+            if status != "created":
+                results.append(BatchCreateCompanyResult(status=status))
+                continue
+
+            request, tag_ids = next(created)
+            company_names = request.company_name.root
+            results.append(
+                BatchCreateCompanyResult(
+                    status=status,
+                    company=CompanyResponse(
+                        company_name=company_names[
+                            choose_language(company_names, language)
+                        ],
+                        tags=[
+                            tag_names[tag_id]
+                            for tag_id in tag_ids
+                            if tag_id in tag_names
+                        ],
+                    ),
                 )
-                await self.company_tag_repo.create_relation(company_id, new_tag.id)
-                created_tag_ids.append(new_tag.id)
+            )
+        return BatchCreateCompaniesResponse(results=results)
 
-        return created_tag_ids
+    async def _process_company_tags(
+        self, company_id: int, tag_requests: list[CreateTagRequest]
+    ) -> tuple[list[int], set[int]]:
+        """
+        태그를 한 번에 찾거나 생성해 연결하고
+        (연결한 tag_id 목록, 새 언어 이름이 추가된 기존 tag_id 집합)을 반환합니다.
+        태그 수와 관계없이 일정한 수의 쿼리로 처리합니다.
+        """
+        resolved = await self.tag_repo.resolve_all(
+            [tag_request.tag_name.root for tag_request in tag_requests]
+        )
+        created_tag_ids = list(dict.fromkeys(resolved.tag_ids))
+        await self.company_tag_repo.bulk_create_relations(
+            [(company_id, tag_id) for tag_id in created_tag_ids]
+        )
+        return created_tag_ids, resolved.renamed_tag_ids
 
     async def _get_tags_in_order(self, tag_ids: list[int], language: str) -> list[str]:
         if not tag_ids:
             return []
 
-        tag_id_to_name = await self.tag_repo.get_tag_names_by_ids(tag_ids, language)
+        tag_id_to_name = await self.tag_repo.localize_tag_names(tag_ids, language)
 
         return [
             tag_id_to_name[tag_id] for tag_id in tag_ids if tag_id in tag_id_to_name
         ]
 
-    async def search(self, query: str, language: str) -> list[SearchResponse]:
-        search_data = await self.company_repo.search_by_name_pattern(query, language)
+    @staticmethod
+    def _index_company_names(company_names: list[CompanyName]) -> None:
+        entries = [
+            (company_name.id, company_name.name, company_name.lang_code)
+            for company_name in company_names
+        ]
+        company_name_index.add_all(entries)
+        for name_id, name, lang_code in entries:
+            fuzzy_name_index.add(name_id, name, lang_code)
+
+    @staticmethod
+    def _fuzzy_search(query: str, language: str | None, limit: int) -> list[str]:
+        """오타 허용 검색은 인메모리 BK-tree로만 처리하고 DB 스캔으로 대체하지 않습니다."""
+        if not fuzzy_name_index.is_loaded:
+            raise HTTPException(
+                status_code=503, detail="Fuzzy search index is not available"
+            )
+        return fuzzy_name_index.search(query, language, limit)
+
+    @staticmethod
+    def _invalidate_search_cache(company_names: list[CompanyName]) -> None:
+        """새 회사명과 일치할 수 있는 검색어(부분 문자열/초성)의 캐시만 무효화합니다."""
+        new_names = [
+            (
+                normalize_language_code(company_name.lang_code)
+                or company_name.lang_code,
+                company_name.name.casefold(),
+                extract_chosung(company_name.name),
+            )
+            for company_name in company_names
+        ]
+
+        def is_affected(key: tuple[str, str, int]) -> bool:
+            query, lang_code, _ = key
+            return any(
+                lang_code == name_lang
+                and (query in folded_name or extract_chosung(query) in chosung)
+                for name_lang, folded_name, chosung in new_names
+            )
+
+        search_cache.invalidate_where(lambda key, _: is_affected(key))
+
+    @staticmethod
+    def _search_index(query: str, language: str, limit: int) -> list[str]:
+        if is_chosung_query(query):
+            return company_name_index.search_chosung(query, language, limit)
+        if len(query) < settings.SEARCH_NGRAM_TOKEN_SIZE:
+            return company_name_index.search_prefix(query, language, limit)
+        return company_name_index.search(query, language, limit)
+
+    async def _search_db(self, query: str, language: str, limit: int) -> list[str]:
+        if is_chosung_query(query):
+            search_data = await self.company_repo.search_by_chosung_prefix(
+                query, language, limit
+            )
+        elif len(query) < settings.SEARCH_NGRAM_TOKEN_SIZE:
+            search_data = await self.company_repo.search_by_name_prefix(
+                query, language, limit
+            )
+        else:
+            search_data = await self.company_repo.search_by_name_pattern(
+                query, language, limit
+            )
+        return [d.name for d in search_data]
+
+    async def search(
+        self, query: str, language: str, limit: int, fuzzy: bool = False
+    ) -> list[SearchResponse]:
+        query = query.strip()
+        if not query:
+            return []
+
+        limit = min(limit, settings.SEARCH_MAX_LIMIT)
+        result = await self._search_cached(query, language, limit)
+
+        if not result and fuzzy:
+            names = self._fuzzy_search(query, language, limit)
+            result = [SearchResponse(company_name=name) for name in names]
+
+        return result
+
+    async def _search_cached(
+        self, query: str, language: str, limit: int
+    ) -> list[SearchResponse]:
+        cache_key = (
+            query.casefold(),
+            normalize_language_code(language) or language,
+            limit,
+        )
+
+        cached = search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 조회 도중 회사명 쓰기가 커밋되어 무효화되면 오래된 결과를 저장하지 않습니다.
+        generation = search_cache.generation
+        if settings.SEARCH_INDEX_ENABLED and company_name_index.is_loaded:
+            names = self._search_index(query, language, limit)
+        else:
+            names = await self._search_db(query, language, limit)
 
-        return [SearchResponse(company_name=d.name) for d in search_data]
+        result = [SearchResponse(company_name=name) for name in names]
+        search_cache.set(cache_key, result, generation=generation)
+        return result
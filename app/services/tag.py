@@ -1,13 +1,42 @@
+from collections.abc import Collection, Sequence
+from itertools import groupby
+from typing import NamedTuple
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.language import choose_language
-from app.db.transaction import transactional
+from app.core.cache import invalidate_company_profiles
+from app.core.config import settings
+from app.core.http_cache import make_etag, page_digest
+from app.core.language import normalize_language_code
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.tag_index import tag_company_index
+from app.db.transaction import after_commit, transactional
 from app.repositories.company import CompanyRepository
+from app.repositories.company_profile import CompanyProfileRepository
 from app.repositories.company_tag import CompanyTagRepository
 from app.repositories.tag import TagRepository
 from app.schemas.company import CreateTagRequest
-from app.schemas.tag import TagResponse
+from app.schemas.tag import TagFacetResponse, TagResponse
+from app.services.company import company_tag_ids, localize_company, localize_name
+
+
+class TagWrite(NamedTuple):
+    """
+    비동기 쓰기 모드로 접수된 태그 요청 하나입니다.
+    link(추가할 다국어 태그명)와 unlink(해제할 태그명, 모든 언어) 중 하나만 채웁니다.
+    """
+
+    ack_id: str
+    link: tuple[dict[str, str], ...] = ()
+    unlink: tuple[str, ...] = ()
+
+
+class TagPage(NamedTuple):
+    """GET /tags 한 페이지의 company_id 목록과 다음 페이지 커서입니다."""
+
+    company_ids: list[int]
+    next_cursor: str | None
 
 
 class TagService:
@@ -17,135 +46,321 @@ class TagService:
         company_repo: CompanyRepository,
         tag_repo: TagRepository,
         company_tag_repo: CompanyTagRepository,
+        company_profile_repo: CompanyProfileRepository,
     ):
         self.db = db
         self.company_repo = company_repo
         self.tag_repo = tag_repo
         self.company_tag_repo = company_tag_repo
+        self.company_profile_repo = company_profile_repo
 
-    async def get_tag(self, tag_name: str, language: str) -> list[TagResponse]:
-        tags = await self.tag_repo.find_by_name(tag_name)
-        if not tags:
+    async def get_tag_page(
+        self,
+        tag_name: str,
+        limit: int = settings.TAG_COMPANIES_DEFAULT_LIMIT,
+        cursor: str | None = None,
+    ) -> TagPage:
+        """
+        태그를 가진 회사의 company_id를 company_id 순으로 limit개씩 반환합니다.
+        다음 페이지가 없으면 커서는 None입니다.
+        """
+        limit = min(limit, settings.TAG_COMPANIES_MAX_LIMIT)
+        after_company_id = decode_cursor(cursor)
+        if tag_company_index.is_loaded:
+            company_ids = tag_company_index.page_by_tag_name(
+                tag_name, after_company_id, limit + 1
+            )
+        else:
+            company_ids = await self.tag_repo.get_company_page_by_tag_name(
+                tag_name, after_company_id, limit + 1
+            )
+        if company_ids is None:
             raise HTTPException(status_code=404, detail="Tag not found")
 
-        companies = await self.tag_repo.get_companies_by_tag_name(tag_name)
+        return TagPage(*self._split_page(company_ids, limit))
 
-        result = []
-        for company in companies:
-            available_company_langs = [name.lang_code for name in company.names]
-            chosen_company_lang = choose_language(available_company_langs, language)
-            company_name_in_lang = next(
-                name.name
-                for name in company.names
-                if name.lang_code == chosen_company_lang
-            )
+    async def get_tag_page_etag(self, page: TagPage, language: str) -> str:
+        """
+        조건부 요청(If-None-Match)용으로 프로필을 읽지 않고 페이지의 ETag만 구합니다.
+        페이지 회사의 revision을 기본 키로 한 번 조회합니다.
+        """
+        revisions = await self.company_repo.get_revisions(page.company_ids)
+        return self._page_etag(
+            page,
+            [revisions.get(company_id, 0) for company_id in page.company_ids],
+            language,
+        )
 
-            tag_names = []
-            for company_tag in company.tags:
-                tag_available_langs = [name.lang_code for name in company_tag.tag.names]
-                tag_chosen_lang = choose_language(tag_available_langs, language)
-                tag_name_in_lang = next(
-                    name.name
-                    for name in company_tag.tag.names
-                    if name.lang_code == tag_chosen_lang
-                )
-                tag_names.append(tag_name_in_lang)
+    async def localize_tag_page(
+        self, page: TagPage, language: str
+    ) -> tuple[list[TagResponse], str]:
+        """
+        페이지 회사들의 언어별 프로필과 ETag를 반환합니다.
+        ETag는 읽은 프로필의 revision으로 만들므로 get_tag_page_etag와 같고 추가 쿼리가
+        없으며, 태그를 가진 전체 회사를 다시 집계하지 않습니다.
+        """
+        tags, revisions = await self._localize_companies(page.company_ids, language)
+        return tags, self._page_etag(page, revisions, language)
 
-            result.append(
-                TagResponse(
-                    company_name=company_name_in_lang,
-                    tags=tag_names,
-                )
+    async def search_companies_by_tags(
+        self,
+        all_names: list[str],
+        any_names: list[str],
+        none_names: list[str],
+        language: str,
+        limit: int = settings.TAG_COMPANIES_DEFAULT_LIMIT,
+        cursor: str | None = None,
+    ) -> tuple[list[TagResponse], str | None]:
+        """
+        태그명(모든 언어) 조건으로 회사를 company_id 순으로 limit개씩 반환합니다.
+        all: 모두 포함, any: 하나 이상 포함, none: 하나도 포함하지 않음
+        """
+        if not all_names and not any_names:
+            raise HTTPException(
+                status_code=400, detail="At least one of 'all' or 'any' is required"
             )
+        if len(all_names) + len(any_names) + len(none_names) > (
+            settings.TAG_QUERY_MAX_TERMS
+        ):
+            raise HTTPException(status_code=400, detail="Too many tag names")
 
-        return result
+        limit = min(limit, settings.TAG_COMPANIES_MAX_LIMIT)
+        after_company_id = decode_cursor(cursor)
+        if tag_company_index.is_loaded:
+            company_ids = tag_company_index.page_by_tag_query(
+                all_names, any_names, none_names, after_company_id, limit + 1
+            )
+        else:
+            company_ids = await self.tag_repo.get_company_page_by_tag_query(
+                all_names, any_names, none_names, after_company_id, limit + 1
+            )
 
-    @transactional
-    async def add_tags_to_existing_company(
-        self, company_name: str, tag_requests: list[CreateTagRequest]
-    ) -> dict[str, int]:
-        company_id = await self.company_repo.get_company_id_by_name(company_name)
-        if not company_id:
-            raise HTTPException(status_code=404, detail="Company not found")
+        company_ids, next_cursor = self._split_page(company_ids, limit)
+        tags, _ = await self._localize_companies(company_ids, language)
+        return tags, next_cursor
 
-        existing_tag_ids = set(
-            await self.company_tag_repo.get_tag_ids_by_company_id(company_id)
+    async def get_facets(
+        self, language: str, limit: int = settings.TAG_FACETS_DEFAULT_LIMIT
+    ) -> list[TagFacetResponse]:
+        """회사 수 상위 태그를 language 기준 태그명과 함께 반환합니다."""
+        top_tags = await self.tag_repo.get_top_tags(
+            language, min(limit, settings.TAG_FACETS_MAX_LIMIT)
         )
+        return [
+            TagFacetResponse(tag_name=tag_name, count=usage_count)
+            for tag_name, usage_count in top_tags
+        ]
 
-        result = {
-            "linked": 0,
-            "created": 0,
-            "skipped": 0,
-        }
+    @staticmethod
+    def _page_etag(page: TagPage, revisions: list[int], language: str) -> str:
+        """페이지의 (company_id, revision)과 다음 커서로 ETag를 만듭니다."""
+        return make_etag(
+            "t",
+            page_digest(
+                *(
+                    f"{company_id}:{revision}"
+                    for company_id, revision in zip(
+                        page.company_ids, revisions, strict=True
+                    )
+                ),
+                page.next_cursor,
+            ),
+            normalize_language_code(language),
+        )
 
-        processed_tag_names = set()
+    @staticmethod
+    def _split_page(company_ids: list[int], limit: int) -> tuple[list[int], str | None]:
+        """limit + 1개까지 조회한 id 목록을 (페이지, 다음 페이지 커서)로 나눕니다."""
+        if len(company_ids) <= limit:
+            return company_ids, None
 
-        for tag_request in tag_requests:
-            requested_tag_names = list(tag_request.tag_name.root.values())
-            first_tag_name = requested_tag_names[0] if requested_tag_names else ""
-            if first_tag_name in processed_tag_names:
-                continue
-            processed_tag_names.add(first_tag_name)
+        page = company_ids[:limit]
+        return page, encode_cursor(page[-1])
 
-            existing_tag_result = await self.tag_repo.find_by_names(
-                tag_request.tag_name.root
+    async def _localize_companies(
+        self, company_ids: list[int], language: str
+    ) -> tuple[list[TagResponse], list[int]]:
+        """
+        company_ids 회사의 언어별 프로필과 revision을 company_ids 순서대로 반환합니다.
+        company_profile에 없는 회사만 원본 테이블에서 적재합니다.
+        """
+        profiles: dict[int, TagResponse] = {}
+        revisions: dict[int, int] = {}
+        for company_id, profile in (
+            await self.company_profile_repo.find_by_company_ids(company_ids, language)
+        ).items():
+            profiles[company_id] = TagResponse(
+                company_name=profile.company_name, tags=profile.tags
             )
+            revisions[company_id] = profile.revision
 
-            if existing_tag_result:
-                tag_id, existing_lang_codes = existing_tag_result
+        missing_ids = [
+            company_id for company_id in company_ids if company_id not in profiles
+        ]
+        companies = await self.company_repo.find_all_by_ids(missing_ids)
+        tag_names = await self.tag_repo.localize_tag_names(
+            company_tag_ids(companies), language
+        )
+        for company in companies:
+            localized = localize_company(company, language, tag_names)
+            profiles[company.id] = TagResponse(
+                company_name=localized.company_name, tags=localized.tags
+            )
+            revisions[company.id] = company.revision
 
-                if tag_id in existing_tag_ids:
-                    result["skipped"] += 1
-                    continue
+        return (
+            [profiles[company_id] for company_id in company_ids],
+            [revisions[company_id] for company_id in company_ids],
+        )
 
-                await self.tag_repo.add_missing_tag_names(
-                    tag_id, existing_lang_codes, tag_request.tag_name.root
-                )
+    @transactional
+    async def add_tags_to_existing_company(
+        self, company_name: str, tag_requests: list[CreateTagRequest], language: str
+    ) -> TagResponse:
+        """
+        기존 회사에 태그를 추가하고 추가 후의 태그 목록을 반환합니다.
+        이미 연결된 태그는 건너뜁니다. 응답은 쓰기 중에 확인한 회사명과
+        연결 tag_id로 만들며 회사를 다시 조회하지 않습니다.
+        """
+        company = await self.company_repo.find_names_by_company_name(company_name)
+        if company is None:
+            raise HTTPException(status_code=404, detail="Company not found")
 
-                await self.company_tag_repo.create_relation(company_id, tag_id)
-                result["linked"] += 1
-            else:
-                new_tag = await self.tag_repo.create_with_names(
-                    tag_request.tag_name.root
-                )
-                await self.company_tag_repo.create_relation(company_id, new_tag.id)
-                result["created"] += 1
+        company_id, company_names = company
+        existing_tag_ids = set(
+            await self.company_tag_repo.get_tag_ids_by_company_id(company_id)
+        )
 
-        return result
+        resolved = await self.tag_repo.resolve_all(
+            [tag_request.tag_name.root for tag_request in tag_requests]
+        )
+        renamed_tag_ids = resolved.renamed_tag_ids
+        new_tag_ids = [
+            tag_id
+            for tag_id in dict.fromkeys(resolved.tag_ids)
+            if tag_id not in existing_tag_ids
+        ]
+        await self.company_tag_repo.bulk_create_relations(
+            [(company_id, tag_id) for tag_id in new_tag_ids]
+        )
+
+        await self._refresh_company(company_id, renamed_tag_ids)
+
+        # 회사 태그는 tag_id 순입니다. (Company.tags, company_profile과 동일)
+        tag_ids = sorted(existing_tag_ids.union(new_tag_ids))
+        tag_names = await self.tag_repo.localize_tag_names(tag_ids, language)
+        return TagResponse(
+            company_name=localize_name(company_names, language),
+            tags=[tag_names[tag_id] for tag_id in tag_ids if tag_id in tag_names],
+        )
 
     @transactional
     async def delete_tag(
         self, company_name: str, tag_name: str, language: str
     ) -> TagResponse:
-        company_id = await self.company_repo.get_company_id_by_name(company_name)
-        if not company_id:
+        """
+        태그 하나를 해제하고 남은 태그를 반환합니다.
+        회사/태그 확인 1회, 삭제와 프로필 갱신, 응답용 프로필 조회 1회로
+        회사의 태그 수와 관계없이 일정한 수의 쿼리로 처리합니다.
+        """
+        linked = await self.company_tag_repo.find_linked_tag_ids(
+            company_name, [tag_name]
+        )
+        if linked is None:
             raise HTTPException(status_code=404, detail="Company not found")
 
-        tag = await self.tag_repo.find_tag_by_company_and_name(company_id, tag_name)
-        if not tag:
+        company_id, tag_ids = linked
+        if not tag_ids:
             raise HTTPException(status_code=404, detail="Tag not found")
 
-        await self.company_tag_repo.delete_relation(company_id, tag.id)
+        await self._detach_tags(company_id, tag_ids)
+        (response,), _ = await self._localize_companies([company_id], language)
+        return response
 
-        remaining_tag_names = await self.tag_repo.get_tag_names_by_company_id(
-            company_id, language
+    @transactional
+    async def delete_tags(
+        self, company_name: str, tag_names: list[str], language: str
+    ) -> TagResponse:
+        """
+        여러 태그명(모든 언어)의 태그를 회사에서 한 번에 해제하고 남은 태그를 반환합니다.
+        회사에 연결되지 않은 태그명은 무시합니다.
+        """
+        linked = await self.company_tag_repo.find_linked_tag_ids(
+            company_name, tag_names
         )
+        if linked is None:
+            raise HTTPException(status_code=404, detail="Company not found")
 
-        company_name_in_language = (
-            await self.company_repo.get_company_names_by_language(company_id, language)
-        )
+        company_id, tag_ids = linked
+        await self._detach_tags(company_id, tag_ids)
+        (response,), _ = await self._localize_companies([company_id], language)
+        return response
+
+    @transactional
+    async def apply_tag_writes(
+        self, company_name: str, writes: Sequence[TagWrite]
+    ) -> None:
+        """
+        한 회사에 쌓인 비동기 태그 연결/해제 요청을 접수 순서대로 한 트랜잭션에서 적용합니다.
+        연속된 같은 종류의 요청은 묶어 multi-row 문장 하나로 처리하고
+        프로필 갱신, revision 증가, 캐시 무효화는 마지막에 한 번만 합니다.
+        """
+        company = await self.company_tag_repo.find_linked_tag_ids(company_name, ())
+        if company is None:
+            raise HTTPException(status_code=404, detail="Company not found")
 
-        if not company_name_in_language:
-            company = await self.company_repo.find_by_name(company_name, language)
-            if company and company.names:
-                available_langs = [name.lang_code for name in company.names]
-                chosen_lang = choose_language(available_langs, language)
-                company_name_in_language = next(
-                    name.name for name in company.names if name.lang_code == chosen_lang
+        company_id, _ = company
+        tag_ids = set(await self.company_tag_repo.get_tag_ids_by_company_id(company_id))
+        renamed_tag_ids: set[int] = set()
+        for is_link, run in groupby(writes, key=lambda write: bool(write.link)):
+            run_writes = list(run)
+            if is_link:
+                resolved = await self.tag_repo.resolve_all(
+                    [tag_names for write in run_writes for tag_names in write.link]
                 )
-            else:
-                company_name_in_language = company_name
+                renamed_tag_ids.update(resolved.renamed_tag_ids)
+                new_tag_ids = [
+                    tag_id
+                    for tag_id in dict.fromkeys(resolved.tag_ids)
+                    if tag_id not in tag_ids
+                ]
+                await self.company_tag_repo.bulk_create_relations(
+                    [(company_id, tag_id) for tag_id in new_tag_ids]
+                )
+                tag_ids.update(new_tag_ids)
+                continue
 
-        return TagResponse(
-            company_name=company_name_in_language, tags=remaining_tag_names
+            unlink_names = {name for write in run_writes for name in write.unlink}
+            if not unlink_names:
+                continue
+            linked = await self.company_tag_repo.find_linked_tag_ids(
+                company_name, unlink_names
+            )
+            unlinked_tag_ids = linked[1] if linked else []
+            await self.company_tag_repo.delete_relations(company_id, unlinked_tag_ids)
+            tag_ids.difference_update(unlinked_tag_ids)
+
+        await self._refresh_company(company_id, renamed_tag_ids)
+
+    async def _detach_tags(self, company_id: int, tag_ids: list[int]) -> None:
+        """태그 연결을 삭제하고 회사 프로필/revision/캐시를 함께 갱신합니다."""
+        if not tag_ids:
+            return
+
+        await self.company_tag_repo.delete_relations(company_id, tag_ids)
+        await self._refresh_company(company_id)
+
+    async def _refresh_company(
+        self, company_id: int, renamed_tag_ids: Collection[int] = ()
+    ) -> None:
+        """
+        회사와, 태그명이 추가된 태그(renamed_tag_ids)를 가진 회사들의
+        프로필/revision을 갱신하고 커밋 후 캐시를 무효화합니다.
+        """
+        await self.company_profile_repo.refresh([company_id], tag_ids=renamed_tag_ids)
+        after_commit(
+            self.db,
+            lambda: invalidate_company_profiles(
+                company_ids=[company_id], tag_ids=renamed_tag_ids
+            ),
         )
@@ -0,0 +1,173 @@
+import asyncio
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.db.session import get_async_session
+from app.repositories.company import CompanyRepository
+from app.repositories.company_profile import CompanyProfileRepository
+from app.repositories.company_tag import CompanyTagRepository
+from app.repositories.tag import TagRepository
+from app.services.tag import TagService, TagWrite
+
+__all__ = [
+    "TagWriteQueue",
+    "TagWriteQueueStats",
+    "TagWriteStatus",
+    "tag_write_queue",
+]
+
+TagWriteStatus = Literal["pending", "applied", "failed"]
+
+
+@dataclass
+class TagWriteQueueStats:
+    submitted: int = 0
+    applied: int = 0
+    failed: int = 0
+    # 대기 요청을 꺼내 적용한 횟수
+    flushes: int = 0
+    # 회사별 트랜잭션 수와 그 크기(한 트랜잭션에 병합된 요청 수)
+    batches: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return (self.applied + self.failed) / self.batches if self.batches else 0.0
+
+
+class TagWriteQueue:
+    """
+    비동기 쓰기 모드의 태그 연결/해제 요청을 모아 적용하는 프로세스 내 큐입니다.
+
+    요청은 ack_id만 받고 바로 반환되며, 첫 요청 후 TAG_WRITE_QUEUE_WINDOW초
+    (대기 요청이 TAG_WRITE_QUEUE_MAX_PENDING개가 되면 즉시) 뒤에 회사별로
+    묶어 회사당 한 트랜잭션(TagService.apply_tag_writes)으로 적용합니다.
+    """
+
+    def __init__(self) -> None:
+        self.stats = TagWriteQueueStats()
+        self._pending: dict[str, list[TagWrite]] = {}
+        self._pending_count = 0
+        self._statuses: OrderedDict[str, tuple[TagWriteStatus, str | None]] = (
+            OrderedDict()
+        )
+        # flush는 한 번에 하나만 실행해 같은 회사의 요청이 접수 순서대로 적용되게 합니다.
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        return self._pending_count
+
+    def submit(
+        self,
+        company_name: str,
+        link: Iterable[dict[str, str]] = (),
+        unlink: Iterable[str] = (),
+    ) -> str:
+        """태그 연결(link) 또는 해제(unlink) 요청을 접수하고 ack_id를 반환합니다."""
+        ack_id = uuid.uuid4().hex
+        self._pending.setdefault(company_name, []).append(
+            TagWrite(ack_id, link=tuple(link), unlink=tuple(unlink))
+        )
+        self._pending_count += 1
+        self._set_status(ack_id, "pending")
+        self.stats.submitted += 1
+
+        if self._pending_count >= settings.TAG_WRITE_QUEUE_MAX_PENDING:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                settings.TAG_WRITE_QUEUE_WINDOW, self._start_flush
+            )
+        return ack_id
+
+    def status(self, ack_id: str) -> tuple[TagWriteStatus, str | None] | None:
+        """ack_id 요청의 (상태, 실패 사유)를 반환합니다. 모르는 ack_id면 None입니다."""
+        return self._statuses.get(ack_id)
+
+    async def flush(self) -> None:
+        """대기 중인 요청을 회사별로 묶어 회사당 한 트랜잭션으로 적용합니다."""
+        async with self._flush_lock:
+            pending, self._pending, self._pending_count = self._pending, {}, 0
+            if not pending:
+                return
+
+            self.stats.flushes += 1
+            for company_name, writes in pending.items():
+                status, detail = await self._apply(company_name, writes)
+                for write in writes:
+                    self._set_status(write.ack_id, status, detail)
+
+                if status == "applied":
+                    self.stats.applied += len(writes)
+                else:
+                    self.stats.failed += len(writes)
+                self.stats.batches += 1
+                self.stats.last_batch_size = len(writes)
+                self.stats.max_batch_size = max(self.stats.max_batch_size, len(writes))
+
+    async def close(self) -> None:
+        """
+        애플리케이션 종료 시 호출합니다. 실행 중인 flush를 기다리고
+        남은 요청을 모두 적용합니다.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks)
+        await self.flush()
+        # Lock은 처음 사용한 이벤트 루프에 묶이므로 다음 실행(재시작, 테스트)을 위해 새로 만듭니다.
+        self._flush_lock = asyncio.Lock()
+
+    @staticmethod
+    async def _apply(
+        company_name: str, writes: list[TagWrite]
+    ) -> tuple[TagWriteStatus, str | None]:
+        status: TagWriteStatus = "applied"
+        detail: str | None = None
+        async for session in get_async_session():
+            tag_service = TagService(
+                session,
+                CompanyRepository(session),
+                TagRepository(session),
+                CompanyTagRepository(session),
+                CompanyProfileRepository(session),
+            )
+            try:
+                await tag_service.apply_tag_writes(company_name, writes)
+            except HTTPException as exc:
+                status, detail = "failed", exc.detail
+            except Exception:
+                # 한 회사의 실패가 같은 flush의 다른 회사 적용을 막지 않도록 상태로만 남깁니다.
+                status, detail = "failed", "Internal Server Error"
+        return status, detail
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    def _set_status(
+        self, ack_id: str, status: TagWriteStatus, detail: str | None = None
+    ) -> None:
+        self._statuses[ack_id] = (status, detail)
+        self._statuses.move_to_end(ack_id)
+        while len(self._statuses) > settings.TAG_WRITE_QUEUE_ACK_HISTORY:
+            self._statuses.popitem(last=False)
+
+
+tag_write_queue = TagWriteQueue()
@@ -0,0 +1,110 @@
+# ruff: noqa: T201
+"""
+회사 일괄 생성 벤치마크
+
+합성 회사(회사명 2개 언어, 태그 3개)를 다음 두 방식으로 DB에 생성해 처리량을 비교합니다.
+  - single: 회사마다 CompanyService.create_company (POST /companies 와 동일)
+  - batch : --batch-size 개씩 CompanyService.batch_create_companies
+            (POST /companies:batchCreate 와 동일)
+
+    python -m benchmarks.bulk_create --companies 2000 --batch-size 500
+
+생성한 회사는 지우지 않으므로 테스트 DB가 아닌 벤치마크용 DB에서 실행하세요.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import close_db, get_async_session, init_db
+from app.repositories.company import CompanyRepository
+from app.repositories.company_profile import CompanyProfileRepository
+from app.repositories.company_tag import CompanyTagRepository
+from app.repositories.tag import TagRepository
+from app.schemas.company import CreateCompanyRequest
+from app.services.company import CompanyService
+
+
+def _synthetic_requests(
+    prefix: str, count: int, tag_count: int, rng: random.Random
+) -> list[CreateCompanyRequest]:
+    requests = []
+    for number in range(count):
+        tag_numbers = rng.sample(range(1, tag_count + 1), k=3)
+        requests.append(
+            CreateCompanyRequest.model_validate(
+                {
+                    "company_name": {
+                        "ko": f"{prefix}_회사_{number}",
+                        "en": f"{prefix}_company_{number}",
+                    },
+                    "tags": [
+                        {
+                            "tag_name": {
+                                "ko": f"벤치태그_{tag_number}",
+                                "en": f"bench_tag_{tag_number}",
+                            }
+                        }
+                        for tag_number in tag_numbers
+                    ],
+                }
+            )
+        )
+    return requests
+
+
+def _company_service(session: AsyncSession) -> CompanyService:
+    return CompanyService(
+        session,
+        CompanyRepository(session),
+        TagRepository(session),
+        CompanyTagRepository(session),
+        CompanyProfileRepository(session),
+    )
+
+
+def _report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<8} {count} companies in {elapsed:.3f}s  {count / elapsed:>8.0f}/s")
+
+
+async def main(company_count: int, batch_size: int, tag_count: int, seed: int) -> None:
+    await init_db()
+    rng = random.Random(seed)
+    run_id = uuid.uuid4().hex[:8]
+
+    async for session in get_async_session():
+        service = _company_service(session)
+        requests = _synthetic_requests(
+            f"single_{run_id}", company_count, tag_count, rng
+        )
+        started = time.perf_counter()
+        for request in requests:
+            await service.create_company(request, "ko")
+        _report("single", company_count, time.perf_counter() - started)
+
+    async for session in get_async_session():
+        service = _company_service(session)
+        requests = _synthetic_requests(f"batch_{run_id}", company_count, tag_count, rng)
+        started = time.perf_counter()
+        for start in range(0, company_count, batch_size):
+            await service.batch_create_companies(
+                requests[start : start + batch_size], "ko"
+            )
+        _report("batch", company_count, time.perf_counter() - started)
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--companies", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--tags", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.companies, args.batch_size, args.tags, args.seed))
@@ -0,0 +1,93 @@
+# ruff: noqa: T201
+"""
+초성 자동완성 벤치마크
+
+합성 회사명 카탈로그에서 초성 prefix 질의를 다음 두 방식으로 처리해 비교합니다.
+  - index: 미리 분해한 초성 정렬 배열 이진 탐색 (CompanyNameIndex.search_chosung)
+  - scan : 질의마다 전체 회사명을 초성 분해하여 비교 (company_name 전체 스캔과 동일)
+
+    python -m benchmarks.chosung_search --names 1000000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from app.core.hangul import extract_chosung
+from app.core.search_index import CompanyNameIndex
+
+_SYLLABLE_FIRST = ord("가")
+_SYLLABLE_COUNT = ord("힣") - _SYLLABLE_FIRST + 1
+
+
+def _synthetic_names(count: int, rng: random.Random) -> list[tuple[int, str, str]]:
+    return [
+        (
+            name_id,
+            "".join(
+                chr(_SYLLABLE_FIRST + rng.randrange(_SYLLABLE_COUNT))
+                for _ in range(rng.randint(2, 8))
+            ),
+            "ko",
+        )
+        for name_id in range(1, count + 1)
+    ]
+
+
+def _scan(entries: list[tuple[int, str, str]], query: str, limit: int) -> list[str]:
+    matched = [
+        name for _, name, _ in entries if extract_chosung(name).startswith(query)
+    ]
+    return sorted(matched, key=len)[:limit]
+
+
+def _measure(queries: list[str], run: Callable[[str], list[str]]) -> list[float]:
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        run(query)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main(name_count: int, query_count: int, seed: int, limit: int) -> None:
+    rng = random.Random(seed)
+    entries = _synthetic_names(name_count, rng)
+
+    started = time.perf_counter()
+    index = CompanyNameIndex()
+    index.load(entries)
+    print(f"index load: {name_count} names in {time.perf_counter() - started:.2f}s")
+
+    queries = [
+        extract_chosung(name)[: rng.randint(2, 3)]
+        for _, name, _ in rng.choices(entries, k=query_count)
+    ]
+
+    def run_index(query: str) -> list[str]:
+        return index.search_chosung(query, "ko", limit)
+
+    def run_scan(query: str) -> list[str]:
+        return _scan(entries, query, limit)
+
+    for label, run in (("index", run_index), ("scan", run_scan)):
+        latencies = _measure(queries, run)
+
+        print(
+            f"{label:<6} {len(latencies) / sum(latencies):>10.1f} qps  "
+            f"p50={statistics.median(latencies) * 1000:.3f}ms  "
+            f"max={max(latencies) * 1000:.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--names", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.names, args.queries, args.seed, args.limit)
@@ -0,0 +1,83 @@
+# ruff: noqa: T201
+"""
+/search 자동완성 경로 벤치마크
+
+인메모리 suffix 인덱스와 MySQL FULLTEXT(ngram) 검색의 처리량과 지연 시간을 비교합니다.
+DB에 적재된 회사명에서 2글자 질의를 뽑아 두 경로에 동일하게 실행합니다.
+
+    python -m benchmarks.search_index --queries 2000
+"""
+
+import argparse
+import asyncio
+import inspect
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from app.core.search_index import CompanyNameIndex
+from app.db.session import close_db, get_async_session, init_db
+from app.repositories.company import CompanyRepository
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    total = sum(latencies)
+    ordered = sorted(latencies)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(
+        f"{label:<10} {len(latencies) / total:>10.0f} qps  "
+        f"p50={statistics.median(ordered) * 1000:.3f}ms  p99={p99 * 1000:.3f}ms"
+    )
+
+
+async def _measure(
+    queries: list[tuple[str, str]],
+    limit: int,
+    run: Callable[[str, str, int], object],
+) -> list[float]:
+    latencies = []
+    for query, lang_code in queries:
+        started = time.perf_counter()
+        result = run(query, lang_code, limit)
+        if inspect.isawaitable(result):
+            await result
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def main(query_count: int, seed: int, limit: int) -> None:
+    await init_db()
+
+    async for session in get_async_session():
+        repo = CompanyRepository(session)
+        entries = await repo.get_all_names()
+
+        started = time.perf_counter()
+        index = CompanyNameIndex()
+        index.load(entries)
+        print(
+            f"index load: {len(entries)} names in {time.perf_counter() - started:.3f}s"
+        )
+
+        rng = random.Random(seed)
+        candidates = [(name, lang) for _, name, lang in entries if len(name) >= 2]
+        queries = []
+        for name, lang_code in rng.choices(candidates, k=query_count):
+            start = rng.randrange(len(name) - 1)
+            queries.append((name[start : start + 2], lang_code))
+
+        _report("index", await _measure(queries, limit, index.search))
+        _report("fulltext", await _measure(queries, limit, repo.search_by_name_pattern))
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.queries, args.seed, args.limit))
@@ -0,0 +1,81 @@
+# ruff: noqa: T201
+"""
+태그 -> 회사 역색인 벤치마크
+
+합성 company_tag 링크로 TagCompanyIndex를 구성해 적재 시간, 메모리 사용량,
+태그명 페이지 조회 지연 시간을 측정합니다. 태그 인기도는 Zipf 분포를 따릅니다.
+
+    python -m benchmarks.tag_index --links 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+from app.core.tag_index import TagCompanyIndex
+
+
+def _synthetic_links(
+    link_count: int, company_count: int, tag_count: int, rng: random.Random
+) -> list[tuple[int, int]]:
+    weights = [1 / rank for rank in range(1, tag_count + 1)]
+    tag_ids = rng.choices(range(1, tag_count + 1), weights=weights, k=link_count)
+    return list({(rng.randint(1, company_count), tag_id) for tag_id in tag_ids})
+
+
+def main(
+    link_count: int, company_count: int, tag_count: int, query_count: int, seed: int
+) -> None:
+    rng = random.Random(seed)
+    links = _synthetic_links(link_count, company_count, tag_count, rng)
+    tag_names = [
+        (tag_id, f"{lang}_tag_{tag_id}")
+        for tag_id in range(1, tag_count + 1)
+        for lang in ("ko", "en", "ja")
+    ]
+
+    index = TagCompanyIndex()
+    tracemalloc.start()
+    started = time.perf_counter()
+    index.load(links, tag_names)
+    elapsed = time.perf_counter() - started
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"links: {index.link_count()} (tags={tag_count}, companies={company_count})")
+    print(f"load: {elapsed:.2f}s")
+    print(
+        f"memory: {index.memory_usage() / 1024 / 1024:.1f} MiB "
+        f"(tracemalloc {traced / 1024 / 1024:.1f} MiB, "
+        f"{index.memory_usage() / index.link_count():.1f} B/link)"
+    )
+
+    queries = [
+        f"{rng.choice(('ko', 'en', 'ja'))}_tag_{rng.randint(1, tag_count)}"
+        for _ in range(query_count)
+    ]
+    latencies = []
+    for query in queries:
+        query_started = time.perf_counter()
+        index.page_by_tag_name(query, rng.randint(0, company_count // 2), 21)
+        latencies.append(time.perf_counter() - query_started)
+
+    ordered = sorted(latencies)
+    print(
+        f"page_by_tag_name: p50={statistics.median(ordered) * 1e6:.1f}us  "
+        f"p99={ordered[int(len(ordered) * 0.99) - 1] * 1e6:.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=1_000_000)
+    parser.add_argument("--companies", type=int, default=200_000)
+    parser.add_argument("--tags", type=int, default=5_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    main(args.links, args.companies, args.tags, args.queries, args.seed)
@@ -0,0 +1,85 @@
+# ruff: noqa
+# mypy: ignore-errors
+"""
+add company_name.name_chosung
+
+Revision ID: 3d9c2b7e51a4
+Revises: 4571299ee188
+Create Date: 2026-10-18 10:12:41.203117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9c2b7e51a4'
+down_revision: Union[str, Sequence[str], None] = '4571299ee188'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# app.core.hangul.extract_chosung의 이 리비전 시점 규칙을 복사해 둡니다.
+# app 모듈이 나중에 바뀌어도 이 마이그레이션의 backfill 결과는 바뀌지 않습니다.
+CHOSUNG = (
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+SYLLABLE_FIRST = ord('가')
+SYLLABLE_LAST = ord('힣')
+SYLLABLES_PER_CHOSUNG = 21 * 28
+
+
+def extract_chosung(text):
+    chars = []
+    for char in text:
+        code = ord(char)
+        if SYLLABLE_FIRST <= code <= SYLLABLE_LAST:
+            chars.append(CHOSUNG[(code - SYLLABLE_FIRST) // SYLLABLES_PER_CHOSUNG])
+        elif not char.isspace():
+            chars.append(char.casefold())
+    return ''.join(chars)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('company_name', sa.Column('name_chosung', sa.String(length=255), nullable=True))
+
+    # 기존 회사명 초성 backfill
+    bind = op.get_bind()
+    company_name = sa.table(
+        'company_name',
+        sa.column('id', sa.Integer),
+        sa.column('name', sa.String),
+        sa.column('name_chosung', sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(company_name.c.id, company_name.c.name)
+            .where(company_name.c.id > last_id)
+            .order_by(company_name.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        bind.execute(
+            company_name.update()
+            .where(company_name.c.id == sa.bindparam('b_id'))
+            .values(name_chosung=sa.bindparam('b_name_chosung')),
+            [{'b_id': row.id, 'b_name_chosung': extract_chosung(row.name)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+    op.create_index('ix_companyname_name_chosung', 'company_name', ['name_chosung'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_companyname_name_chosung', table_name='company_name')
+    op.drop_column('company_name', 'name_chosung')
@@ -0,0 +1,44 @@
+# ruff: noqa
+# mypy: ignore-errors
+"""
+add tag.usage_count
+
+Revision ID: 5b0e7c4f9a21
+Revises: c27a9d3e8b15
+Create Date: 2026-10-18 17:25:09.644352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b0e7c4f9a21'
+down_revision: Union[str, Sequence[str], None] = 'c27a9d3e8b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'tag',
+        sa.Column('usage_count', mysql.INTEGER(unsigned=True), server_default='0', nullable=False),
+    )
+
+    # 기존 연결 수 backfill
+    op.execute(
+        'UPDATE tag SET usage_count = '
+        '(SELECT COUNT(*) FROM company_tag WHERE company_tag.tag_id = tag.id)'
+    )
+
+    op.create_index('ix_tag_usage_count', 'tag', ['usage_count'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tag_usage_count', table_name='tag')
+    op.drop_column('tag', 'usage_count')
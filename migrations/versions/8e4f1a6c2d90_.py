@@ -0,0 +1,42 @@
+# ruff: noqa
+# mypy: ignore-errors
+"""
+add company_profile
+
+Revision ID: 8e4f1a6c2d90
+Revises: 3d9c2b7e51a4
+Create Date: 2026-10-18 13:40:12.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4f1a6c2d90'
+down_revision: Union[str, Sequence[str], None] = '3d9c2b7e51a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 데이터는 `python -m scripts.company_profile rebuild` 로 backfill 합니다.
+    op.create_table(
+        'company_profile',
+        sa.Column('company_id', mysql.INTEGER(unsigned=True), nullable=False),
+        sa.Column('lang_code', sa.String(length=2), nullable=False),
+        sa.Column('company_name', sa.String(length=255), nullable=False),
+        sa.Column('tag_ids', sa.JSON(), nullable=False),
+        sa.Column('tags', sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['company.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('company_id', 'lang_code', name='pk_company_profile'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('company_profile')
@@ -0,0 +1,35 @@
+# ruff: noqa
+# mypy: ignore-errors
+"""
+add company.revision
+
+Revision ID: c27a9d3e8b15
+Revises: 8e4f1a6c2d90
+Create Date: 2026-10-18 15:02:47.930116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c27a9d3e8b15'
+down_revision: Union[str, Sequence[str], None] = '8e4f1a6c2d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'company',
+        sa.Column('revision', mysql.INTEGER(unsigned=True), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('company', 'revision')
@@ -0,0 +1,41 @@
+# ruff: noqa
+# mypy: ignore-errors
+"""
+add company_profile.revision
+
+Revision ID: e41b7a9c3f58
+Revises: 5b0e7c4f9a21
+Create Date: 2026-10-18 21:12:36.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b7a9c3f58'
+down_revision: Union[str, Sequence[str], None] = '5b0e7c4f9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'company_profile',
+        sa.Column('revision', mysql.INTEGER(unsigned=True), server_default='0', nullable=False),
+    )
+
+    # 기존 프로필 backfill
+    op.execute(
+        'UPDATE company_profile JOIN company ON company.id = company_profile.company_id '
+        'SET company_profile.revision = company.revision'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('company_profile', 'revision')
@@ -0,0 +1,87 @@
+# ruff: noqa: T201
+"""
+company_profile 테이블 관리 CLI
+
+    python -m scripts.company_profile rebuild  # 전체 회사 프로필 backfill
+    python -m scripts.company_profile check    # 원본 테이블과 불일치하는 회사 출력
+
+check는 불일치가 있으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import close_db, get_async_session, init_db
+from app.repositories.company import CompanyRepository
+from app.repositories.company_profile import CompanyProfileRepository
+
+
+async def rebuild(session: AsyncSession, batch_size: int) -> int:
+    """모든 회사의 프로필을 batch_size 단위로 다시 렌더링하고 회사 수를 반환합니다."""
+    company_repo = CompanyRepository(session)
+    profile_repo = CompanyProfileRepository(session)
+
+    rebuilt = 0
+    last_id = 0
+    while company_ids := await company_repo.get_ids_after(last_id, batch_size):
+        await profile_repo.replace(company_ids, await profile_repo.render(company_ids))
+        await session.commit()
+
+        rebuilt += len(company_ids)
+        last_id = company_ids[-1]
+    return rebuilt
+
+
+async def check(session: AsyncSession, batch_size: int) -> list[int]:
+    """저장된 프로필이 원본 테이블 렌더링 결과와 다른 company_id 목록을 반환합니다."""
+    company_repo = CompanyRepository(session)
+    profile_repo = CompanyProfileRepository(session)
+
+    mismatched: list[int] = []
+    last_id = 0
+    while company_ids := await company_repo.get_ids_after(last_id, batch_size):
+        expected = await profile_repo.render(company_ids)
+        stored = await profile_repo.get_rows(company_ids)
+        for company_id in company_ids:
+            if _rows_of(expected, company_id) != _rows_of(stored, company_id):
+                mismatched.append(company_id)
+        last_id = company_ids[-1]
+    return mismatched
+
+
+def _rows_of(rows: list[dict[str, object]], company_id: int) -> list[dict[str, object]]:
+    return sorted(
+        (row for row in rows if row["company_id"] == company_id),
+        key=lambda row: str(row["lang_code"]),
+    )
+
+
+async def main(command: str, batch_size: int) -> int:
+    await init_db()
+
+    exit_code = 0
+    async for session in get_async_session():
+        if command == "rebuild":
+            rebuilt = await rebuild(session, batch_size)
+            print(f"rebuilt profiles of {rebuilt} companies")
+        else:
+            mismatched = await check(session, batch_size)
+            for company_id in mismatched:
+                print(f"mismatch: company_id={company_id}")
+            print(f"{len(mismatched)} companies out of sync")
+            exit_code = 1 if mismatched else 0
+
+    await close_db()
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.command, args.batch_size)))
@@ -0,0 +1,234 @@
+# ruff: noqa: T201
+"""
+회사/태그 CSV 스트리밍 적재 CLI
+
+    python -m scripts.import_companies dummy/company_tag_sample.csv --chunk-size 5000
+
+CSV 헤더는 company_<lang>(회사명)과 tag_<lang>("|"로 구분한 태그명, 같은 위치의
+태그명끼리 한 태그) 열로 구성합니다. 예: company_ko,company_en,tag_ko,tag_en
+
+파일을 --chunk-size 행씩 읽어 chunk마다 회사/회사명/태그/태그명/연결을
+multi-row INSERT로 적재하고 프로필을 갱신한 뒤 커밋합니다. 태그는 시작 시
+DB의 전체 태그명으로 (언어, 태그명) -> tag_id 사전을 만들어 모든 언어에 걸쳐
+메모리에서 찾으므로 태그 조회 쿼리가 없습니다. 이미 등록되었거나 파일 안에서
+앞선 행과 회사명이 겹치는 행과 회사명이 없는 행은 건너뜁니다.
+
+실행 중인 API 서버의 인메모리 인덱스/캐시에는 반영되지 않으므로 적재 후 재시작하세요.
+(태그 사전의 태그명은 TAG_DICTIONARY_TTL이 지나면 DB에서 다시 읽습니다.)
+"""
+
+import argparse
+import asyncio
+import csv
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.hangul import extract_chosung
+from app.db.session import close_db, get_async_session, init_db
+from app.models.company import CompanyName, CompanyTag
+from app.models.tag import TagName
+from app.repositories.bulk import insert_rows
+from app.repositories.company import CompanyRepository
+from app.repositories.company_profile import CompanyProfileRepository
+from app.repositories.company_tag import CompanyTagRepository
+from app.repositories.tag import TagNameLookup, resolve_tag_names
+
+_COMPANY_PREFIX = "company_"
+_TAG_PREFIX = "tag_"
+_TAG_SEPARATOR = "|"
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    companies: int = 0
+    skipped: int = 0
+    tags: int = 0
+    links: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class _Row:
+    company_names: dict[str, str]
+    tag_names_list: list[dict[str, str]]
+
+
+def _languages(fieldnames: Sequence[str], prefix: str) -> list[str]:
+    return [
+        field.removeprefix(prefix) for field in fieldnames if field.startswith(prefix)
+    ]
+
+
+def _parse_row(
+    row: dict[str, str], company_langs: list[str], tag_langs: list[str]
+) -> _Row:
+    company_names = {
+        lang_code: name
+        for lang_code in company_langs
+        if (name := (row.get(_COMPANY_PREFIX + lang_code) or "").strip())
+    }
+    tag_columns = {
+        lang_code: [
+            name.strip()
+            for name in (row.get(_TAG_PREFIX + lang_code) or "").split(_TAG_SEPARATOR)
+            if name.strip()
+        ]
+        for lang_code in tag_langs
+    }
+    tag_count = max((len(names) for names in tag_columns.values()), default=0)
+    return _Row(
+        company_names=company_names,
+        tag_names_list=[
+            {
+                lang_code: names[position]
+                for lang_code, names in tag_columns.items()
+                if position < len(names)
+            }
+            for position in range(tag_count)
+        ],
+    )
+
+
+async def _import_chunk(
+    db: AsyncSession, rows: list[_Row], tag_lookup: TagNameLookup, stats: ImportStats
+) -> None:
+    company_repo = CompanyRepository(db)
+    existing_names = await company_repo.find_existing_names(
+        name for row in rows for name in row.company_names.values()
+    )
+
+    accepted: list[_Row] = []
+    for row in rows:
+        names = set(row.company_names.values())
+        if names and names.isdisjoint(existing_names):
+            accepted.append(row)
+            existing_names.update(names)
+    stats.rows += len(rows)
+    stats.skipped += len(rows) - len(accepted)
+    if not accepted:
+        return
+
+    company_ids = await company_repo.bulk_create(len(accepted))
+    await insert_rows(
+        db,
+        CompanyName,
+        [
+            {
+                "company_id": company_id,
+                "name": name,
+                "lang_code": lang_code,
+                "name_chosung": extract_chosung(name),
+            }
+            for company_id, row in zip(company_ids, accepted, strict=True)
+            for lang_code, name in row.company_names.items()
+        ],
+    )
+
+    # 사전을 chunk 사이에 유지하므로 태그 조회 쿼리 없이 새 태그/태그명만 INSERT 합니다.
+    resolved, _ = await resolve_tag_names(
+        db, tag_lookup, [names for row in accepted for names in row.tag_names_list]
+    )
+    links: list[tuple[int, int]] = []
+    position = 0
+    for company_id, row in zip(company_ids, accepted, strict=True):
+        row_tag_ids = resolved.tag_ids[position : position + len(row.tag_names_list)]
+        position += len(row.tag_names_list)
+        links.extend((company_id, tag_id) for tag_id in dict.fromkeys(row_tag_ids))
+    await insert_rows(
+        db,
+        CompanyTag,
+        [{"company_id": company_id, "tag_id": tag_id} for company_id, tag_id in links],
+    )
+    await CompanyTagRepository(db).increment_usage(
+        Counter(tag_id for _, tag_id in links)
+    )
+
+    # 기존 태그에 새 언어 이름이 추가되면 그 태그를 가진 기존 회사의 프로필도 바뀝니다.
+    await CompanyProfileRepository(db).refresh(
+        company_ids, tag_ids=resolved.renamed_tag_ids
+    )
+
+    stats.companies += len(accepted)
+    stats.tags += len(resolved.created_tag_ids)
+    stats.links += len(links)
+
+
+async def import_csv(
+    db: AsyncSession,
+    path: str | Path,
+    chunk_size: int = 5000,
+    on_chunk: Callable[[ImportStats], None] | None = None,
+) -> ImportStats:
+    """
+    CSV를 chunk_size 행씩 스트리밍으로 적재하고 통계를 반환합니다.
+    chunk마다 커밋하고 세션을 비워 메모리 사용량이 파일 크기와 관계없이 일정합니다.
+    """
+    tag_lookup = TagNameLookup()
+    result = await db.execute(
+        select(TagName.tag_id, TagName.lang_code, TagName.name).order_by(
+            TagName.tag_id, TagName.lang_code
+        )
+    )
+    for tag_id, lang_code, name in result:
+        tag_lookup.add(tag_id, lang_code, name)
+
+    stats = ImportStats()
+    started = time.perf_counter()
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        company_langs = _languages(fieldnames, _COMPANY_PREFIX)
+        tag_langs = _languages(fieldnames, _TAG_PREFIX)
+        if not company_langs:
+            raise ValueError(f"{path}: company_<lang> 열이 없습니다.")
+
+        while chunk := list(islice(reader, chunk_size)):
+            rows = [_parse_row(row, company_langs, tag_langs) for row in chunk]
+            await _import_chunk(db, rows, tag_lookup, stats)
+            await db.commit()
+            db.expunge_all()
+
+            stats.elapsed = time.perf_counter() - started
+            if on_chunk is not None:
+                on_chunk(stats)
+    return stats
+
+
+def _report(stats: ImportStats) -> None:
+    print(
+        f"{stats.rows} rows ({stats.companies} companies, {stats.skipped} skipped, "
+        f"{stats.tags} new tags, {stats.links} links) in {stats.elapsed:.1f}s  "
+        f"{stats.rows_per_second:>8.0f} rows/s"
+    )
+
+
+async def main(path: str, chunk_size: int) -> None:
+    await init_db()
+
+    async for session in get_async_session():
+        stats = await import_csv(session, path, chunk_size, on_chunk=_report)
+        print("done")
+        _report(stats)
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="적재할 CSV 파일")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.path, args.chunk_size))
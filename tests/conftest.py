@@ -7,13 +7,16 @@ import pytest_asyncio
 from alembic import command
 from alembic.config import Config
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, delete, event, inspect, select, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.db import session as db_session
 from app.main import app
+from app.models.company import Company, CompanyName, CompanyProfile, CompanyTag
+from app.models.tag import Tag, TagName
 from dummy.insert_dummy_data import insert_dummy_data
 from tests.factories.company import (
     CompanyFactory,
@@ -37,6 +40,40 @@ class TrackingSession(Session):
         self.created_objects.extend(instances)
 
 
+def factory_company_ids(session: TrackingSession) -> set[int]:
+    """
+    팩토리가 만들거나 바꾼 회사의 id를 모읍니다.
+    팩토리로 만든 태그나 태그명은 그 태그를 가진 회사의 프로필도 바꾸므로 함께 포함합니다.
+    """
+    identities: dict[type, set[tuple[Any, ...]]] = {}
+    for obj in session.created_objects:
+        identity = inspect(obj).identity
+        if identity is not None:
+            identities.setdefault(type(obj), set()).add(identity)
+
+    company_ids = {company_id for (company_id,) in identities.get(Company, ())}
+    company_ids.update(company_id for company_id, _ in identities.get(CompanyTag, ()))
+    tag_ids = {tag_id for (tag_id,) in identities.get(Tag, ())}
+
+    if name_ids := [id_ for (id_,) in identities.get(CompanyName, ())]:
+        company_ids.update(
+            session.scalars(
+                select(CompanyName.company_id).where(CompanyName.id.in_(name_ids))
+            )
+        )
+    if tag_name_ids := [id_ for (id_,) in identities.get(TagName, ())]:
+        tag_ids.update(
+            session.scalars(select(TagName.tag_id).where(TagName.id.in_(tag_name_ids)))
+        )
+    if tag_ids:
+        company_ids.update(
+            session.scalars(
+                select(CompanyTag.company_id).where(CompanyTag.tag_id.in_(tag_ids))
+            )
+        )
+    return company_ids
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop = asyncio.new_event_loop()
@@ -84,10 +121,19 @@ def test_session() -> Generator[TrackingSession, None, None]:
 
     yield session
 
+    # 팩토리는 서비스 계층을 거치지 않으므로 팩토리가 건드린 회사의 company_profile만 지워
+    # 다음 테스트가 그 회사를 원본 테이블 조회(fallback)로 정확히 읽도록 합니다.
+    company_ids = factory_company_ids(session)
+
     for obj in reversed(session.created_objects):
         if obj in session:
             session.delete(obj)
 
+    if company_ids:
+        session.execute(
+            delete(CompanyProfile).where(CompanyProfile.company_id.in_(company_ids))
+        )
+
     try:
         session.commit()
     except Exception:
@@ -100,3 +146,18 @@ def test_session() -> Generator[TrackingSession, None, None]:
 def api() -> Generator[TestClient, None, None]:
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture
+def query_counter(api: TestClient) -> Generator[list[str], None, None]:
+    """api 호출 중 DB로 전송된 SQL 문을 기록합니다."""
+    assert db_session.async_engine is not None
+    engine = db_session.async_engine.sync_engine
+    statements: list[str] = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
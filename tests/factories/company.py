@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from factory.declarations import Iterator, SubFactory
+from factory.declarations import Iterator, LazyAttribute, SubFactory
 from factory.faker import Faker
 
+from app.core.hangul import extract_chosung
 from app.models.company import Company, CompanyName, CompanyTag
 from tests.factories.base import TestFactory
 from tests.factories.tag import TagFactory
@@ -17,6 +18,7 @@ class CompanyNameFactory(TestFactory):
     company = SubFactory(CompanyFactory)
     name = Faker("company")
     lang_code = Iterator(["en", "ko", "ja"])
+    name_chosung = LazyAttribute(lambda o: extract_chosung(o.name))
 
     class Meta:
         model = CompanyName
@@ -0,0 +1,553 @@
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import clear_caches
+from app.core.config import settings
+from app.core.tag_dictionary import tag_dictionary
+from tests.factories.company import (
+    CompanyFactory,
+    CompanyNameFactory,
+    CompanyTagFactory,
+)
+from tests.factories.tag import TagFactory, TagNameFactory
+
+
+def _create_company(names: dict[str, str], tags: list[dict[str, str]]) -> None:
+    company = CompanyFactory.create()
+    for lang_code, name in names.items():
+        CompanyNameFactory.create(name=name, lang_code=lang_code, company=company)
+
+    for tag_names in tags:
+        tag = TagFactory.create()
+        for lang_code, name in tag_names.items():
+            TagNameFactory.create(name=name, lang_code=lang_code, tag=tag)
+        CompanyTagFactory.create(company=company, tag=tag)
+
+
+def test_get_company_reads_single_profile_row(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"en": "Profile Corp", "tw": "Profile Corp TW"},
+            "tags": [
+                {"tag_name": {"ko": "태그_프로필1", "en": "tag_profile1"}},
+                {"tag_name": {"en": "tag_profile2", "tw": "tag_profile2_tw"}},
+                {"tag_name": {"tw": "tag_profile3_tw"}},
+            ],
+        },
+    )
+    query_counter.clear()
+
+    resp = api.get("/companies/Profile Corp", headers=[("x-wanted-language", "ko")])
+
+    # 요청 언어(ko) > 기본 언어(ko) > 알파벳 순 fallback
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "company_name": "Profile Corp",
+        "tags": ["태그_프로필1", "tag_profile2", "tag_profile3_tw"],
+    }
+    # 쓰기 시점에 만들어 둔 company_profile 한 행만 읽습니다.
+    assert len(query_counter) == 1
+
+
+def test_get_company_without_profile_falls_back(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    # 팩토리로 만든 회사는 company_profile 행이 없어 원본 테이블 조회로 대체됩니다.
+    _create_company(
+        {"en": "Fallback Corp", "tw": "Fallback Corp TW"},
+        [
+            {"ko": "태그_폴백1", "en": "tag_fallback1"},
+            {"en": "tag_fallback2", "tw": "tag_fallback2_tw"},
+            {"tw": "tag_fallback3_tw"},
+        ],
+    )
+    query_counter.clear()
+
+    resp = api.get("/companies/Fallback Corp", headers=[("x-wanted-language", "tw")])
+
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "company_name": "Fallback Corp TW",
+        "tags": ["태그_폴백1", "tag_fallback2_tw", "tag_fallback3_tw"],
+    }
+    # 비어 있는 프로필 조회 한 번과 회사명/태그 fallback을 한 번에 푸는 CTE 한 문장입니다.
+    profile_lookup, fallback = query_counter
+    assert "company_profile" in profile_lookup
+    assert fallback.lstrip().startswith("WITH")
+    assert "company_profile" not in fallback
+
+
+def test_company_profile_follows_tag_writes(api: TestClient) -> None:
+    headers = [("x-wanted-language", "en")]
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "프로필갱신"},
+            "tags": [{"tag_name": {"ko": "태그_프로필갱신1"}}],
+        },
+        headers=headers,
+    )
+    api.put(
+        "/companies/프로필갱신/tags",
+        json=[{"tag_name": {"ko": "태그_프로필갱신2", "en": "tag_profile_refresh2"}}],
+        headers=headers,
+    )
+    api.delete("/companies/프로필갱신/tags/태그_프로필갱신1", headers=headers)
+
+    resp = api.get("/companies/프로필갱신", headers=headers)
+    assert resp.json() == {
+        "company_name": "프로필갱신",
+        "tags": ["tag_profile_refresh2"],
+    }
+
+    resp = api.get("/tags?query=태그_프로필갱신2", headers=headers)
+    assert resp.json() == [
+        {"company_name": "프로필갱신", "tags": ["tag_profile_refresh2"]}
+    ]
+
+
+def test_get_company_without_tags(api: TestClient) -> None:
+    _create_company({"ja": "タグなし株式会社"}, [])
+
+    resp = api.get("/companies/タグなし株式会社", headers=[("x-wanted-language", "en")])
+
+    assert resp.status_code == 200
+    assert resp.json() == {"company_name": "タグなし株式会社", "tags": []}
+
+
+def test_get_company_is_cached_until_tags_change(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    _create_company({"ko": "캐시회사A"}, [{"ko": "공유태그"}])
+    _create_company({"ko": "캐시회사B"}, [])
+    headers = [("x-wanted-language", "en")]
+
+    first = api.get("/companies/캐시회사A", headers=headers)
+    query_counter.clear()
+    second = api.get("/companies/캐시회사A", headers=headers)
+
+    assert (
+        first.json()
+        == second.json()
+        == {
+            "company_name": "캐시회사A",
+            "tags": ["공유태그"],
+        }
+    )
+    assert query_counter == []
+
+    stats = api.get("/metrics/caches").json()["company_profile"]
+    assert stats["endpoints"]["GET /companies/{company_name}"]["hits"] >= 1
+
+    # 다른 회사를 통해 공유 태그에 영어 이름이 추가되면 캐시된 프로필도 무효화됩니다.
+    api.put(
+        "/companies/캐시회사B/tags",
+        json=[{"tag_name": {"ko": "공유태그", "en": "shared_tag"}}],
+        headers=headers,
+    )
+
+    resp = api.get("/companies/캐시회사A", headers=headers)
+    assert resp.json() == {"company_name": "캐시회사A", "tags": ["shared_tag"]}
+
+
+def test_get_company_etag_revalidation(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    api.post(
+        "/companies",
+        json={"company_name": {"ko": "이태그회사"}, "tags": []},
+    )
+    headers = [("x-wanted-language", "ko")]
+
+    resp = api.get("/companies/이태그회사", headers=headers)
+    etag = resp.headers["etag"]
+    assert resp.headers["vary"] == "x-wanted-language"
+    assert resp.headers["cache-control"].startswith("public")
+
+    query_counter.clear()
+    resp = api.get("/companies/이태그회사", headers=[*headers, ("if-none-match", etag)])
+    assert resp.status_code == 304
+    assert resp.content == b""
+    # ETag는 캐시된 프로필의 revision으로 만들므로 재검증에도 쿼리가 없습니다.
+    assert query_counter == []
+
+    # 캐시에 없어도 304는 revision만 조회하고 프로필은 만들지 않습니다.
+    clear_caches()
+    query_counter.clear()
+    resp = api.get("/companies/이태그회사", headers=[*headers, ("if-none-match", etag)])
+    assert resp.status_code == 304
+    assert len(query_counter) == 1
+    assert "company_profile" not in query_counter[0]
+
+    # 언어가 다르면 다른 표현이므로 ETag도 다릅니다.
+    resp = api.get("/companies/이태그회사", headers=[("x-wanted-language", "en")])
+    assert resp.headers["etag"] != etag
+
+    api.put(
+        "/companies/이태그회사/tags",
+        json=[{"tag_name": {"ko": "태그_이태그"}}],
+        headers=headers,
+    )
+
+    resp = api.get("/companies/이태그회사", headers=[*headers, ("if-none-match", etag)])
+    assert resp.status_code == 200
+    assert resp.json() == {"company_name": "이태그회사", "tags": ["태그_이태그"]}
+
+    tag_resp = api.get("/tags?query=태그_이태그", headers=headers)
+    resp = api.get(
+        "/tags?query=태그_이태그",
+        headers=[*headers, ("if-none-match", tag_resp.headers["etag"])],
+    )
+    assert resp.status_code == 304
+
+
+def test_batch_get_companies(api: TestClient, query_counter: list[str]) -> None:
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "배치회사1", "en": "Batch Corp 1"},
+            "tags": [{"tag_name": {"ko": "태그_배치1", "en": "tag_batch1"}}],
+        },
+    )
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "배치회사2"},
+            "tags": [{"tag_name": {"ko": "태그_배치2"}}],
+        },
+    )
+
+    query_counter.clear()
+    api.post("/companies:batchGet", json={"names": ["배치회사1", "배치회사2"]})
+    two_names_queries = len(query_counter)
+
+    query_counter.clear()
+    resp = api.post(
+        "/companies:batchGet",
+        json={
+            "names": ["Batch Corp 1", "없는회사", "배치회사2", "배치회사1"],
+            "language": "en",
+        },
+    )
+
+    # 회사 수와 관계없이 쿼리 수가 일정합니다.
+    assert len(query_counter) == two_names_queries
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "results": [
+            {
+                "name": "Batch Corp 1",
+                "found": True,
+                "company": {"company_name": "Batch Corp 1", "tags": ["tag_batch1"]},
+            },
+            {"name": "없는회사", "found": False, "company": None},
+            {
+                "name": "배치회사2",
+                "found": True,
+                "company": {"company_name": "배치회사2", "tags": ["태그_배치2"]},
+            },
+            {
+                "name": "배치회사1",
+                "found": True,
+                "company": {"company_name": "Batch Corp 1", "tags": ["tag_batch1"]},
+            },
+        ]
+    }
+
+
+def test_batch_get_companies_localizes_tags_from_dictionary(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    assert tag_dictionary.is_loaded
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "사전회사1"},
+            "tags": [{"tag_name": {"ko": "태그_사전"}}],
+        },
+    )
+    api.post("/companies", json={"company_name": {"ko": "사전회사2"}, "tags": []})
+    # 기존 태그에 새 언어(ja) 태그명이 추가되면 커밋 후 태그 사전에도 반영됩니다.
+    api.put(
+        "/companies/사전회사2/tags",
+        json=[{"tag_name": {"ko": "태그_사전", "ja": "タグ_辞書"}}],
+    )
+
+    query_counter.clear()
+    resp = api.post(
+        "/companies:batchGet",
+        json={"names": ["사전회사1", "사전회사2"], "language": "ja"},
+    )
+
+    assert [result["company"] for result in resp.json()["results"]] == [
+        {"company_name": "사전회사1", "tags": ["タグ_辞書"]},
+        {"company_name": "사전회사2", "tags": ["タグ_辞書"]},
+    ]
+    # 태그명은 태그 사전에서 읽으므로 tag_name 테이블을 조회하지 않습니다.
+    assert not [statement for statement in query_counter if "tag_name" in statement]
+
+
+def test_tag_dictionary_rereads_names_written_elsewhere(
+    api: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    company = CompanyFactory.create()
+    CompanyNameFactory.create(name="외부사전회사", lang_code="ko", company=company)
+    tag = TagFactory.create()
+    TagNameFactory.create(name="태그_외부사전", lang_code="ko", tag=tag)
+    CompanyTagFactory.create(company=company, tag=tag)
+
+    def batch_get_tags() -> list[str]:
+        resp = api.post(
+            "/companies:batchGet", json={"names": ["외부사전회사"], "language": "ja"}
+        )
+        return resp.json()["results"][0]["company"]["tags"]
+
+    assert batch_get_tags() == ["태그_외부사전"]
+
+    # 다른 워커나 CSV 적재기가 쓴 태그명은 이 프로세스의 사전에 바로 반영되지 않고
+    # TAG_DICTIONARY_TTL이 지나 DB에서 다시 읽을 때 반영됩니다.
+    TagNameFactory.create(name="タグ_外部辞書", lang_code="ja", tag=tag)
+    assert batch_get_tags() == ["태그_외부사전"]
+
+    monkeypatch.setattr(settings, "TAG_DICTIONARY_TTL", 1e-9)
+    assert batch_get_tags() == ["タグ_外部辞書"]
+
+
+def test_batch_get_companies_validation(api: TestClient) -> None:
+    assert api.post("/companies:batchGet", json={"names": []}).status_code == 422
+    resp = api.post(
+        "/companies:batchGet", json={"names": ["배치회사1"], "language": "zz"}
+    )
+    assert resp.status_code == 422
+
+
+def test_create_company_tag_names_fall_back_in_sql(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    resp = api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "폴백회사", "en": "Fallback Names Inc"},
+            "tags": [
+                {"tag_name": {"ko": "태그_폴백A"}},
+                {"tag_name": {"en": "tag_fallback_b", "ja": "タグ_フォールバックB"}},
+                {"tag_name": {"en": "tag_fallback_c", "tw": "tag_fallback_c_tw"}},
+            ],
+        },
+        headers=[("x-wanted-language", "ja")],
+    )
+
+    # 요청 언어(ja) > 기본 언어(ko) > 알파벳 순
+    assert resp.json() == {
+        "company_name": "폴백회사",
+        "tags": ["태그_폴백A", "タグ_フォールバックB", "tag_fallback_c"],
+    }
+    tag_name_queries = [
+        statement for statement in query_counter if "ranked_tag_names" in statement
+    ]
+    assert len(tag_name_queries) == 1
+
+
+def _batch_create_request(prefix: str, count: int) -> dict[str, Any]:
+    return {
+        "companies": [
+            {
+                "company_name": {"ko": f"{prefix}{number}"},
+                "tags": [
+                    {"tag_name": {"ko": "태그_일괄공통", "en": "tag_bulk_common"}},
+                    {"tag_name": {"ko": f"태그_{prefix}{number}"}},
+                ],
+            }
+            for number in range(count)
+        ]
+    }
+
+
+def test_batch_create_companies(api: TestClient, query_counter: list[str]) -> None:
+    headers = [("x-wanted-language", "en")]
+    resp = api.post(
+        "/companies:batchCreate",
+        json={
+            "companies": [
+                {
+                    "company_name": {"ko": "일괄회사1", "en": "Bulk Corp 1"},
+                    "tags": [
+                        {"tag_name": {"ko": "태그_일괄1", "en": "tag_bulk1"}},
+                        {"tag_name": {"ko": "태그_일괄2"}},
+                    ],
+                },
+                {
+                    "company_name": {"ko": "일괄회사2"},
+                    # 다른 항목의 태그와 (언어, 태그명)이 같으면 같은 태그로 연결됩니다.
+                    "tags": [{"tag_name": {"en": "tag_bulk1", "ja": "タグ_一括1"}}],
+                },
+                {"company_name": {"en": "Bulk Corp 1"}, "tags": []},
+                {"company_name": {"ko": "딤딤섬 대구점"}, "tags": []},
+            ]
+        },
+        headers=headers,
+    )
+
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "results": [
+            {
+                "status": "created",
+                "company": {
+                    "company_name": "Bulk Corp 1",
+                    "tags": ["tag_bulk1", "태그_일괄2"],
+                },
+            },
+            {
+                "status": "created",
+                "company": {"company_name": "일괄회사2", "tags": ["tag_bulk1"]},
+            },
+            {"status": "duplicate", "company": None},
+            {"status": "exists", "company": None},
+        ]
+    }
+
+    resp = api.get("/companies/일괄회사1", headers=[("x-wanted-language", "ja")])
+    assert resp.json() == {
+        "company_name": "일괄회사1",
+        "tags": ["タグ_一括1", "태그_일괄2"],
+    }
+    resp = api.get("/tags?query=tag_bulk1", headers=headers)
+    assert [company["company_name"] for company in resp.json()] == [
+        "Bulk Corp 1",
+        "일괄회사2",
+    ]
+
+    # 회사 수와 관계없이 쿼리 수가 일정합니다.
+    query_counter.clear()
+    api.post("/companies:batchCreate", json=_batch_create_request("일괄소", 2))
+    two_companies_queries = len(query_counter)
+
+    query_counter.clear()
+    resp = api.post("/companies:batchCreate", json=_batch_create_request("일괄대", 6))
+    assert len(query_counter) == two_companies_queries
+    assert [result["status"] for result in resp.json()["results"]] == ["created"] * 6
+
+
+def test_tag_writes_use_constant_queries(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    def tags(prefix: str, count: int) -> list[dict[str, Any]]:
+        return [
+            {"tag_name": {"ko": f"{prefix}_{number}", "en": f"{prefix}_en_{number}"}}
+            for number in range(count)
+        ]
+
+    query_counter.clear()
+    api.post(
+        "/companies",
+        json={"company_name": {"ko": "태그수회사1"}, "tags": tags("태그수1", 1)},
+    )
+    one_tag_queries = len(query_counter)
+
+    query_counter.clear()
+    resp = api.post(
+        "/companies",
+        json={"company_name": {"ko": "태그수회사2"}, "tags": tags("태그수30", 30)},
+    )
+    assert len(resp.json()["tags"]) == 30
+    # 태그 수와 관계없이 일정하며, 태그마다 조회/flush하던 때(약 60회)보다 훨씬 적습니다.
+    assert len(query_counter) == one_tag_queries
+    assert len(query_counter) <= 15
+    assert [s for s in query_counter if s.startswith("INSERT IGNORE INTO company_tag")]
+
+    query_counter.clear()
+    api.put("/companies/태그수회사1/tags", json=tags("태그수PUT1", 1))
+    one_tag_queries = len(query_counter)
+
+    query_counter.clear()
+    # 이미 연결된 태그(태그수30_0)는 건너뛰고 나머지를 한 번에 연결합니다.
+    resp = api.put(
+        "/companies/태그수회사2/tags",
+        json=tags("태그수PUT30", 29) + tags("태그수30", 1),
+    )
+    assert len(resp.json()["tags"]) == 59
+    assert len(query_counter) == one_tag_queries
+
+
+def test_add_tags_response_is_built_without_rereading(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    headers = [("x-wanted-language", "ja")]
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "즉시응답회사", "en": "Instant Reply Inc"},
+            "tags": [{"tag_name": {"ko": "태그_즉시1", "en": "tag_instant1"}}],
+        },
+    )
+
+    query_counter.clear()
+    resp = api.put(
+        "/companies/Instant Reply Inc/tags",
+        json=[
+            {"tag_name": {"ko": "태그_즉시2", "ja": "タグ_即時2"}},
+            {"tag_name": {"ko": "태그_즉시1"}},
+        ],
+        headers=headers,
+    )
+
+    expected = {"company_name": "즉시응답회사", "tags": ["태그_즉시1", "タグ_即時2"]}
+    assert resp.json() == expected
+    # 쓰기 후 회사 프로필을 다시 조회하지 않습니다.
+    profile_reads = [
+        s for s in query_counter if s.startswith("SELECT") and "company_profile" in s
+    ]
+    assert not profile_reads
+    assert api.get("/companies/즉시응답회사", headers=headers).json() == expected
+
+
+def test_create_company_idempotency_key_replays_response(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    body = {
+        "company_name": {"ko": "멱등회사", "en": "Idempotent Inc"},
+        "tags": [{"tag_name": {"ko": "태그_멱등", "en": "tag_idempotent"}}],
+    }
+    headers = [("x-wanted-language", "en"), ("idempotency-key", "create-1")]
+
+    first = api.post("/companies", json=body, headers=headers)
+    assert first.status_code == 200
+    assert "idempotent-replayed" not in first.headers
+
+    # 타임아웃 후 재시도: 저장된 응답을 재생하고 DB에는 접근하지 않습니다.
+    query_counter.clear()
+    retry = api.post("/companies", json=body, headers=headers)
+    assert query_counter == []
+    assert retry.status_code == 200
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+
+    # 같은 키로 다른 요청을 보내면 거부합니다.
+    resp = api.post(
+        "/companies",
+        json={**body, "company_name": {"ko": "다른멱등회사"}},
+        headers=headers,
+    )
+    assert resp.status_code == 422
+
+    # 4xx 오류도 저장해 재시도에 같은 오류를 돌려줍니다.
+    headers = [("x-wanted-language", "en"), ("idempotency-key", "create-2")]
+    resp = api.post("/companies", json=body, headers=headers)
+    assert resp.status_code == 400
+    query_counter.clear()
+    resp = api.post("/companies", json=body, headers=headers)
+    assert query_counter == []
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Company already exists"}
+    assert resp.headers["idempotent-replayed"] == "true"
+
+    # 키가 없으면 기존처럼 매번 처리합니다.
+    resp = api.post("/companies", json=body)
+    assert resp.status_code == 400
+    assert "idempotent-replayed" not in resp.headers
@@ -0,0 +1,150 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import search_cache
+from app.core.config import settings
+from app.main import app
+from tests.factories.company import CompanyNameFactory
+
+
+@pytest.mark.parametrize("query", ["링크", "마케팅", "Entertain"])
+def test_search_index_matches_fulltext(
+    api: TestClient, monkeypatch: pytest.MonkeyPatch, query: str
+) -> None:
+    headers = [("x-wanted-language", "ko")]
+
+    indexed = api.get(f"/search?query={query}", headers=headers)
+
+    monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", False)
+    search_cache.clear()
+    fulltext = api.get(f"/search?query={query}", headers=headers)
+
+    assert indexed.status_code == fulltext.status_code == 200
+    assert sorted(c["company_name"] for c in indexed.json()) == sorted(
+        c["company_name"] for c in fulltext.json()
+    )
+
+
+def test_search_index_reflects_new_company(api: TestClient) -> None:
+    resp = api.post(
+        "/companies",
+        json={"company_name": {"ko": "검색인덱스테스트"}, "tags": []},
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.status_code == 200
+
+    resp = api.get("/search?query=인덱스테", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == [{"company_name": "검색인덱스테스트"}]
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+def test_search_ranks_prefix_and_shorter_names_first(
+    monkeypatch: pytest.MonkeyPatch, index_enabled: bool
+) -> None:
+    # 질의로 시작하는 회사명은 부분 일치하는 회사명보다 길어도 앞섭니다.
+    CompanyNameFactory.create(name="마케팅솔루션그룹코리아", lang_code="ko")
+    monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", index_enabled)
+
+    # 팩토리로 만든 회사명이 인메모리 인덱스에 적재되도록 앱을 새로 시작합니다.
+    with TestClient(app) as client:
+        resp = client.get("/search?query=마케팅", headers=[("x-wanted-language", "ko")])
+
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {"company_name": "마케팅솔루션그룹코리아"},
+        {"company_name": "소굿마케팅"},
+        {"company_name": "이상한마케팅"},
+    ]
+
+
+def test_search_limit(api: TestClient) -> None:
+    resp = api.get(
+        "/search?query=마케팅&limit=1", headers=[("x-wanted-language", "ko")]
+    )
+    assert resp.json() == [{"company_name": "소굿마케팅"}]
+
+    resp = api.get(
+        "/search?query=마케팅&limit=0", headers=[("x-wanted-language", "ko")]
+    )
+    assert resp.status_code == 422
+
+
+def test_search_cache_hit_and_invalidation(api: TestClient) -> None:
+    headers = [("x-wanted-language", "ko")]
+
+    api.get("/search?query=캐시무효화", headers=headers)
+    before = api.get("/metrics/caches").json()["search"]
+
+    resp = api.get("/search?query=캐시무효화", headers=headers)
+    after = api.get("/metrics/caches").json()["search"]
+    assert resp.json() == []
+    assert after["hits"] == before["hits"] + 1
+
+    api.post(
+        "/companies",
+        json={"company_name": {"ko": "캐시무효화테스트"}, "tags": []},
+        headers=headers,
+    )
+
+    resp = api.get("/search?query=캐시무효화", headers=headers)
+    assert resp.json() == [{"company_name": "캐시무효화테스트"}]
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+@pytest.mark.parametrize(
+    ("query", "language", "expected"),
+    [
+        ("딤", "ko", ["딤딤섬 대구점"]),
+        ("株", "ja", ["株式会社ZMP", "株式会社SM Entertainment Japan"]),
+        ("g", "en", ["Grab", "GEOCM Co."]),
+    ],
+)
+def test_search_single_character_query(
+    api: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    index_enabled: bool,
+    query: str,
+    language: str,
+    expected: list[str],
+) -> None:
+    monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", index_enabled)
+
+    resp = api.get(f"/search?query={query}", headers=[("x-wanted-language", language)])
+
+    assert resp.status_code == 200
+    assert [c["company_name"] for c in resp.json()] == expected
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+def test_search_chosung_prefix(
+    api: TestClient, monkeypatch: pytest.MonkeyPatch, index_enabled: bool
+) -> None:
+    monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", index_enabled)
+    headers = [("x-wanted-language", "ko")]
+
+    resp = api.get("/search?query=ㅅㅍㄹ", headers=headers)
+    assert resp.json() == [{"company_name": "스피링크"}]
+
+    resp = api.get("/search?query=ㅈㅅㅎㅅ ㄹㅋ", headers=headers)
+    assert resp.json() == [{"company_name": "주식회사 링크드코리아"}]
+
+
+def test_fuzzy_search(api: TestClient) -> None:
+    headers = [("x-wanted-language", "ko")]
+
+    resp = api.get("/search?query=스피렁크", headers=headers)
+    assert resp.json() == []
+
+    resp = api.get("/search?query=스피렁크&fuzzy=true", headers=headers)
+    assert resp.json() == [{"company_name": "스피링크"}]
+
+
+def test_fuzzy_company_lookup(api: TestClient) -> None:
+    headers = [("x-wanted-language", "ko")]
+
+    resp = api.get("/companies/infobnk", headers=headers)
+    assert resp.status_code == 404
+
+    resp = api.get("/companies/infobnk?fuzzy=true", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json() == {"company_name": "인포뱅크", "tags": ["태그_25"]}
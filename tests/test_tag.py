@@ -0,0 +1,359 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.tag_index import tag_company_index
+from app.services.tag_write_queue import tag_write_queue
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+def test_get_tags_keyset_pagination(api: TestClient, index_enabled: bool) -> None:
+    if not index_enabled:
+        tag_company_index.clear()
+    headers = [("x-wanted-language", "ko")]
+
+    pages = []
+    cursor = None
+    while True:
+        params = {"query": "タグ_22", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = api.get("/tags", params=params, headers=headers)
+        assert resp.status_code == 200
+
+        pages.append([company["company_name"] for company in resp.json()])
+        cursor = resp.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert pages == [
+        ["딤딤섬 대구점", "마이셀럽스"],
+        ["Rejoice Pregnancy", "삼일제약"],
+        ["투게더앱스"],
+    ]
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+def test_get_tags_ignores_case(api: TestClient, index_enabled: bool) -> None:
+    if not index_enabled:
+        tag_company_index.clear()
+
+    # 태그명은 DB 콜레이션(utf8mb4_general_ci)과 같이 대소문자를 구분하지 않습니다.
+    resp = api.get(
+        "/tags", params={"query": "TAG_22"}, headers=[("x-wanted-language", "ko")]
+    )
+
+    assert resp.status_code == 200
+    assert [company["company_name"] for company in resp.json()] == [
+        "딤딤섬 대구점",
+        "마이셀럽스",
+        "Rejoice Pregnancy",
+        "삼일제약",
+        "투게더앱스",
+    ]
+
+
+def test_get_tags_not_found_and_invalid_cursor(api: TestClient) -> None:
+    resp = api.get("/tags?query=존재하지않는태그")
+    assert resp.status_code == 404
+
+    resp = api.get("/tags", params={"query": "タグ_22", "cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+def test_get_tags_etag_per_page(api: TestClient, query_counter: list[str]) -> None:
+    headers = [("x-wanted-language", "ko")]
+    params = {"query": "タグ_22", "limit": 2}
+
+    first = api.get("/tags", params=params, headers=headers)
+    second = api.get(
+        "/tags",
+        params={**params, "cursor": first.headers["x-next-cursor"]},
+        headers=headers,
+    )
+    # ETag는 페이지의 회사와 다음 커서로 만들므로 페이지마다 다릅니다.
+    assert first.headers["etag"] != second.headers["etag"]
+
+    query_counter.clear()
+    resp = api.get(
+        "/tags",
+        params=params,
+        headers=[*headers, ("if-none-match", first.headers["etag"])],
+    )
+    assert resp.status_code == 304
+    # 304는 페이지 회사의 revision만 조회하고 프로필은 읽지 않습니다.
+    assert len(query_counter) == 1
+    assert "company_profile" not in query_counter[0]
+
+    resp = api.get("/tags", params={**params, "limit": 3}, headers=headers)
+    assert resp.headers["etag"] != first.headers["etag"]
+
+
+def test_tag_index_follows_tag_writes(api: TestClient) -> None:
+    assert tag_company_index.is_loaded
+    headers = [("x-wanted-language", "ko")]
+
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "역색인회사"},
+            "tags": [{"tag_name": {"ko": "태그_역색인", "en": "tag_inverted"}}],
+        },
+        headers=headers,
+    )
+    (tag_id,) = tag_company_index.tag_ids("tag_inverted")
+
+    resp = api.get("/tags?query=tag_inverted", headers=headers)
+    assert resp.json() == [{"company_name": "역색인회사", "tags": ["태그_역색인"]}]
+
+    api.delete("/companies/역색인회사/tags/태그_역색인", headers=headers)
+
+    assert len(tag_company_index.company_ids(tag_id)) == 0
+    resp = api.get("/tags?query=tag_inverted", headers=headers)
+    assert resp.json() == []
+
+
+@pytest.mark.parametrize("index_enabled", [True, False])
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        (
+            {"all": ["タグ_22", "tag_2"]},
+            ["딤딤섬 대구점", "마이셀럽스", "삼일제약"],
+        ),
+        (
+            {"all": ["태그_22"], "none": ["태그_2"]},
+            ["Rejoice Pregnancy", "투게더앱스"],
+        ),
+        (
+            {"all": ["태그_22"], "any": ["태그_27", "tag_28"]},
+            ["마이셀럽스", "투게더앱스"],
+        ),
+        ({"all": ["태그_22", "존재하지않는태그"]}, []),
+        # 태그명은 대소문자를 구분하지 않으며, 대소문자만 다른 태그명은 같은 태그명입니다.
+        (
+            {"all": ["TAG_22", "tag_22"], "none": ["TAG_2"]},
+            ["Rejoice Pregnancy", "투게더앱스"],
+        ),
+        (
+            {"all": ["태그_22"], "any": ["TAG_27", "Tag_28"]},
+            ["마이셀럽스", "투게더앱스"],
+        ),
+    ],
+)
+def test_search_companies_by_tags(
+    api: TestClient,
+    index_enabled: bool,
+    params: dict[str, list[str]],
+    expected: list[str],
+) -> None:
+    if not index_enabled:
+        tag_company_index.clear()
+
+    resp = api.get("/tags/search", params=params, headers=[("x-wanted-language", "ko")])
+
+    assert resp.status_code == 200
+    assert [company["company_name"] for company in resp.json()] == expected
+
+
+def test_search_companies_by_tags_pagination(api: TestClient) -> None:
+    params = {"all": ["태그_22"], "any": ["태그_2"], "limit": 2}
+    resp = api.get("/tags/search", params=params)
+    assert [company["company_name"] for company in resp.json()] == [
+        "딤딤섬 대구점",
+        "마이셀럽스",
+    ]
+
+    params["cursor"] = resp.headers["x-next-cursor"]
+    resp = api.get("/tags/search", params=params)
+    assert [company["company_name"] for company in resp.json()] == ["삼일제약"]
+    assert "x-next-cursor" not in resp.headers
+
+
+def test_search_companies_by_tags_requires_positive_term(api: TestClient) -> None:
+    resp = api.get("/tags/search", params={"none": ["태그_2"]})
+    assert resp.status_code == 400
+
+
+def test_tag_facets_follow_tag_writes(api: TestClient) -> None:
+    headers = [("x-wanted-language", "en")]
+
+    def facets() -> dict[str, int]:
+        resp = api.get("/tags/facets", params={"limit": 100}, headers=headers)
+        assert resp.status_code == 200
+        counts = [facet["count"] for facet in resp.json()]
+        assert counts == sorted(counts, reverse=True)
+        return {facet["tag_name"]: facet["count"] for facet in resp.json()}
+
+    for company_name in ("패싯회사_1", "패싯회사_2", "패싯회사_3"):
+        api.post(
+            "/companies",
+            json={
+                "company_name": {"ko": company_name},
+                "tags": [{"tag_name": {"ko": "태그_패싯", "en": "tag_facet"}}],
+            },
+            headers=headers,
+        )
+    assert facets()["tag_facet"] == 3
+
+    api.delete("/companies/패싯회사_1/tags/tag_facet", headers=headers)
+    assert facets()["tag_facet"] == 2
+
+
+def test_delete_tags_in_bulk(api: TestClient, query_counter: list[str]) -> None:
+    headers = [("x-wanted-language", "en")]
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "일괄해제회사", "en": "Bulk Detach Inc"},
+            "tags": [
+                {"tag_name": {"ko": "태그_해제1", "en": "tag_detach1"}},
+                {"tag_name": {"ko": "태그_해제2", "en": "tag_detach2"}},
+                {"tag_name": {"ko": "태그_해제3", "en": "tag_detach3"}},
+            ],
+        },
+    )
+
+    query_counter.clear()
+    resp = api.request(
+        "DELETE",
+        "/companies/일괄해제회사/tags",
+        # 모든 언어의 태그명을 받으며, 연결되지 않은 태그명은 무시합니다.
+        json=["태그_해제1", "tag_detach2", "tag_4"],
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"company_name": "Bulk Detach Inc", "tags": ["tag_detach3"]}
+    deletes = [s for s in query_counter if s.startswith("DELETE FROM company_tag")]
+    assert len(deletes) == 1
+
+    resp = api.get("/companies/일괄해제회사", headers=headers)
+    assert resp.json() == {"company_name": "Bulk Detach Inc", "tags": ["tag_detach3"]}
+    resp = api.get("/tags?query=tag_detach1")
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+    resp = api.request("DELETE", "/companies/없는회사/tags", json=["태그_해제3"])
+    assert resp.status_code == 404
+    resp = api.request("DELETE", "/companies/일괄해제회사/tags", json=[])
+    assert resp.status_code == 422
+
+
+def test_delete_tag_uses_constant_queries(
+    api: TestClient, query_counter: list[str]
+) -> None:
+    headers = [("x-wanted-language", "en")]
+    for company_name, tag_count in (("단건해제회사1", 2), ("단건해제회사2", 10)):
+        api.post(
+            "/companies",
+            json={
+                "company_name": {"ko": company_name},
+                "tags": [
+                    {"tag_name": {"ko": f"태그_단건해제{number}"}}
+                    for number in range(tag_count)
+                ],
+            },
+        )
+
+    query_counter.clear()
+    resp = api.delete("/companies/단건해제회사1/tags/태그_단건해제0", headers=headers)
+    assert resp.json() == {"company_name": "단건해제회사1", "tags": ["태그_단건해제1"]}
+    two_tags_queries = len(query_counter)
+
+    query_counter.clear()
+    resp = api.delete("/companies/단건해제회사2/tags/태그_단건해제0", headers=headers)
+    assert len(resp.json()["tags"]) == 9
+    # 회사/태그 확인, 삭제, usage_count, 프로필 갱신(4), revision, 응답 조회
+    assert len(query_counter) == two_tags_queries
+    assert len(query_counter) <= 9
+
+    resp = api.delete("/companies/단건해제회사1/tags/태그_단건해제9", headers=headers)
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "Tag not found"
+    resp = api.delete("/companies/없는회사/tags/태그_단건해제1", headers=headers)
+    assert resp.json()["detail"] == "Company not found"
+
+
+def test_async_tag_writes_are_coalesced_per_company(
+    api: TestClient, monkeypatch: pytest.MonkeyPatch, query_counter: list[str]
+) -> None:
+    headers = [("x-wanted-language", "en")]
+    api.post(
+        "/companies",
+        json={
+            "company_name": {"ko": "병합쓰기회사", "en": "Coalesce Inc"},
+            "tags": [{"tag_name": {"ko": "태그_병합0", "en": "tag_coalesce0"}}],
+        },
+    )
+    monkeypatch.setattr(settings, "TAG_WRITE_QUEUE_ENABLED", True)
+    # 시간 창으로 flush되지 않게 하고 테스트에서 직접 flush합니다.
+    monkeypatch.setattr(settings, "TAG_WRITE_QUEUE_WINDOW", 60.0)
+    before = api.get("/metrics/tag-writes").json()
+
+    async_headers = [*headers, ("prefer", "respond-async")]
+    query_counter.clear()
+    responses = [
+        api.put(
+            "/companies/병합쓰기회사/tags",
+            json=[
+                {
+                    "tag_name": {
+                        "ko": f"태그_병합{number}",
+                        "en": f"tag_coalesce{number}",
+                    }
+                }
+            ],
+            headers=async_headers,
+        )
+        for number in (1, 2, 3)
+    ]
+    responses.append(
+        api.request(
+            "DELETE",
+            "/companies/병합쓰기회사/tags",
+            json=["태그_병합0", "tag_coalesce2"],
+            headers=async_headers,
+        )
+    )
+    responses.append(
+        api.delete("/companies/없는회사/tags/태그_병합1", headers=async_headers)
+    )
+    # 접수만 하고 DB에는 접근하지 않습니다.
+    assert query_counter == []
+    assert [resp.status_code for resp in responses] == [202] * 5
+    ack_ids = [resp.json()["ack_id"] for resp in responses]
+    assert responses[0].headers["location"] == f"/tag-writes/{ack_ids[0]}"
+    assert api.get(f"/tag-writes/{ack_ids[0]}").json()["status"] == "pending"
+
+    assert api.portal is not None
+    api.portal.call(tag_write_queue.flush)
+
+    statuses = [api.get(f"/tag-writes/{ack_id}").json() for ack_id in ack_ids]
+    assert [status["status"] for status in statuses] == ["applied"] * 4 + ["failed"]
+    assert statuses[-1]["detail"] == "Company not found"
+    assert api.get("/tag-writes/unknown").status_code == 404
+
+    resp = api.get("/companies/병합쓰기회사", headers=headers)
+    assert resp.json() == {
+        "company_name": "Coalesce Inc",
+        "tags": ["tag_coalesce1", "tag_coalesce3"],
+    }
+
+    after = api.get("/metrics/tag-writes").json()
+    assert after["pending"] == 0
+    assert after["flushes"] == before["flushes"] + 1
+    # 회사별로 한 트랜잭션: 병합쓰기회사(요청 4개), 없는회사(요청 1개)
+    assert after["batches"] == before["batches"] + 2
+    assert after["max_batch_size"] >= 4
+    assert after["applied"] == before["applied"] + 4
+    assert after["failed"] == before["failed"] + 1
+
+    # 헤더가 없으면 기존처럼 바로 적용하고 태그 목록을 반환합니다.
+    resp = api.request(
+        "DELETE",
+        "/companies/병합쓰기회사/tags",
+        json=["tag_coalesce1"],
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"company_name": "Coalesce Inc", "tags": ["tag_coalesce3"]}